@@ -0,0 +1,222 @@
+"""Benchmark the columnar analytics snapshot against ORM reporting.
+
+Fills a throwaway database with --words words, --events answer events
+(activity_logs plus a fifth as many word_review_items) and --mistakes
+wrong_inputs spread over a year. It then times:
+
+- a full snapshot build, and an incremental refresh after 1% more rows
+- computing every report from the snapshot
+- with --legacy, the same per-word accuracy, heatmap and mistake counts
+  done the old way: ORM objects and Python loops
+
+Usage (from the backend directory):
+    PYTHONPATH=. python scripts/bench_analytics.py --events 1000000 --legacy
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BENCH_DIR = Path(tempfile.mkdtemp(prefix="hagxwon-analytics-bench-"))
+os.environ.setdefault("SQLITE_DB_PATH", str(BENCH_DIR / "bench.db"))
+os.environ.setdefault("ANALYTICS_DIR", str(BENCH_DIR / "analytics"))
+
+from sqlalchemy import select  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from src.analytics import AnalyticsStore  # noqa: E402
+from src.analytics.reports import retention_rows  # noqa: E402
+from src.database import engine, async_session_factory  # noqa: E402
+from src.models import ActivityLog, WrongInput  # noqa: E402
+from src.utils.hangul import compose, split_syllable  # noqa: E402
+
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 11172, 53)]
+START = datetime(2025, 1, 1)
+
+
+def typo(korean: str) -> str:
+    """A plausible wrong answer for `korean`"""
+    i = random.randrange(len(korean))
+    initial, medial, final = split_syllable(korean[i])
+    kind = random.random()
+    if kind < 0.3:
+        medial = random.choice("ㅏㅓㅗㅜㅡㅣ")
+    elif kind < 0.55:
+        final = random.choice(["", "ㄱ", "ㄴ", "ㄹ", "ㅁ", "ㅇ"])
+    elif kind < 0.7:
+        initial = random.choice("ㄱㄴㄷㅁㅂㅅㅇㅈ")
+    elif kind < 0.85:
+        return korean[:i] + korean[i + 1 :] or korean + "요"
+    elif kind < 0.95:
+        return korean[:i] + " " + korean[i:]
+    else:
+        return "english"
+    return korean[:i] + compose(initial, medial, final) + korean[i + 1 :]
+
+
+def random_times(count: int):
+    span = 365 * 86400
+    for _ in range(count):
+        yield str(START + timedelta(seconds=random.randrange(span)))
+
+
+async def fill(words: int, events: int, mistakes: int):
+    random.seed(words + events)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    koreans = [
+        "".join(random.choices(SYLLABLES, k=random.randint(2, 4)))
+        + SYLLABLES[i % len(SYLLABLES)]
+        for i in range(words)
+    ]
+    started = time.perf_counter()
+    conn = sqlite3.connect(os.environ["SQLITE_DB_PATH"])
+    with conn:
+        conn.executemany(
+            "INSERT INTO words (id, korean, english, topik_level, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    i + 1,
+                    korean,
+                    f"meaning {i + 1}",
+                    random.randint(1, 6),
+                    START,
+                )
+                for i, korean in enumerate(koreans)
+            ],
+        )
+        conn.execute(
+            "INSERT INTO study_sessions (id, started_at) VALUES (1, ?)",
+            (START,),
+        )
+        append_events(conn, words, events)
+        conn.executemany(
+            "INSERT INTO wrong_inputs (word_id, input_text, timestamp) "
+            "VALUES (?, ?, ?)",
+            (
+                (word_id, typo(koreans[word_id - 1]), when)
+                for word_id, when in zip(
+                    (random.randint(1, words) for _ in range(mistakes)),
+                    random_times(mistakes),
+                )
+            ),
+        )
+    conn.close()
+    print(
+        f"Inserted {words:,} words, {events:,} events and {mistakes:,} "
+        f"mistakes in {time.perf_counter() - started:.1f}s"
+    )
+
+
+def append_events(conn, words: int, events: int):
+    # Easier words are answered correctly more often
+    skill = [random.uniform(0.4, 0.95) for _ in range(words + 1)]
+
+    def rows(count):
+        for when in random_times(count):
+            word_id = random.randint(1, words)
+            yield word_id, random.random() < skill[word_id], when
+
+    conn.executemany(
+        "INSERT INTO activity_logs (session_id, word_id, activity_type, "
+        "correct, score, timestamp) VALUES (1, ?, 'flashcard', ?, 0, ?)",
+        rows(events),
+    )
+    conn.executemany(
+        "INSERT INTO word_review_items (word_id, study_session_id, correct, "
+        "created_at) VALUES (?, 1, ?, ?)",
+        rows(events // 5),
+    )
+
+
+async def legacy_reports():
+    """Per-word accuracy, heatmap and mistakes per word via the ORM"""
+    async with async_session_factory() as db:
+        logs = (await db.execute(select(ActivityLog))).scalars().all()
+        attempts, correct = Counter(), Counter()
+        heatmap = defaultdict(int)
+        for log in logs:
+            attempts[log.word_id] += 1
+            correct[log.word_id] += int(log.correct)
+            heatmap[(log.timestamp.weekday(), log.timestamp.hour)] += 1
+        wrong = (await db.execute(select(WrongInput))).scalars().all()
+        mistakes = Counter(item.word_id for item in wrong)
+        weakest = sorted(attempts, key=lambda w: correct[w] / attempts[w])
+    return len(logs), weakest[:50], mistakes
+
+
+async def main(words, events, mistakes, legacy):
+    print(f"Benchmark database: {os.environ['SQLITE_DB_PATH']}")
+    await fill(words, events, mistakes)
+    store = AnalyticsStore(os.environ["ANALYTICS_DIR"])
+
+    if legacy:
+        started = time.perf_counter()
+        rows, _, _ = await legacy_reports()
+        print(
+            f"\nORM + Python loops ({rows:,} activity rows): "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+
+    started = time.perf_counter()
+    status = store.refresh()["snapshot"]
+    print(f"\nFull snapshot refresh: {time.perf_counter() - started:.2f}s")
+    print(
+        f"  load {status['build_seconds']:.2f}s, "
+        f"reports {status['reports_seconds']:.2f}s, rows {status['rows']}"
+    )
+
+    conn = sqlite3.connect(os.environ["SQLITE_DB_PATH"])
+    with conn:
+        append_events(conn, words, events // 100)
+    conn.close()
+    started = time.perf_counter()
+    status = store.refresh()["snapshot"]
+    print(
+        f"Incremental refresh (+1% events): "
+        f"{time.perf_counter() - started:.2f}s "
+        f"(load {status['build_seconds']:.2f}s, "
+        f"reports {status['reports_seconds']:.2f}s)"
+    )
+
+    fresh = AnalyticsStore(os.environ["ANALYTICS_DIR"])
+    started = time.perf_counter()
+    fresh.load()
+    print(f"Reload from disk: {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    rows = retention_rows(store.reports, "weakest", 50, 3)
+    print(
+        f"Serving /retention (top 50 of {len(store.reports.words.word_id):,}"
+        f" words): {(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+    curve = store.reports.forgetting_curve
+    print(f"\nFitted stability: {curve['stability_days']} days")
+    print(f"Weakest word: {rows[0]}")
+    for kind in store.reports.mistakes["kinds"]:
+        print(f"  {kind['kind']:<10} {kind['mistakes']:>8,} mistakes")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--mistakes", type=int, default=200_000)
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="also time the ORM + Python loop version",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.words, args.events, args.mistakes, args.legacy))
@@ -0,0 +1,145 @@
+"""Benchmark the dashboard chart queries: per-day COUNT loop vs GROUP BY.
+
+Builds a throwaway SQLite database with synthetic activity_logs rows and
+reports query count and latency for the old per-day loop and the bucketed
+aggregate used by the dashboard routes.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python scripts/bench_dashboard.py --rows 10000 100000 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(tempfile.mkdtemp(prefix="hagxwon-bench-"))
+os.environ.setdefault("SQLITE_DB_PATH", str(BENCH_DIR / "bench.db"))
+
+from sqlalchemy import event, func, select  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from src.database import engine, async_session_factory  # noqa: E402
+from src.db.aggregates import count_by_day  # noqa: E402
+from src.models import ActivityLog, StudySession, Word  # noqa: E402
+
+BATCH_SIZE = 10_000
+HISTORY_DAYS = 90
+ACTIVITY_TYPES = ["flashcard", "sentence_practice", "game_muncher"]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+async def legacy_recent_activity(db):
+    """The original /recent-activity implementation (one query per day)"""
+    today = datetime.now(timezone.utc).date()
+    activity_counts = {}
+    for i in range(7):
+        current_date = today - timedelta(days=i)
+        start_of_day = datetime(
+            current_date.year, current_date.month, current_date.day
+        )
+        end_of_day = start_of_day + timedelta(days=1)
+        res = await db.execute(
+            select(func.count(ActivityLog.id))
+            .filter(ActivityLog.timestamp >= start_of_day)
+            .filter(ActivityLog.timestamp < end_of_day)
+        )
+        activity_counts[current_date.isoformat()] = res.scalar()
+    return activity_counts
+
+
+async def grouped_recent_activity(db):
+    return await count_by_day(db, ActivityLog.timestamp, days=7)
+
+
+async def populate(total_rows: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with async_session_factory() as db:
+        db.add(Word(korean="벤치", english="bench"))
+        db.add(StudySession())
+        await db.commit()
+
+    now = datetime.utcnow()
+    inserted = 0
+    async with engine.begin() as conn:
+        while inserted < total_rows:
+            size = min(BATCH_SIZE, total_rows - inserted)
+            rows = [
+                {
+                    "session_id": 1,
+                    "word_id": 1,
+                    "activity_type": random.choice(ACTIVITY_TYPES),
+                    "correct": random.random() < 0.7,
+                    "score": random.randint(0, 10),
+                    "timestamp": now
+                    - timedelta(
+                        seconds=random.randint(0, HISTORY_DAYS * 86400)
+                    ),
+                }
+                for _ in range(size)
+            ]
+            await conn.execute(ActivityLog.__table__.insert(), rows)
+            inserted += size
+
+
+async def measure(label, fn, repeats):
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    try:
+        async with async_session_factory() as db:
+            result = await fn(db)  # warm-up, also used for the sanity check
+            counter.count = 0
+            start = time.perf_counter()
+            for _ in range(repeats):
+                await fn(db)
+            elapsed = (time.perf_counter() - start) / repeats
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+    queries = counter.count // repeats
+    print(f"  {label:<10} {queries:>3} queries  {elapsed * 1000:8.2f} ms")
+    return result
+
+
+async def main(row_counts, repeats):
+    print(f"Benchmark database: {os.environ['SQLITE_DB_PATH']}")
+    for total_rows in row_counts:
+        print(f"\nactivity_logs rows: {total_rows:,}")
+        start = time.perf_counter()
+        await populate(total_rows)
+        print(f"  populated in {time.perf_counter() - start:.1f}s")
+
+        legacy = await measure("per-day", legacy_recent_activity, repeats)
+        grouped = await measure("group-by", grouped_recent_activity, repeats)
+        if legacy != grouped:
+            print("  WARNING: results differ between implementations")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="activity_logs sizes to benchmark",
+    )
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeats))
@@ -0,0 +1,99 @@
+"""Benchmark mistake logging: one POST per typo vs POST /mistakes/batch.
+
+Runs the API in-process against a throwaway SQLite database seeded with
+synthetic words and stats, then logs the same burst of mistakes both ways.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python scripts/bench_mistakes.py --mistakes 1000 --words 2000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(tempfile.mkdtemp(prefix="hagxwon-bench-"))
+os.environ.setdefault("SQLITE_DB_PATH", str(BENCH_DIR / "bench.db"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from src.database import engine  # noqa: E402
+from src.main import app  # noqa: E402
+from src.models import Word, WordStats  # noqa: E402
+
+
+async def populate(word_count: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(
+            Word.__table__.insert(),
+            [
+                {"korean": f"단어{i}", "english": f"word {i}"}
+                for i in range(word_count)
+            ],
+        )
+        await conn.execute(
+            WordStats.__table__.insert(),
+            [
+                {"word_id": i, "ease_factor": 2.5, "interval_days": 16}
+                for i in range(1, word_count + 1)
+            ],
+        )
+
+
+def main(mistake_count: int, word_count: int):
+    asyncio.run(populate(word_count))
+    mistakes = [
+        {"word_id": random.randint(1, word_count), "input_text": "오타"}
+        for _ in range(mistake_count)
+    ]
+
+    statements = 0
+
+    def count_statement(*args, **kwargs):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    # No context manager: skip the startup hook (schema + seed check)
+    client = TestClient(app)
+
+    statements = 0
+    start = time.perf_counter()
+    for mistake in mistakes:
+        assert client.post("/api/mistakes", json=mistake).status_code == 201
+    single = time.perf_counter() - start
+    single_statements = statements
+
+    statements = 0
+    start = time.perf_counter()
+    response = client.post("/api/mistakes/batch", json=mistakes)
+    batch = time.perf_counter() - start
+    assert response.status_code == 201, response.text
+
+    print(f"{mistake_count} mistakes over {word_count} words")
+    print(
+        f"{'mode':<10}{'requests':>10}{'SQL':>8}{'total s':>10}{'rows/s':>10}"
+    )
+    print(
+        f"{'single':<10}{mistake_count:>10}{single_statements:>8}"
+        f"{single:>10.3f}{mistake_count / single:>10.0f}"
+    )
+    print(
+        f"{'batch':<10}{1:>10}{statements:>8}"
+        f"{batch:>10.3f}{mistake_count / batch:>10.0f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mistakes", type=int, default=1000)
+    parser.add_argument("--words", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.mistakes, args.words)
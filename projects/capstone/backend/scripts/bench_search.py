@@ -0,0 +1,191 @@
+"""Benchmark /api/search lookups against a synthetic vocabulary.
+
+Fills a throwaway SQLite database with --words words (one sample sentence
+each, indexed by the FTS5 triggers) and times search_words and
+search_sentences for a mix of queries: Korean and English substrings,
+multi-term queries, TOPIK/part-of-speech filters and short (< 3 char)
+queries that take the LIKE fallback. A plain LIKE scan over the words
+table is timed alongside as the baseline. Autocomplete is timed for
+every keystroke of a word as an IME shows it (ㅎ, 하, 한, 한ㄱ, 한구, 한국)
+and for chosung-only prefixes.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python scripts/bench_search.py --words 100000 --runs 50
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(tempfile.mkdtemp(prefix="hagxwon-search-bench-"))
+os.environ.setdefault("SQLITE_DB_PATH", str(BENCH_DIR / "bench.db"))
+
+from sqlalchemy import insert, text  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from src.database import engine, async_session_factory  # noqa: E402
+from src.db.search import (  # noqa: E402
+    autocomplete_words,
+    search_sentences,
+    search_words,
+)
+from src.models import SampleSentence, Word  # noqa: E402
+from src.utils.hangul import chosung, compose, split_syllable  # noqa: E402
+
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 11172, 37)]
+ENGLISH = (
+    "school house water river mountain study teacher friend family food "
+    "weather music market hospital station library travel morning night "
+    "language computer garden window summer winter"
+).split()
+POS = ["noun", "verb", "adjective", "adverb"]
+BATCH = 5000
+
+
+async def fill(total_words: int):
+    random.seed(total_words)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    words, sentences = [], []
+    for word_id in range(1, total_words + 1):
+        korean = "".join(random.choices(SYLLABLES, k=random.randint(2, 4)))
+        english = " ".join(random.sample(ENGLISH, 2)) + f" {word_id}"
+        words.append(
+            {
+                "id": word_id,
+                "korean": korean,
+                "english": english,
+                "romanization": f"rom{word_id}",
+                "part_of_speech": random.choice(POS),
+                "topik_level": random.randint(1, 6),
+                "source_type": "bench",
+            }
+        )
+        sentences.append(
+            {
+                "word_id": word_id,
+                "sentence_korean": f"저는 {korean}을 좋아해요.",
+                "sentence_english": f"I like the {english}.",
+            }
+        )
+
+    started = time.perf_counter()
+    async with async_session_factory() as db:
+        for start in range(0, total_words, BATCH):
+            await db.execute(insert(Word), words[start : start + BATCH])
+            await db.execute(
+                insert(SampleSentence), sentences[start : start + BATCH]
+            )
+        await db.commit()
+    elapsed = time.perf_counter() - started
+    print(
+        f"Inserted {total_words:,} words + sentences with FTS triggers "
+        f"in {elapsed:.2f}s"
+    )
+    return words
+
+
+def keystrokes(korean: str):
+    """What the input box shows after each key while typing `korean`"""
+    typed = ""
+    for syllable in korean:
+        initial, medial, final = split_syllable(syllable)
+        yield typed + initial
+        yield typed + compose(initial, medial)
+        if final:
+            yield typed + syllable
+        typed += syllable
+
+
+async def like_scan(db, q: str):
+    pattern = f"%{q}%"
+    result = await db.execute(
+        text(
+            "SELECT id FROM words WHERE korean LIKE :p OR english LIKE :p "
+            "OR romanization LIKE :p LIMIT 20"
+        ),
+        {"p": pattern},
+    )
+    return result.all()
+
+
+async def timed(label: str, fn, runs: int):
+    samples = []
+    async with async_session_factory() as db:
+        hits = await fn(db)  # warm the page cache
+        for _ in range(runs):
+            started = time.perf_counter()
+            await fn(db)
+            samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"  {label:<34} {len(hits):>3} hits  "
+        f"p50 {statistics.median(samples):7.2f} ms  p95 {p95:7.2f} ms"
+    )
+
+
+async def main(total_words: int, runs: int):
+    print(f"Benchmark database: {os.environ['SQLITE_DB_PATH']}")
+    words = await fill(total_words)
+    sample = random.choice(words)
+    korean3 = sample["korean"][:3] if len(sample["korean"]) >= 3 else None
+    queries = [
+        ("english word", "library", {}),
+        ("english substring", "ospit", {}),
+        ("two terms", "school water", {}),
+        ("romanization", f"rom{sample['id']}", {}),
+        ("english + topik/pos filter", "music", {"topik_level": 3}),
+        ("english + pos filter", "garden", {"pos": "verb"}),
+        ("short query (LIKE fallback)", sample["korean"][:2], {}),
+        ("no match", "zzzqqq", {}),
+    ]
+    if korean3:
+        queries.insert(0, ("korean substring", korean3, {}))
+
+    print(f"\nsearch_words ({runs} runs each)")
+    for label, q, filters in queries:
+        await timed(
+            f"{label} [{q}]",
+            lambda db, q=q, f=filters: search_words(db, q, **f),
+            runs,
+        )
+    print(f"\nsearch_sentences ({runs} runs each)")
+    for label, q, filters in queries[:3]:
+        await timed(
+            f"{label} [{q}]",
+            lambda db, q=q, f=filters: search_sentences(db, q, **f),
+            runs,
+        )
+    print(f"\nbaseline LIKE scan over words ({runs} runs each)")
+    for label, q, _ in queries[:3]:
+        await timed(f"{label} [{q}]", lambda db, q=q: like_scan(db, q), runs)
+
+    print(f"\nautocomplete_words ({runs} runs each)")
+    target = max(words, key=lambda word: len(word["korean"]))["korean"]
+    prefixes = list(keystrokes(target)) + [
+        chosung(target)[:1],
+        chosung(target)[:2],
+    ]
+    for prefix in prefixes:
+        await timed(
+            f"prefix [{prefix}]",
+            lambda db, p=prefix: autocomplete_words(db, p),
+            runs,
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.words, args.runs))
@@ -0,0 +1,219 @@
+"""Benchmark the seed pipeline: rows/sec for a fresh seed and a rerun.
+
+Builds a throwaway SQLite database per dataset. The 2000-word dataset is
+read from SEED_DATA_DIR when the processed files exist and generated
+otherwise; larger sizes are always synthetic. Each size is seeded once
+from scratch and then again to show the cost of an idempotent rerun.
+With --legacy the old per-row ORM loaders are timed for comparison.
+
+Usage (from the backend directory):
+    PYTHONPATH=. python scripts/bench_seed.py --words 2000 100000 --workers 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(tempfile.mkdtemp(prefix="hagxwon-seed-bench-"))
+os.environ.setdefault("SQLITE_DB_PATH", str(BENCH_DIR / "bench.db"))
+
+from sqlalchemy import func, select  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from src.config import SEED_DATA_DIR  # noqa: E402
+from src.database import engine, async_session_factory  # noqa: E402
+from src.db.seed.pipeline import SeedFiles, run_seed  # noqa: E402
+from src.models import SampleSentence, Word, WordGroup  # noqa: E402
+from src.models import word_group_map  # noqa: E402
+
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 2000, 7)]
+GROUP_SIZE = 50
+
+
+def synthetic_files(total_words: int, target: Path) -> SeedFiles:
+    """Write seed files shaped like the processed 2000-word dataset"""
+    random.seed(total_words)
+    target.mkdir(parents=True, exist_ok=True)
+    words, sentences = [], []
+    for word_id in range(1, total_words + 1):
+        korean = "".join(random.choices(SYLLABLES, k=3)) + str(word_id)
+        words.append(
+            {
+                "id": word_id,
+                "word": korean,
+                "romanization": f"rom{word_id}",
+                "pos": random.choice(["noun", "verb", "adjective"]),
+                "meaning": f"meaning {word_id}",
+            }
+        )
+        sentences.append(
+            {
+                "word_id": word_id,
+                "example_kr": f"{korean} 문장입니다.",
+                "example_en": f"This is sentence {word_id}.",
+            }
+        )
+    groups = {}
+    for start in range(0, total_words, GROUP_SIZE):
+        members = words[start : start + GROUP_SIZE]
+        groups[f"Group {start // GROUP_SIZE + 1}"] = {
+            "description": "synthetic",
+            "source_type": "bench",
+            "words": [
+                {
+                    "hangul": word["word"],
+                    "english": word["meaning"],
+                    "romanization": word["romanization"],
+                }
+                for word in members
+            ],
+        }
+
+    files = SeedFiles.in_dir(str(target))
+    for path, payload in (
+        (files.words, words),
+        (files.sentences, sentences),
+        (files.groups, {"groups": groups}),
+    ):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+    return files
+
+
+async def legacy_seed(files: SeedFiles):
+    """The original loaders: ORM objects, one flush per group"""
+    async with async_session_factory() as db:
+        with open(files.words, encoding="utf-8") as f:
+            for item in json.load(f):
+                db.add(
+                    Word(
+                        korean=item.get("korean") or item.get("word"),
+                        english=item.get("english") or item.get("meaning"),
+                        romanization=item.get("romanization"),
+                        source_type="initial_seed",
+                    )
+                )
+        await db.commit()
+        with open(files.sentences, encoding="utf-8") as f:
+            for item in json.load(f):
+                db.add(
+                    SampleSentence(
+                        word_id=item["word_id"],
+                        sentence_korean=item["example_kr"],
+                        sentence_english=item["example_en"],
+                    )
+                )
+        await db.commit()
+        with open(files.groups, encoding="utf-8") as f:
+            groups = json.load(f)["groups"]
+        result = await db.execute(select(Word))
+        lookup = {word.korean: word for word in result.scalars()}
+        for name, info in groups.items():
+            group = WordGroup(name=name, description=info.get("description"))
+            db.add(group)
+            await db.flush()
+            values = [
+                {"word_id": lookup[word["hangul"]].id, "group_id": group.id}
+                for word in info["words"]
+                if word["hangul"] in lookup
+            ]
+            if values:
+                await db.execute(word_group_map.insert(), values)
+        await db.commit()
+
+
+async def reset_schema():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+
+async def count_rows() -> int:
+    async with async_session_factory() as db:
+        counts = await db.execute(
+            select(
+                select(func.count(Word.id)).scalar_subquery(),
+                select(func.count(SampleSentence.id)).scalar_subquery(),
+                select(func.count(WordGroup.id)).scalar_subquery(),
+                select(func.count())
+                .select_from(word_group_map)
+                .scalar_subquery(),
+            )
+        )
+        return sum(counts.one())
+
+
+async def timed_pipeline(label: str, files: SeedFiles, workers: int):
+    async with async_session_factory() as db:
+        start = time.perf_counter()
+        result = await run_seed(db, files, workers=workers)
+        elapsed = time.perf_counter() - start
+    phases = "  ".join(
+        f"{phase}={seconds * 1000:.0f}ms"
+        for phase, seconds in result.timings.items()
+    )
+    print(
+        f"  {label:<14} {result.rows:>8,} rows  {elapsed:7.2f}s  "
+        f"{result.rows / elapsed:>10,.0f} rows/s  ({phases})"
+    )
+
+
+async def main(sizes, workers, legacy):
+    print(f"Benchmark database: {os.environ['SQLITE_DB_PATH']}")
+    for total_words in sizes:
+        real = SeedFiles.in_dir(SEED_DATA_DIR)
+        if total_words == 2000 and Path(real.words).exists():
+            files, source = real, SEED_DATA_DIR
+        else:
+            files = synthetic_files(total_words, BENCH_DIR / str(total_words))
+            source = "synthetic"
+        print(f"\n{total_words:,} words ({source})")
+
+        if legacy:
+            await reset_schema()
+            start = time.perf_counter()
+            await legacy_seed(files)
+            elapsed = time.perf_counter() - start
+            rows = await count_rows()
+            print(
+                f"  {'legacy ORM':<14} {rows:>8,} rows  {elapsed:7.2f}s  "
+                f"{rows / elapsed:>10,.0f} rows/s"
+            )
+
+        await reset_schema()
+        await timed_pipeline("pipeline", files, workers)
+        before = await count_rows()
+        await timed_pipeline("rerun", files, workers)
+        if await count_rows() != before:
+            print("  WARNING: rerun changed the row count")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--words",
+        type=int,
+        nargs="+",
+        default=[2000, 100_000],
+        help="dataset sizes (words) to benchmark",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="processes used to parse the seed files (0 = inline)",
+    )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="also time the original per-row ORM loaders",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.words, args.workers, args.legacy))
@@ -0,0 +1,50 @@
+"""Bulk import words (with sample sentences and groups) from a file.
+
+Accepts the same JSON array / NDJSON format as POST /api/words/bulk:
+
+    {"korean": "사과", "english": "apple", "topik_level": 1,
+     "sample_sentences": [{"sentence_korean": "...", "sentence_english": "..."}],
+     "groups": ["Food"]}
+
+Usage (from the backend directory):
+    PYTHONPATH=. python scripts/import_words.py words.ndjson --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.database import async_session_factory
+from src.db.bulk_import import DEFAULT_BATCH_SIZE, import_words, parse_payload
+
+
+async def run(path: str, batch_size: int, added_by: str | None):
+    with open(path, "r", encoding="utf-8") as f:
+        rows = list(parse_payload(f.read()))
+
+    start = time.perf_counter()
+    async with async_session_factory() as db:
+        result = await import_words(
+            db, rows, batch_size=batch_size, added_by=added_by
+        )
+        await db.commit()
+    duration = time.perf_counter() - start
+
+    print(
+        f"✅ Imported {result.inserted} words, {result.sentences} sentences, "
+        f"{result.group_links} group links ({result.groups_created} new "
+        f"groups) in {duration:.2f}s"
+    )
+    if result.conflicts:
+        print(f"⚠️ {len(result.conflicts)} rows skipped:")
+        for conflict in result.conflicts:
+            print(f"  #{conflict.index} {conflict.korean}: {conflict.reason}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="JSON array or NDJSON file")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--added-by", default=None, help="added_by_agent")
+    args = parser.parse_args()
+    asyncio.run(run(args.path, args.batch_size, args.added_by))
@@ -0,0 +1,114 @@
+"""Columnar analytics over learner history.
+
+A snapshot of activity_logs, word_review_items and wrong_inputs is kept
+as NumPy arrays (persisted to ANALYTICS_DIR as .npz) and refreshed by an
+"analytics" job every ANALYTICS_REFRESH_SECONDS. Reports are computed
+once per refresh and served from memory by /api/analytics/*.
+
+NumPy is optional: without it ANALYTICS_ENABLED is False and the
+endpoints answer 503.
+"""
+
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..config import ANALYTICS_DIR, ANALYTICS_REFRESH_SECONDS
+from ..database import engine
+from ..jobs import JobContext, job_queue
+
+try:
+    import numpy  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the environment
+    ANALYTICS_ENABLED = False
+else:
+    ANALYTICS_ENABLED = True
+    from .reports import Reports, build_reports
+    from .snapshot import Snapshot, build_snapshot, load_snapshot
+    from .snapshot import save_snapshot
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "learner_history.npz"
+
+
+class AnalyticsStore:
+    """The current snapshot and the reports computed from it"""
+
+    def __init__(self, directory: str = ANALYTICS_DIR):
+        self.path = Path(directory) / SNAPSHOT_FILE
+        self.snapshot: Optional["Snapshot"] = None
+        self.reports: Optional["Reports"] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """Load the persisted snapshot, if any (blocking)"""
+        snapshot = load_snapshot(self.path)
+        if snapshot is None:
+            return False
+        reports = build_reports(snapshot)
+        with self._lock:
+            self.snapshot, self.reports = snapshot, reports
+        logger.info(
+            f"Loaded analytics snapshot from {snapshot.created_at} "
+            f"({sum(snapshot.rows.values())} rows)"
+        )
+        return True
+
+    def refresh(
+        self, progress: Optional[Callable[[float, str], None]] = None
+    ) -> dict:
+        """Update the snapshot, recompute reports and persist (blocking)"""
+        report = progress or (lambda fraction, message: None)
+        snapshot = build_snapshot(
+            engine.url.database,
+            previous=self.snapshot,
+            progress=lambda fraction, message: report(fraction * 0.6, message),
+        )
+        report(0.6, "Computing reports")
+        reports = build_reports(snapshot)
+        report(0.9, "Saving snapshot")
+        save_snapshot(snapshot, self.path)
+        with self._lock:
+            self.snapshot, self.reports = snapshot, reports
+        return self.status()
+
+    def status(self) -> dict:
+        snapshot, reports = self.snapshot, self.reports
+        if snapshot is None or reports is None:
+            return {"enabled": ANALYTICS_ENABLED, "snapshot": None}
+        return {
+            "enabled": ANALYTICS_ENABLED,
+            "snapshot": {
+                "created_at": snapshot.created_at,
+                "rows": snapshot.rows,
+                "build_seconds": round(snapshot.build_seconds, 4),
+                "reports_seconds": round(reports.compute_seconds, 4),
+            },
+        }
+
+
+analytics_store = AnalyticsStore()
+
+
+@job_queue.register("analytics")
+async def analytics_job(ctx: JobContext, params: dict) -> dict:
+    """Refresh the analytics snapshot and reports"""
+    if not ANALYTICS_ENABLED:
+        raise RuntimeError("numpy is not installed")
+    return await ctx.run_blocking(analytics_store.refresh, ctx.progress)
+
+
+async def refresh_periodically(
+    interval: float = ANALYTICS_REFRESH_SECONDS,
+) -> None:
+    """Load the saved snapshot, then queue a refresh every `interval`"""
+    if not ANALYTICS_ENABLED or interval <= 0:
+        return
+    await job_queue.run_blocking(analytics_store.load)
+    while True:
+        job = job_queue.submit("analytics")
+        await job_queue.wait(job.id)
+        await asyncio.sleep(interval)
@@ -0,0 +1,379 @@
+"""Vectorized reports over an analytics Snapshot.
+
+Everything is computed with whole-array NumPy operations (one sort,
+bincounts, searchsorted) keyed by word id. Wrong inputs arrive already
+classified by the snapshot, so there are no per-row Python loops.
+"""
+
+import calendar
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.hangul import TYPO_KINDS
+from .snapshot import Snapshot
+
+DAY = 86400
+# Gap since the previous answer for the same word, bucketed
+GAP_EDGES = np.array([0, 3600, 6 * 3600, DAY, 3 * DAY, 7 * DAY, 30 * DAY])
+GAP_LABELS = ["<1h", "1-6h", "6-24h", "1-3d", "3-7d", "7-30d", ">30d"]
+MASTERY_MIN_ATTEMPTS = 3
+MASTERY_ACCURACY = 0.8
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+# Epoch seconds fit in 34 bits until the year 2514
+TS_BITS = 34
+
+
+@dataclass
+class WordTable:
+    """Per-word metrics, one entry per word id with any answers"""
+
+    word_id: np.ndarray
+    attempts: np.ndarray
+    correct: np.ndarray
+    accuracy: np.ndarray
+    # Accuracy on answers given at least a day after the previous one
+    delayed_attempts: np.ndarray
+    delayed_accuracy: np.ndarray
+    last_seen: np.ndarray
+    mistakes: np.ndarray
+    predicted_recall: np.ndarray
+
+
+@dataclass
+class Reports:
+    generated_at: datetime
+    compute_seconds: float
+    words: WordTable
+    forgetting_curve: dict
+    heatmap: dict
+    mistakes: dict
+    topik_mastery: List[dict]
+    # word id -> text, for labelling rows
+    korean: Dict[int, str] = field(default_factory=dict)
+    english: Dict[int, str] = field(default_factory=dict)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def sort_by_word(events: np.ndarray) -> np.ndarray:
+    """Events ordered by (word_id, ts).
+
+    Both keys are packed into one int64 so a single argsort does it,
+    several times faster than np.lexsort on the two columns.
+    """
+    key = (events["word_id"].astype("i8") << TS_BITS) | events["ts"]
+    return events[np.argsort(key)]
+
+
+def _gaps(events: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Seconds since the previous answer to the same word, and a mask of
+    the events that have one (every answer but a word's first).
+
+    `events` must be sorted with sort_by_word.
+    """
+    same_word = np.zeros(len(events), dtype=bool)
+    same_word[1:] = events["word_id"][1:] == events["word_id"][:-1]
+    gaps = np.zeros(len(events), dtype="i8")
+    gaps[1:] = events["ts"][1:] - events["ts"][:-1]
+    return gaps, same_word
+
+
+def forgetting_curve(events: np.ndarray) -> dict:
+    """Accuracy by gap since the last answer, with R(t) = exp(-t / S) fitted
+
+    S (stability, in days) comes from a weighted least-squares fit of
+    -ln(accuracy) against the mean gap of each bucket. `events` must be
+    sorted with sort_by_word.
+    """
+    gaps, has_gap = _gaps(events)
+    gaps, correct = gaps[has_gap], events["correct"][has_gap]
+    bucket = np.searchsorted(GAP_EDGES, gaps, side="right") - 1
+    size = len(GAP_EDGES)
+    attempts = np.bincount(bucket, minlength=size)
+    right = np.bincount(bucket, weights=correct, minlength=size)
+    mean_gap = _ratio(
+        np.bincount(bucket, weights=gaps, minlength=size), attempts
+    )
+    accuracy = _ratio(right, attempts)
+
+    usable = (attempts > 0) & (accuracy > 0) & (accuracy < 1) & (mean_gap > 0)
+    x = mean_gap[usable] / DAY
+    y = -np.log(accuracy[usable])
+    w = attempts[usable]
+    denominator = float(np.sum(w * x * y))
+    stability = float(np.sum(w * x * x) / denominator) if denominator else None
+
+    return {
+        "stability_days": stability,
+        "buckets": [
+            {
+                "gap": label,
+                "attempts": int(attempts[i]),
+                "accuracy": _number(accuracy[i]),
+                "mean_gap_hours": _number(mean_gap[i] / 3600),
+            }
+            for i, label in enumerate(GAP_LABELS)
+        ],
+    }
+
+
+def word_table(
+    events: np.ndarray,
+    mistakes: np.ndarray,
+    now: int,
+    stability_days: Optional[float],
+) -> WordTable:
+    """Per-word metrics; `events` must be sorted with sort_by_word"""
+    gaps, has_gap = _gaps(events)
+    word, correct = events["word_id"], events["correct"]
+    size = int(max(word.max(initial=0), mistakes["word_id"].max(initial=0)))
+    size += 1
+
+    attempts = np.bincount(word, minlength=size)
+    right = np.bincount(word, weights=correct, minlength=size)
+    delayed = has_gap & (gaps >= DAY)
+    delayed_attempts = np.bincount(word[delayed], minlength=size)
+    delayed_right = np.bincount(
+        word[delayed], weights=correct[delayed], minlength=size
+    )
+    last_seen = np.zeros(size, dtype="i8")
+    # Events are sorted by (word, ts): the last row of each word wins
+    last_seen[word] = events["ts"]
+    mistake_counts = np.bincount(mistakes["word_id"], minlength=size)
+
+    ids = np.flatnonzero((attempts > 0) | (mistake_counts > 0))
+    if stability_days:
+        days_since = np.maximum(now - last_seen[ids], 0) / DAY
+        predicted = np.where(
+            attempts[ids] > 0, np.exp(-days_since / stability_days), np.nan
+        )
+    else:
+        predicted = np.full(len(ids), np.nan)
+    return WordTable(
+        word_id=ids,
+        attempts=attempts[ids],
+        correct=right[ids].astype("i8"),
+        accuracy=_ratio(right[ids], attempts[ids]),
+        delayed_attempts=delayed_attempts[ids],
+        delayed_accuracy=_ratio(delayed_right[ids], delayed_attempts[ids]),
+        last_seen=last_seen[ids],
+        mistakes=mistake_counts[ids],
+        predicted_recall=predicted,
+    )
+
+
+def heatmap(events: np.ndarray, tz_offset_minutes: int = 0) -> dict:
+    """Answers and accuracy by weekday x hour (Monday first)"""
+    local = events["ts"] + tz_offset_minutes * 60
+    # 1970-01-01 was a Thursday, +3 makes Monday day 0
+    weekday = (local // DAY + 3) % 7
+    hour = (local % DAY) // 3600
+    cell = weekday * 24 + hour
+    attempts = np.bincount(cell, minlength=7 * 24)
+    right = np.bincount(cell, weights=events["correct"], minlength=7 * 24)
+    accuracy = _ratio(right, attempts).reshape(7, 24)
+    return {
+        "tz_offset_minutes": tz_offset_minutes,
+        "weekdays": WEEKDAYS,
+        "attempts": attempts.reshape(7, 24).tolist(),
+        "accuracy": [[_number(value) for value in row] for row in accuracy],
+    }
+
+
+def mistake_clusters(snapshot: Snapshot, top: int = 20) -> dict:
+    """Group wrong inputs by kind of error (see hangul.typo_kind)"""
+    mistakes = snapshot.mistakes
+    if not len(mistakes):
+        return {"total": 0, "kinds": [], "top_confusions": []}
+    texts = snapshot.mistake_texts
+    korean = dict(zip(snapshot.words.id.tolist(), snapshot.words.korean))
+    word, kind = mistakes["word_id"].astype("i8"), mistakes["kind"]
+
+    per_kind = np.bincount(kind, minlength=len(TYPO_KINDS))
+    # Mistakes per (word, kind), one column per kind
+    by_word = np.bincount(
+        word * len(TYPO_KINDS) + kind,
+        minlength=(word.max() + 1) * len(TYPO_KINDS),
+    ).reshape(-1, len(TYPO_KINDS))
+
+    clusters = []
+    for i in np.argsort(-per_kind, kind="stable"):
+        if not per_kind[i]:
+            break
+        column = by_word[:, i]
+        words = np.argsort(-column, kind="stable")[:5]
+        clusters.append(
+            {
+                "kind": TYPO_KINDS[i],
+                "mistakes": int(per_kind[i]),
+                "share": float(per_kind[i] / len(mistakes)),
+                "top_words": [
+                    {
+                        "word_id": int(w),
+                        "korean": korean.get(int(w)),
+                        "mistakes": int(column[w]),
+                    }
+                    for w in words
+                    if column[w]
+                ],
+            }
+        )
+
+    keys = word * len(texts) + mistakes["text"]
+    pairs, first, counts = np.unique(
+        keys, return_index=True, return_counts=True
+    )
+    confusions = []
+    for i in np.argsort(-counts, kind="stable")[:top]:
+        word_id, text = divmod(int(pairs[i]), len(texts))
+        confusions.append(
+            {
+                "word_id": word_id,
+                "korean": korean.get(word_id),
+                "typed": str(texts[text]),
+                "kind": TYPO_KINDS[kind[first[i]]],
+                "count": int(counts[i]),
+            }
+        )
+    return {
+        "total": int(len(mistakes)),
+        "kinds": clusters,
+        "top_confusions": confusions,
+    }
+
+
+def topik_mastery(snapshot: Snapshot, words: WordTable) -> List[dict]:
+    """Per TOPIK level: words, words practised, words mastered.
+
+    A word is mastered after MASTERY_MIN_ATTEMPTS answers at
+    MASTERY_ACCURACY or better overall, and on delayed answers if any.
+    """
+    levels = snapshot.words.topik_level.astype("i8")
+    size = int(
+        max(snapshot.words.id.max(initial=0), words.word_id.max(initial=0))
+    )
+    level_of = np.zeros(size + 1, dtype="i8")
+    level_of[snapshot.words.id] = levels
+
+    practised = words.attempts > 0
+    mastered = (
+        (words.attempts >= MASTERY_MIN_ATTEMPTS)
+        & (np.nan_to_num(words.accuracy) >= MASTERY_ACCURACY)
+        & (
+            (words.delayed_attempts == 0)
+            | (np.nan_to_num(words.delayed_accuracy) >= MASTERY_ACCURACY)
+        )
+    )
+    word_levels = level_of[words.word_id]
+    total = np.bincount(levels, minlength=7)
+    seen = np.bincount(word_levels[practised], minlength=7)
+    done = np.bincount(word_levels[mastered], minlength=7)
+    accuracy_sum = np.bincount(
+        word_levels[practised],
+        weights=words.accuracy[practised],
+        minlength=7,
+    )
+    mean_accuracy = _ratio(accuracy_sum, seen)
+    return [
+        {
+            "topik_level": level or None,
+            "words": int(total[level]),
+            "practised": int(seen[level]),
+            "mastered": int(done[level]),
+            "mastery_rate": (
+                float(done[level] / total[level]) if total[level] else None
+            ),
+            "mean_accuracy": _number(mean_accuracy[level]),
+        }
+        for level in range(7)
+        if total[level] or seen[level]
+    ]
+
+
+def build_reports(snapshot: Snapshot) -> Reports:
+    started = time.perf_counter()
+    events = sort_by_word(snapshot.all_events())
+    # created_at is naive UTC; .timestamp() would read it as local time
+    now = calendar.timegm(snapshot.created_at.utctimetuple())
+    curve = forgetting_curve(events)
+    words = word_table(events, snapshot.mistakes, now, curve["stability_days"])
+    reports = Reports(
+        generated_at=datetime.utcnow(),
+        compute_seconds=0.0,
+        words=words,
+        forgetting_curve=curve,
+        heatmap=heatmap(events),
+        mistakes=mistake_clusters(snapshot),
+        topik_mastery=topik_mastery(snapshot, words),
+        korean=dict(zip(snapshot.words.id.tolist(), snapshot.words.korean)),
+        english=dict(zip(snapshot.words.id.tolist(), snapshot.words.english)),
+    )
+    reports.compute_seconds = time.perf_counter() - started
+    return reports
+
+
+def retention_rows(
+    reports: Reports,
+    order: str = "weakest",
+    limit: int = 50,
+    min_attempts: int = 1,
+) -> List[dict]:
+    """Rows of the per-word table, ordered for display"""
+    table = reports.words
+    candidates = np.flatnonzero(table.attempts >= min_attempts)
+    if order == "weakest":
+        key = np.nan_to_num(table.accuracy[candidates], nan=1.0)
+        picked = candidates[np.argsort(key, kind="stable")]
+    elif order == "strongest":
+        key = np.nan_to_num(table.accuracy[candidates], nan=0.0)
+        picked = candidates[np.argsort(-key, kind="stable")]
+    elif order == "forgetting":
+        # Lowest predicted recall right now: review these first
+        key = np.nan_to_num(table.predicted_recall[candidates], nan=1.0)
+        picked = candidates[np.argsort(key, kind="stable")]
+    else:  # "mistakes"
+        picked = candidates[
+            np.argsort(-table.mistakes[candidates], kind="stable")
+        ]
+
+    rows = []
+    for i in picked[:limit]:
+        word_id = int(table.word_id[i])
+        rows.append(
+            {
+                "word_id": word_id,
+                "korean": _text(reports.korean.get(word_id)),
+                "english": _text(reports.english.get(word_id)),
+                "attempts": int(table.attempts[i]),
+                "correct": int(table.correct[i]),
+                "accuracy": _number(table.accuracy[i]),
+                "delayed_attempts": int(table.delayed_attempts[i]),
+                "delayed_accuracy": _number(table.delayed_accuracy[i]),
+                "last_seen": (
+                    datetime.utcfromtimestamp(
+                        int(table.last_seen[i])
+                    ).isoformat()
+                    if table.attempts[i]
+                    else None
+                ),
+                "mistakes": int(table.mistakes[i]),
+                "predicted_recall": _number(table.predicted_recall[i]),
+            }
+        )
+    return rows
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _number(value) -> Optional[float]:
+    """JSON-friendly float: NaN becomes None"""
+    return None if np.isnan(value) else round(float(value), 4)
@@ -0,0 +1,292 @@
+"""Columnar snapshot of learner history.
+
+Answer events (activity_logs and word_review_items), wrong_inputs and
+the word list are copied out of SQLite into NumPy arrays, one array per
+column. The event tables are append-only in practice, so a refresh only
+reads rows with an id above the last snapshot's. Deleted rows (a reset)
+show up as a count mismatch and trigger a full reload.
+"""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from ..config import SQLITE_BUSY_TIMEOUT_MS
+from ..utils.hangul import TYPO_KINDS, typo_kind
+
+logger = logging.getLogger(__name__)
+
+# name -> (table, timestamp column, correct column)
+EVENT_SOURCES = {
+    "activity": ("activity_logs", "timestamp", "correct"),
+    "reviews": ("word_review_items", "created_at", "correct"),
+}
+
+EVENT_DTYPE = np.dtype([("word_id", "i4"), ("ts", "i8"), ("correct", "?")])
+MISTAKE_DTYPE = np.dtype(
+    [("word_id", "i4"), ("ts", "i8"), ("text", "i4"), ("kind", "i1")]
+)
+EMPTY_EVENTS = np.zeros(0, dtype=EVENT_DTYPE)
+EMPTY_MISTAKES = np.zeros(0, dtype=MISTAKE_DTYPE)
+
+
+@dataclass
+class Words:
+    id: np.ndarray
+    korean: np.ndarray
+    english: np.ndarray
+    topik_level: np.ndarray  # 0 when unknown
+
+
+@dataclass
+class Snapshot:
+    created_at: datetime
+    words: Words
+    # Structured arrays (word_id, ts, correct), ts in epoch seconds (UTC)
+    events: Dict[str, np.ndarray]
+    # (word_id, ts, text, kind): text indexes mistake_texts, kind indexes
+    # hangul.TYPO_KINDS
+    mistakes: np.ndarray = field(default_factory=lambda: EMPTY_MISTAKES)
+    mistake_texts: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype="U1")
+    )
+    # Highest id and row count loaded per source table
+    watermarks: Dict[str, tuple] = field(default_factory=dict)
+    build_seconds: float = 0.0
+
+    @property
+    def rows(self) -> Dict[str, int]:
+        counts = {name: len(array) for name, array in self.events.items()}
+        counts["mistakes"] = len(self.mistakes)
+        counts["words"] = len(self.words.id)
+        return counts
+
+    def all_events(self) -> np.ndarray:
+        return np.concatenate(list(self.events.values()) or [EMPTY_EVENTS])
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+        isolation_level=None,
+    )
+    return conn
+
+
+def _epoch(column: str) -> str:
+    return f"CAST(strftime('%s', {column}) AS INTEGER)"
+
+
+def _watermark(conn, table: str, ts_column: str, after: int) -> tuple:
+    max_id, count = conn.execute(
+        f"SELECT MAX(id), COUNT(*) FROM {table} "
+        f"WHERE id <= ? AND {ts_column} IS NOT NULL",
+        (after,),
+    ).fetchone()
+    return max_id or 0, count
+
+
+def _load_words(conn) -> Words:
+    rows = conn.execute(
+        "SELECT id, korean, english, COALESCE(topik_level, 0) "
+        "FROM words ORDER BY id"
+    ).fetchall()
+    if not rows:
+        return Words(
+            id=np.zeros(0, dtype="i4"),
+            korean=np.zeros(0, dtype="U1"),
+            english=np.zeros(0, dtype="U1"),
+            topik_level=np.zeros(0, dtype="i1"),
+        )
+    ids, korean, english, topik = zip(*rows)
+    return Words(
+        id=np.array(ids, dtype="i4"),
+        korean=np.array(korean),
+        english=np.array(english),
+        topik_level=np.array(topik, dtype="i1"),
+    )
+
+
+def _can_extend(conn, previous: Optional[Snapshot], name: str, table, ts):
+    """True when `previous` still holds exactly the rows up to its mark"""
+    if previous is None or name not in previous.watermarks:
+        return False
+    max_id, count = previous.watermarks[name]
+    return _watermark(conn, table, ts, max_id) == (max_id, count)
+
+
+def _load_events(conn, table, ts, correct, after: int) -> np.ndarray:
+    cursor = conn.execute(
+        f"SELECT word_id, {_epoch(ts)}, {correct} FROM {table} "
+        f"WHERE id > ? AND {ts} IS NOT NULL ORDER BY id",
+        (after,),
+    )
+    return np.fromiter(cursor, dtype=EVENT_DTYPE)
+
+
+def _load_mistakes(
+    conn, after: int, texts: Dict[str, int], words: Words
+) -> np.ndarray:
+    """Load wrong_inputs, dictionary-encoding input_text into `texts`.
+
+    Each row is classified once here (hangul.typo_kind against the word's
+    Korean), so reports only count the stored kind codes.
+    """
+    korean = dict(zip(words.id.tolist(), words.korean.tolist()))
+    kinds: Dict[tuple, int] = {}
+    mixed = TYPO_KINDS.index("mixed")
+
+    def kind_of(word_id: int, text: str) -> int:
+        key = (word_id, text)
+        if key not in kinds:
+            expected = korean.get(word_id)
+            kinds[key] = (
+                TYPO_KINDS.index(typo_kind(expected, text))
+                if expected
+                else mixed
+            )
+        return kinds[key]
+
+    rows = conn.execute(
+        f"SELECT word_id, {_epoch('timestamp')}, input_text "
+        "FROM wrong_inputs WHERE id > ? AND timestamp IS NOT NULL "
+        "ORDER BY id",
+        (after,),
+    )
+    return np.fromiter(
+        (
+            (
+                word_id,
+                ts,
+                texts.setdefault(text, len(texts)),
+                kind_of(word_id, text),
+            )
+            for word_id, ts, text in rows
+        ),
+        dtype=MISTAKE_DTYPE,
+    )
+
+
+def build_snapshot(
+    db_path: str,
+    previous: Optional[Snapshot] = None,
+    progress: Optional[Callable[[float, str], None]] = None,
+) -> Snapshot:
+    """Copy learner history into arrays, reusing `previous` when valid.
+
+    Blocking; run it in a thread. All tables are read in one transaction
+    so the snapshot is consistent.
+    """
+    started = time.perf_counter()
+    report = progress or (lambda fraction, message: None)
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN")
+        report(0.0, "Loading words")
+        words = _load_words(conn)
+
+        events, watermarks = {}, {}
+        sources = list(EVENT_SOURCES.items())
+        for step, (name, (table, ts, correct)) in enumerate(sources):
+            report((step + 1) / (len(sources) + 2), f"Loading {table}")
+            if _can_extend(conn, previous, name, table, ts):
+                base = previous.events[name]
+                after = previous.watermarks[name][0]
+            else:
+                base, after = EMPTY_EVENTS, 0
+            events[name] = np.concatenate(
+                [base, _load_events(conn, table, ts, correct, after)]
+            )
+            watermarks[name] = _watermark(conn, table, ts, 2**62)
+
+        report(len(sources) / (len(sources) + 2), "Loading wrong_inputs")
+        if _can_extend(
+            conn, previous, "mistakes", "wrong_inputs", "timestamp"
+        ):
+            base = previous.mistakes
+            after = previous.watermarks["mistakes"][0]
+            texts = {
+                text: code for code, text in enumerate(previous.mistake_texts)
+            }
+        else:
+            base, after, texts = EMPTY_MISTAKES, 0, {}
+        mistakes = np.concatenate(
+            [base, _load_mistakes(conn, after, texts, words)]
+        )
+        watermarks["mistakes"] = _watermark(
+            conn, "wrong_inputs", "timestamp", 2**62
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+    snapshot = Snapshot(
+        created_at=datetime.utcnow(),
+        words=words,
+        events=events,
+        mistakes=mistakes,
+        mistake_texts=np.array(list(texts) or [""]),
+        watermarks=watermarks,
+    )
+    snapshot.build_seconds = time.perf_counter() - started
+    return snapshot
+
+
+def save_snapshot(snapshot: Snapshot, path: Path) -> None:
+    """Write the snapshot as an uncompressed .npz (fast to reload)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    arrays = {
+        "created_at": np.array(snapshot.created_at.isoformat()),
+        "words_id": snapshot.words.id,
+        "words_korean": snapshot.words.korean,
+        "words_english": snapshot.words.english,
+        "words_topik_level": snapshot.words.topik_level,
+        "mistakes": snapshot.mistakes,
+        "mistake_texts": snapshot.mistake_texts,
+    }
+    for name, array in snapshot.events.items():
+        arrays[f"events_{name}"] = array
+    for name, mark in snapshot.watermarks.items():
+        arrays[f"watermark_{name}"] = np.array(mark, dtype="i8")
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez(tmp, **arrays)
+    tmp.replace(path)
+
+
+def load_snapshot(path: Path) -> Optional[Snapshot]:
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            return Snapshot(
+                created_at=datetime.fromisoformat(str(data["created_at"])),
+                words=Words(
+                    id=data["words_id"],
+                    korean=data["words_korean"],
+                    english=data["words_english"],
+                    topik_level=data["words_topik_level"],
+                ),
+                events={
+                    name: data[f"events_{name}"]
+                    for name in EVENT_SOURCES
+                    if f"events_{name}" in data
+                },
+                mistakes=data["mistakes"],
+                mistake_texts=data["mistake_texts"],
+                watermarks={
+                    key[len("watermark_") :]: tuple(int(v) for v in data[key])
+                    for key in data.files
+                    if key.startswith("watermark_")
+                },
+            )
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable analytics snapshot {path}: {e}")
+        return None
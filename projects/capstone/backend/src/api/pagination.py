@@ -0,0 +1,121 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence
+
+from fastapi import HTTPException, Query
+from sqlalchemy import literal, tuple_
+
+
+@dataclass
+class Pagination:
+    """Pagination parameters shared by the list endpoints.
+
+    Offset mode (`skip`/`limit`) is the default for compatibility. Passing
+    `cursor` (an empty value starts from the beginning) switches to keyset
+    pagination, which costs the same for every page and returns
+    ``{"items": [...], "next_cursor": ...}``.
+    """
+
+    skip: int = 0
+    limit: int = 100
+    cursor: Optional[str] = None
+
+    @property
+    def keyset(self) -> bool:
+        return self.cursor is not None
+
+
+def pagination_params(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Opaque keyset cursor from a previous page's next_cursor. "
+            "Pass an empty value to start cursor pagination."
+        ),
+    ),
+) -> Pagination:
+    return Pagination(skip=skip, limit=limit, cursor=cursor)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match ordering")
+        return [
+            (
+                datetime.fromisoformat(value)
+                if column.type.python_type is datetime
+                else value
+            )
+            for column, value in zip(columns, values)
+        ]
+    except (ValueError, TypeError, NotImplementedError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def paginate(query, pagination: Pagination, *order_by, descending=False):
+    """Apply offset or keyset pagination to `query`.
+
+    `order_by` must end with a unique column (usually the primary key) so
+    the keyset is a total order. In keyset mode one extra row is fetched
+    to tell whether another page exists.
+    """
+    ordering = [column.desc() if descending else column for column in order_by]
+    query = query.order_by(*ordering)
+
+    if not pagination.keyset:
+        return query.offset(pagination.skip).limit(pagination.limit)
+
+    if pagination.cursor:
+        after = decode_cursor(pagination.cursor, order_by)
+        key = tuple_(*order_by)
+        marker = tuple_(
+            *(
+                literal(value, type_=column.type)
+                for column, value in zip(order_by, after)
+            )
+        )
+        query = query.where(key < marker if descending else key > marker)
+    return query.limit(pagination.limit + 1)
+
+
+def page_response(
+    rows: Sequence,
+    pagination: Pagination,
+    cursor_values: Callable[[Any], Sequence[Any]],
+    serialize: Optional[Callable[[Any], Any]] = None,
+):
+    """Shape paginated rows for the response.
+
+    Offset mode returns the bare list, as the endpoints always have.
+    Keyset mode wraps it with the cursor for the next page.
+    """
+    serialize = serialize or (lambda row: row)
+    if not pagination.keyset:
+        return [serialize(row) for row in rows]
+
+    rows = list(rows)
+    has_more = len(rows) > pagination.limit
+    rows = rows[: pagination.limit]
+    next_cursor = (
+        encode_cursor(cursor_values(rows[-1])) if has_more and rows else None
+    )
+    return {
+        "items": [serialize(row) for row in rows],
+        "next_cursor": next_cursor,
+    }
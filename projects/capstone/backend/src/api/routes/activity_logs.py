@@ -2,24 +2,31 @@ from fastapi import APIRouter, Depends, HTTPException
 
 # Removed unused AsyncSession import
 from sqlalchemy import select
-from typing import List, Optional
-from ...database import get_db
+from typing import List, Optional, Union
+from ...database import get_db, get_read_db
+from ...db import rollups
+from ..pagination import Pagination, pagination_params, paginate, page_response
 from contextlib import asynccontextmanager  # Added import
 from ...models.activity_log import ActivityLog
 from ...models.activity_type import ActivityType
 from ...schemas.activity_log import ActivityLogCreate, ActivityLogResponse
+from ...schemas.pagination import CursorPage
 
 router = APIRouter(prefix="/logs", tags=["activity_logs"])
 
 
-@router.get("", response_model=List[ActivityLogResponse])
+@router.get(
+    "",
+    response_model=Union[
+        List[ActivityLogResponse], CursorPage[ActivityLogResponse]
+    ],
+)
 async def list_activity_logs(
-    skip: int = 0,
-    limit: int = 100,
+    pagination: Pagination = Depends(pagination_params),
     session_id: Optional[int] = None,
     word_id: Optional[int] = None,
     activity_type: Optional[ActivityType] = None,
-    db_cm: asynccontextmanager = Depends(get_db),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
     """List activity logs with optional filters"""
     async with db_cm as db:
@@ -34,9 +41,11 @@ async def list_activity_logs(
                 ActivityLog.activity_type == activity_type.value
             )
 
-        query = query.offset(skip).limit(limit)
+        query = paginate(query, pagination, ActivityLog.id)
         result = await db.execute(query)
-        return result.scalars().all()
+        return page_response(
+            result.scalars().all(), pagination, lambda log: [log.id]
+        )
 
 
 @router.post("", response_model=ActivityLogResponse, status_code=201)
@@ -49,6 +58,9 @@ async def create_activity_log(
         db.add(db_log)
 
         try:
+            await rollups.bump(
+                db, rollups.ACTIVITY, db_log.timestamp, db_log.activity_type
+            )
             await db.commit()
             await db.refresh(db_log)
             return db_log
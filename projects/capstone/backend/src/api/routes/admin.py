@@ -1,33 +1,76 @@
-from fastapi import APIRouter, HTTPException
+from pathlib import Path
+from typing import List
 
-# Removed unused Depends, AsyncSession, get_db
-from ...db.init_db import reset_all, reset_session
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
 
-# from ...database import get_db # Not used here
+from ...cache import response_cache
+from ...db import maintenance  # noqa: F401  (registers the job handlers)
+from ...db.init_db import SessionNotFoundError, reset_session
+from ...jobs import SUCCEEDED, job_queue
+from ...schemas.job import JobCreate, JobResponse
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-@router.post("/reset/all")
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def create_job(job: JobCreate):
+    """Queue a reset, reseed, reindex or export job; poll it for progress"""
+    return job_queue.submit(job.kind, job.params)
+
+
+@router.get("/jobs", response_model=List[JobResponse])
+async def list_jobs():
+    """Recent jobs, newest first"""
+    return job_queue.list()
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_job_result(job_id: str):
+    """The file written by a finished export job"""
+    job = job_queue.get(job_id)
+    if job is None or job.kind != "export":
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status != SUCCEEDED:
+        raise HTTPException(
+            status_code=409, detail=f"Export job is {job.status}"
+        )
+    path = Path(job.result["path"])
+    if not path.exists():
+        raise HTTPException(status_code=410, detail="Export file is gone")
+    return FileResponse(path, filename=path.name)
+
+
+@router.post("/reset/all", status_code=202)
 async def reset_database():
-    """Reset entire database"""
-    try:
-        reset_all()
-        return {"status": "success", "message": "Database fully reset"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    """Reset entire database (runs as a background job)"""
+    job = job_queue.submit("reset")
+    return {
+        "status": "accepted",
+        "message": "Database reset queued",
+        "job_id": job.id,
+    }
 
 
 @router.post("/reset/session/{session_id}")
 async def reset_study_session(session_id: int):
     """Reset specific study session data"""
     try:
-        reset_session(session_id)
+        await reset_session(session_id)
+        await response_cache.invalidate("stats")
         return {
             "status": "success",
             "message": f"Session {session_id} reset successful",
         }
-    except ValueError as e:
+    except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
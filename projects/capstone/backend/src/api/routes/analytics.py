@@ -0,0 +1,96 @@
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ...analytics import ANALYTICS_ENABLED, analytics_store
+from ...jobs import job_queue
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+def _reports():
+    if not ANALYTICS_ENABLED:
+        raise HTTPException(status_code=503, detail="numpy is not installed")
+    reports = analytics_store.reports
+    if reports is None:
+        raise HTTPException(
+            status_code=503,
+            detail="No analytics snapshot yet, POST /api/analytics/refresh",
+        )
+    return reports
+
+
+@router.get("/status")
+async def get_status():
+    """When the snapshot was taken and how many rows it holds"""
+    return analytics_store.status()
+
+
+@router.post("/refresh", status_code=202)
+async def refresh():
+    """Queue a snapshot refresh; poll /api/admin/jobs/{job_id}"""
+    if not ANALYTICS_ENABLED:
+        raise HTTPException(status_code=503, detail="numpy is not installed")
+    job = job_queue.submit("analytics")
+    return {"status": "accepted", "job_id": job.id}
+
+
+@router.get("/retention")
+async def get_retention(
+    order: Literal["weakest", "strongest", "forgetting", "mistakes"] = (
+        "weakest"
+    ),
+    limit: int = Query(50, ge=1, le=1000),
+    min_attempts: int = Query(1, ge=0),
+):
+    """Per-word accuracy, delayed recall and predicted recall now"""
+    reports = _reports()
+    # Imported here: the reports module needs numpy, checked above
+    from ...analytics.reports import retention_rows
+
+    return {
+        "generated_at": reports.generated_at,
+        "stability_days": reports.forgetting_curve["stability_days"],
+        "words": retention_rows(reports, order, limit, min_attempts),
+    }
+
+
+@router.get("/forgetting-curve")
+async def get_forgetting_curve():
+    """Accuracy by time since the previous answer, with a fitted curve"""
+    reports = _reports()
+    return {"generated_at": reports.generated_at, **reports.forgetting_curve}
+
+
+@router.get("/heatmap")
+async def get_heatmap(
+    tz_offset_minutes: int = Query(0, ge=-720, le=840),
+):
+    """Answers and accuracy by weekday and hour"""
+    reports = _reports()
+    if tz_offset_minutes == 0:
+        heatmap = reports.heatmap
+    else:
+        from ...analytics.reports import heatmap as build_heatmap  # numpy
+
+        heatmap = build_heatmap(
+            analytics_store.snapshot.all_events(), tz_offset_minutes
+        )
+    return {"generated_at": reports.generated_at, **heatmap}
+
+
+@router.get("/mistakes")
+async def get_mistake_clusters():
+    """Wrong answers grouped by kind of error, with top confusions"""
+    reports = _reports()
+    return {"generated_at": reports.generated_at, **reports.mistakes}
+
+
+@router.get("/topik-mastery")
+async def get_topik_mastery():
+    """Practised and mastered words per TOPIK level"""
+    reports = _reports()
+    return {
+        "generated_at": reports.generated_at,
+        "levels": reports.topik_mastery,
+    }
@@ -1,21 +1,26 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy import select, func
-from datetime import datetime, timedelta, timezone
-from collections import defaultdict
-from ...database import get_db
+from sqlalchemy import select, func, case
+from datetime import datetime, time, timedelta, timezone
+from ...cache import response_cache
+from ...database import get_read_db
+from ...db import rollups
+from ...db.aggregates import count_by_value, count_rows
 from contextlib import asynccontextmanager  # Added import
 from ...models.study_session import StudySession
 from ...models.word_review_item import WordReviewItem
 from ...models.word import Word
 from ...models.word_stats import WordStats
-from ...models.activity_log import ActivityLog
 from ...models.wrong_input import WrongInput
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+TOPIK_LEVELS = [1, 2, 3, 4, 5, 6]
+
 
 @router.get("/last_study_session")
-async def get_last_study_session(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_last_study_session(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
     """Get the last study session"""
     async with db_cm as db:
         query = (
@@ -29,7 +34,9 @@ async def get_last_study_session(db_cm: asynccontextmanager = Depends(get_db)):
 
 
 @router.get("/study_progress")
-async def get_study_progress(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_study_progress(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
     """Get study progress"""
     async with db_cm as db:
         query = (
@@ -54,201 +61,144 @@ async def get_study_progress(db_cm: asynccontextmanager = Depends(get_db)):
         }
 
 
-@router.get("/quick-stats")
-async def get_quick_stats(db_cm: asynccontextmanager = Depends(get_db)):
-    """Get quick stats"""
-    async with db_cm as db:
-        # Total words
-        total_words_res = await db.execute(select(func.count(Word.id)))
-        total_words_count = total_words_res.scalar()
+async def _quick_stats(db) -> dict:
+    return await count_rows(
+        db,
+        total_words=Word.id,
+        total_sessions=StudySession.id,
+        total_mistakes=WrongInput.id,
+    )
 
-        # Total sessions
-        total_sessions_res = await db.execute(
-            select(func.count(StudySession.id))
-        )
-        total_sessions_count = total_sessions_res.scalar()
 
-        # Total mistakes
-        total_mistakes_res = await db.execute(
-            select(func.count(WrongInput.id))
-        )
-        total_mistakes_count = total_mistakes_res.scalar()
+# The per-day charts read the daily rollups, so their cost depends on the
+# window size rather than the size of the learner's history.
+async def _recent_activity(db) -> dict:
+    return await rollups.daily_totals(db, rollups.ACTIVITY, days=7)
 
-        return {
-            "total_words": total_words_count,
-            "total_sessions": total_sessions_count,
-            "total_mistakes": total_mistakes_count,
-        }
+
+async def _srs_forecast(db) -> dict:
+    return await rollups.daily_totals(
+        db, rollups.SRS_DUE, days=14, forward=True
+    )
+
+
+async def _learning_progress(db) -> dict:
+    return await rollups.daily_totals(db, rollups.WORDS_ADDED, days=7)
+
+
+async def _activity_distribution(db) -> dict:
+    return await rollups.dimension_totals(db, rollups.ACTIVITY)
+
+
+async def _topik_progress(db) -> dict:
+    topik_counts = await count_by_value(db, Word.topik_level, TOPIK_LEVELS)
+    return {f"TOPIK {level}": count for level, count in topik_counts.items()}
+
+
+async def _study_time(db) -> dict:
+    # This counts sessions started, not duration. If duration is needed,
+    # it requires summing session durations (ended_at - started_at).
+    return await rollups.daily_totals(db, rollups.SESSIONS_STARTED, days=7)
+
+
+@router.get("/quick-stats")
+@response_cache.cached(tags=["stats"])
+async def get_quick_stats(db_cm: asynccontextmanager = Depends(get_read_db)):
+    """Get quick stats"""
+    async with db_cm as db:
+        return await _quick_stats(db)
 
 
 @router.get("/srs-overview")
-async def get_srs_overview(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_srs_overview(db_cm: asynccontextmanager = Depends(get_read_db)):
     """Get SRS system overview"""
     async with db_cm as db:
-        # Total words in review
-        total_in_review_res = await db.execute(
-            select(func.count(WordReviewItem.id))
+        # Words are "in review" once they have a due date in word_stats
+        end_of_today = datetime.combine(
+            datetime.now(timezone.utc).date() + timedelta(days=1), time.min
         )
-        total_in_review_count = total_in_review_res.scalar()
-
-        # Words due today
-        today = datetime.now(timezone.utc).date()
-        words_due_today_res = await db.execute(
-            select(func.count(WordReviewItem.id)).filter(
-                WordReviewItem.due_date == today
-            )
-        )
-        words_due_today_count = words_due_today_res.scalar()
-
-        # Words due in the future
-        words_due_future_res = await db.execute(
-            select(func.count(WordReviewItem.id)).filter(
-                WordReviewItem.due_date > today
+        due = WordStats.next_due_at
+        result = await db.execute(
+            select(
+                func.count(due),
+                func.count(case((due < end_of_today, 1))),
+                func.count(case((due >= end_of_today, 1))),
             )
         )
-        words_due_future_count = words_due_future_res.scalar()
+        total_in_review, due_today, due_future = result.one()
 
         return {
-            "total_in_review": total_in_review_count,
-            "words_due_today": words_due_today_count,
-            "words_due_future": words_due_future_count,
+            "total_in_review": total_in_review,
+            "words_due_today": due_today,
+            "words_due_future": due_future,
         }
 
 
 @router.get("/recent-activity")
-async def get_recent_activity(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_recent_activity(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
     """Get activity stats for recent days"""
     async with db_cm as db:
-        today = datetime.now(timezone.utc).date()
-        activity_counts = defaultdict(int)
-
-        for i in range(7):
-            current_date = today - timedelta(days=i)
-            start_of_day = datetime(
-                current_date.year, current_date.month, current_date.day
-            ).replace(tzinfo=timezone.utc)
-            end_of_day = start_of_day + timedelta(days=1)
-
-            activity_count_res = await db.execute(
-                select(func.count(ActivityLog.id))  # Count specific column
-                .filter(ActivityLog.timestamp >= start_of_day)
-                .filter(ActivityLog.timestamp < end_of_day)
-            )
-            activity_counts[current_date.isoformat()] = (
-                activity_count_res.scalar()
-            )
-
-        return activity_counts
+        return await _recent_activity(db)
 
 
 @router.get("/srs-forecast")
-async def get_srs_forecast(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_srs_forecast(db_cm: asynccontextmanager = Depends(get_read_db)):
     """Get upcoming SRS reviews forecast"""
     async with db_cm as db:
-        today = datetime.now(timezone.utc).date()
-        forecast = defaultdict(int)
-
-        for i in range(14):
-            future_date = today + timedelta(days=i)
-            due_count_res = await db.execute(
-                select(
-                    func.count(WordReviewItem.id)
-                ).filter(  # Count specific column
-                    WordReviewItem.due_date == future_date
-                )
-            )
-            forecast[future_date.isoformat()] = due_count_res.scalar()
-
-        return forecast
+        return await _srs_forecast(db)
 
 
 @router.get("/charts/learning-progress")
-async def get_learning_progress(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_learning_progress(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
     """Get daily progress data for line chart"""
     async with db_cm as db:
-        today = datetime.now(timezone.utc).date()
-        progress_data = defaultdict(int)
-
-        for i in range(7):
-            current_date = today - timedelta(days=i)
-            start_of_day = datetime(
-                current_date.year, current_date.month, current_date.day
-            ).replace(tzinfo=timezone.utc)
-            end_of_day = start_of_day + timedelta(days=1)
-
-            new_words_count_res = await db.execute(
-                select(func.count(Word.id))  # Count specific column
-                .filter(Word.created_at >= start_of_day)
-                .filter(Word.created_at < end_of_day)
-            )
-            progress_data[current_date.isoformat()] = (
-                new_words_count_res.scalar()
-            )
-
-        return progress_data
+        return await _learning_progress(db)
 
 
 @router.get("/charts/activity-distribution")
 async def get_activity_distribution(
-    db_cm: asynccontextmanager = Depends(get_db),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
     """Get activity type distribution for pie chart"""
     async with db_cm as db:
-        activity_counts_res = await db.execute(
-            select(
-                ActivityLog.activity_type, func.count(ActivityLog.id)
-            )  # Count specific column
-            .group_by(ActivityLog.activity_type)
-            .order_by(func.count(ActivityLog.id).desc())
-        )
-        return {
-            activity_type: count
-            for activity_type, count in activity_counts_res.fetchall()
-        }
+        return await _activity_distribution(db)
 
 
 @router.get("/charts/topik-progress")
-async def get_topik_progress(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_topik_progress(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
     """Get TOPIK level progress for radar chart"""
     async with db_cm as db:
-        topik_levels = [1, 2, 3, 4, 5, 6]
-        topik_counts = {}
-
-        for level in topik_levels:
-            count_res = await db.execute(
-                select(func.count(Word.id)).filter(  # Count specific column
-                    Word.topik_level == level
-                )
-            )
-            topik_counts[f"TOPIK {level}"] = count_res.scalar()
-
-        return topik_counts
+        return await _topik_progress(db)
 
 
 @router.get("/charts/study-time")
-async def get_study_time_stats(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_study_time_stats(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
     """Get study time distribution for bar chart"""
     async with db_cm as db:
-        today = datetime.now(timezone.utc).date()
-        study_time_data = defaultdict(int)
-
-        for i in range(7):
-            current_date = today - timedelta(days=i)
-            start_of_day = datetime(
-                current_date.year, current_date.month, current_date.day
-            ).replace(tzinfo=timezone.utc)
-            end_of_day = start_of_day + timedelta(days=1)
-
-            # This counts sessions started, not duration. If duration is needed,
-            # it requires summing session durations (ended_at - created_at).
-            # Assuming count of sessions started per day is intended for now.
-            study_sessions_count_res = await db.execute(
-                select(func.count(StudySession.id))  # Count specific column
-                .filter(StudySession.created_at >= start_of_day)
-                .filter(StudySession.created_at < end_of_day)
-            )
-            study_time_data[current_date.isoformat()] = (
-                study_sessions_count_res.scalar()
-            )
+        return await _study_time(db)
 
-        return study_time_data
+
+@router.get("/summary")
+async def get_dashboard_summary(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
+    """Get every dashboard widget from a single read transaction"""
+    async with db_cm as db:
+        async with db.begin():
+            return {
+                "quick_stats": await _quick_stats(db),
+                "recent_activity": await _recent_activity(db),
+                "srs_forecast": await _srs_forecast(db),
+                "learning_progress": await _learning_progress(db),
+                "activity_distribution": await _activity_distribution(db),
+                "topik_progress": await _topik_progress(db),
+                "study_time": await _study_time(db),
+            }
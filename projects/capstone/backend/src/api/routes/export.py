@@ -0,0 +1,64 @@
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from ...database import get_read_db
+from ...db.export import (
+    DEFAULT_CHUNK_SIZE,
+    field_names,
+    iter_rows,
+    to_csv,
+    to_ndjson,
+)
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@router.get("/{kind}")
+async def export_table(
+    kind: Literal["words", "activity", "mistakes"],
+    format: Literal["ndjson", "csv"] = "ndjson",
+    since: Optional[datetime] = Query(
+        None, description="Only rows added or changed at/after this time"
+    ),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=10000),
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
+    """Stream a full (or incremental) export as NDJSON or CSV.
+
+    Rows are read with a server-side cursor and written chunk by chunk,
+    so memory use does not grow with the size of the table.
+    """
+    if since is not None and since.tzinfo is not None:
+        # Timestamps are stored as naive UTC
+        since = since.replace(tzinfo=None) - since.utcoffset()
+    fields = field_names(kind)
+
+    async def generate():
+        exported = 0
+        if format == "csv":
+            yield to_csv([], fields, header=True)
+        async with db_cm as db:
+            async for rows in iter_rows(db, kind, since, chunk_size):
+                exported += len(rows)
+                if format == "csv":
+                    yield to_csv(rows, fields)
+                else:
+                    yield to_ndjson(rows)
+        logger.info(f"Exported {exported} {kind} rows as {format}")
+
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    filename = f"{kind}-{stamp}.{format}"
+    return StreamingResponse(
+        generate(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
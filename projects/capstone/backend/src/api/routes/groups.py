@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select, func
+from sqlalchemy.orm import selectinload
 from typing import List
 from pydantic import BaseModel
-from ...database import get_db
+from ...cache import response_cache
+from ...database import get_db, get_read_db
+from ..pagination import Pagination, pagination_params, paginate, page_response
 from contextlib import asynccontextmanager
 from ...models.group import WordGroup
 from ...models.word import Word, word_group_map
@@ -12,6 +15,7 @@ from ...schemas.group import (
     WordGroupUpdate,
     WordGroupResponse,
 )
+from ...schemas.word import WordResponse
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,45 +27,83 @@ class BulkWordAdd(BaseModel):
     word_ids: List[int]
 
 
+def _group_payload(group: WordGroup, word_count: int, include_words: bool):
+    payload = group.model_dump()
+    payload["word_count"] = word_count
+    if include_words:
+        # Through the response schema, so internal columns (the Hangul
+        # search keys) stay out of the list
+        payload["words"] = [
+            WordResponse.model_validate(word).model_dump()
+            for word in group.words
+        ]
+    return payload
+
+
 @router.get("")
 async def get_groups(
     group_type: str | None = None,
-    skip: int = 0,
-    limit: int = 100,
-    db_cm: asynccontextmanager = Depends(get_db),
+    include_words: bool = Query(
+        False, description="Eagerly load each group's word list"
+    ),
+    pagination: Pagination = Depends(pagination_params),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
-    """Get all groups with optional type filter"""
+    """Get all groups with word counts and optional type filter"""
     try:
         async with db_cm as db:
-            print(f"API: Fetching groups with type: {group_type}")
-            query = select(WordGroup)
+            logger.debug(f"Fetching groups with type: {group_type}")
+            # Word counts come from one grouped join instead of loading
+            # every group's word list
+            word_count = func.count(word_group_map.c.word_id).label(
+                "word_count"
+            )
+            query = (
+                select(WordGroup, word_count)
+                .outerjoin(
+                    word_group_map, word_group_map.c.group_id == WordGroup.id
+                )
+                .group_by(WordGroup.id)
+            )
             if group_type:
                 query = query.filter(WordGroup.group_type == group_type)
+            if include_words:
+                query = query.options(selectinload(WordGroup.words))
 
+            query = paginate(query, pagination, WordGroup.id)
             result = await db.execute(query)
-            groups = result.scalars().all()
-
-            print(f"API: Found {len(groups)} groups")
-            for group in groups:
-                print(
-                    f"- {group.name} ({group.group_type}): "
-                    f"{len(group.words)} words"
-                )
-
-            return groups
+            rows = result.all()
+
+            return page_response(
+                rows,
+                pagination,
+                cursor_values=lambda row: [row[0].id],
+                serialize=lambda row: _group_payload(
+                    row[0], row[1], include_words
+                ),
+            )
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"API Error in get_groups: {str(e)}")
+        logger.exception(f"API Error in get_groups: {e}")
         raise HTTPException(
             status_code=500, detail=f"Database error: {str(e)}"
         )
 
 
 @router.get("/{group_id}", response_model=WordGroupResponse)
+@response_cache.cached(
+    tags=["group:{group_id}", "groups"], response_model=WordGroupResponse
+)
 async def get_group(
-    group_id: int, db_cm: asynccontextmanager = Depends(get_db)
+    group_id: int, db_cm: asynccontextmanager = Depends(get_read_db)
 ):
     async with db_cm as db:
-        query = select(WordGroup).filter(WordGroup.id == group_id)
+        query = (
+            select(WordGroup)
+            .filter(WordGroup.id == group_id)
+            .options(selectinload(WordGroup.words))
+        )
         result = await db.execute(query)
         group = result.scalar_one_or_none()
         if not group:
@@ -70,22 +112,23 @@ async def get_group(
 
 
 @router.get("/{group_id}/words")
+@response_cache.cached(tags=["group:{group_id}", "groups"])
 async def get_group_words(
     group_id: int,
-    skip: int = 0,
-    limit: int = 100,
-    db_cm: asynccontextmanager = Depends(get_db),
+    pagination: Pagination = Depends(pagination_params),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
     async with db_cm as db:
         query = (
             select(Word)
-            .join(Word.groups)
-            .filter(WordGroup.id == group_id)
-            .offset(skip)
-            .limit(limit)
+            .join(word_group_map, word_group_map.c.word_id == Word.id)
+            .filter(word_group_map.c.group_id == group_id)
         )
+        query = paginate(query, pagination, Word.id)
         result = await db.execute(query)
-        return result.scalars().all()
+        return page_response(
+            result.scalars().all(), pagination, lambda word: [word.id]
+        )
 
 
 @router.get("/{group_id}/study_sessions")
@@ -93,7 +136,7 @@ async def get_group_study_sessions(
     group_id: int,
     skip: int = 0,
     limit: int = 100,
-    db_cm: asynccontextmanager = Depends(get_db),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
     async with db_cm as db:
         query = (
@@ -106,17 +149,6 @@ async def get_group_study_sessions(
         return result.scalars().all()
 
 
-# @router.post("", response_model=WordGroupResponse)
-# async def create_group(
-#     group: WordGroupCreate, db: AsyncSession = Depends(get_db)
-# ):
-#     db_group = WordGroup(**group.dict())
-#     db.add(db_group)
-#     await db.commit()
-#     await db.refresh(db_group)
-#     return db_group
-
-
 @router.post("", response_model=WordGroupResponse, status_code=201)
 async def create_group(
     group: WordGroupCreate, db_cm: asynccontextmanager = Depends(get_db)
@@ -136,6 +168,10 @@ async def create_group(
             f"Error creating group: {e}"
         )  # Log the full traceback
         await db.rollback()  # Rollback on error
+        if "UNIQUE constraint failed" in str(e):
+            raise HTTPException(
+                status_code=409, detail="Group name already exists"
+            )
         raise HTTPException(status_code=500, detail="Failed to create group")
 
 
@@ -159,6 +195,7 @@ async def update_group(
         try:
             await db.commit()
             await db.refresh(db_group)
+            await response_cache.invalidate(f"group:{group_id}")
             return db_group
         except Exception as e:
             await db.rollback()
@@ -194,6 +231,7 @@ async def add_word_to_group(
             )
             await db.execute(stmt)
             await db.commit()
+            await response_cache.invalidate(f"group:{group_id}")
             return {"message": "Word added to group successfully"}
         except (
             Exception
@@ -260,6 +298,7 @@ async def add_words_to_group(
                 word_group_map.insert().prefix_with("OR IGNORE"), values
             )  # Use OR IGNORE for SQLite to skip duplicates
             await db.commit()
+            await response_cache.invalidate(f"group:{group_id}")
             # Get actual count added if needed (more complex query)
             # Could query word_group_map count before/after or use returning
             # clause if DB supports
@@ -292,6 +331,7 @@ async def remove_word_from_group(
         try:
             result = await db.execute(stmt)
             await db.commit()
+            await response_cache.invalidate(f"group:{group_id}")
             if result.rowcount == 0:
                 # Check if group or word exists to give a more specific error
                 group_exists = (
@@ -346,6 +386,7 @@ async def delete_group(
             # If not, you might need to delete them manually first.
             await db.delete(group)
             await db.commit()
+            await response_cache.invalidate(f"group:{group_id}")
             return {"message": "Group deleted successfully"}
         except Exception as e:
             await db.rollback()
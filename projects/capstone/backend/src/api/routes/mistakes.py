@@ -2,14 +2,24 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 
 # Removed unused AsyncSession import
-from sqlalchemy import select, func
-from typing import List
-from ...database import get_db
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import select, func, case, update
+from typing import List, Union
+from ...cache import response_cache
+from ...database import get_db, get_read_db
+from ...db import rollups
+from ..pagination import Pagination, pagination_params, paginate, page_response
 from contextlib import asynccontextmanager  # Added import
 from ...models.wrong_input import WrongInput
 from ...models.word_stats import WordStats
 from ...models.word import Word
-from ...schemas.wrong_input import WrongInputCreate, WrongInputResponse
+from ...schemas.wrong_input import (
+    WrongInputCreate,
+    WrongInputResponse,
+    WrongInputBatchResponse,
+)
+from ...schemas.pagination import CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +27,15 @@ router = APIRouter(tags=["mistakes"])
 
 
 @router.get(
-    "/words/{word_id}/mistakes", response_model=List[WrongInputResponse]
+    "/words/{word_id}/mistakes",
+    response_model=Union[
+        List[WrongInputResponse], CursorPage[WrongInputResponse]
+    ],
 )
 async def get_word_mistakes(
     word_id: int,
-    skip: int = 0,
-    limit: int = 100,
-    db_cm: asynccontextmanager = Depends(get_db),
+    pagination: Pagination = Depends(pagination_params),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
     """Get all wrong inputs for a specific word"""
     async with db_cm as db:
@@ -36,15 +48,20 @@ async def get_word_mistakes(
         if word_exists_res.scalar() == 0:
             raise HTTPException(status_code=404, detail="Word not found")
 
-        # Get wrong inputs
-        query = (
-            select(WrongInput)
-            .filter(WrongInput.word_id == word_id)
-            .order_by(WrongInput.timestamp.desc())
-            .limit(limit)
+        # Get wrong inputs, newest first
+        query = paginate(
+            select(WrongInput).filter(WrongInput.word_id == word_id),
+            pagination,
+            WrongInput.timestamp,
+            WrongInput.id,
+            descending=True,
         )
         result = await db.execute(query)
-        return result.scalars().all()
+        return page_response(
+            result.scalars().all(),
+            pagination,
+            lambda mistake: [mistake.timestamp, mistake.id],
+        )
 
 
 @router.post("/mistakes", response_model=WrongInputResponse, status_code=201)
@@ -70,6 +87,7 @@ async def log_mistake(
             # Create wrong input entry
             db_mistake = WrongInput(**mistake.dict())
             db.add(db_mistake)
+            await rollups.bump(db, rollups.MISTAKES, db_mistake.timestamp)
 
             # Update word stats
             result = await db.execute(
@@ -100,6 +118,7 @@ async def log_mistake(
 
             await db.commit()
             await db.refresh(db_mistake)
+            await response_cache.invalidate("stats")
             return db_mistake
 
         except Exception as e:
@@ -111,9 +130,80 @@ async def log_mistake(
             )
 
 
+@router.post(
+    "/mistakes/batch", response_model=WrongInputBatchResponse, status_code=201
+)
+async def log_mistakes_batch(
+    mistakes: List[WrongInputCreate],
+    db_cm: asynccontextmanager = Depends(get_db),
+):
+    """Log a burst of wrong inputs and update word stats in one transaction"""
+    if not mistakes:
+        return {"inserted": 0, "words_updated": 0}
+
+    per_word = Counter(mistake.word_id for mistake in mistakes)
+    async with db_cm as db:
+        # Verify all words exist with a single IN query
+        existing_res = await db.execute(
+            select(Word.id).filter(Word.id.in_(per_word))
+        )
+        missing_ids = set(per_word) - set(existing_res.scalars().all())
+        if missing_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Words not found: {sorted(missing_ids)}",
+            )
+
+        now = datetime.utcnow()
+        try:
+            await db.execute(
+                WrongInput.__table__.insert(),
+                [
+                    {
+                        "word_id": mistake.word_id,
+                        "input_text": mistake.input_text,
+                        "timestamp": now,
+                    }
+                    for mistake in mistakes
+                ],
+            )
+            await rollups.bump(db, rollups.MISTAKES, now, delta=len(mistakes))
+
+            # Same adjustment as log_mistake, applied once per mistake:
+            # ease -0.2 each (floor 1.3), interval halved each (floor 1)
+            count = case(per_word, value=WordStats.word_id)
+            result = await db.execute(
+                update(WordStats)
+                .where(WordStats.word_id.in_(per_word))
+                .values(
+                    current_streak=0,
+                    ease_factor=func.max(
+                        1.3, WordStats.ease_factor - 0.2 * count
+                    ),
+                    interval_days=func.max(
+                        1, WordStats.interval_days.op(">>")(count)
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            await response_cache.invalidate("stats")
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Failed to log mistake batch: {e}")
+            raise HTTPException(
+                status_code=500, detail="Failed to log mistakes"
+            )
+
+        logger.info(
+            f"Logged {len(mistakes)} mistakes across {len(per_word)} words"
+        )
+        return {"inserted": len(mistakes), "words_updated": result.rowcount}
+
+
 @router.get("/mistakes/stats", response_model=dict)
 async def get_mistake_stats(
-    word_id: int, db_cm: asynccontextmanager = Depends(get_db)
+    word_id: int, db_cm: asynccontextmanager = Depends(get_read_db)
 ):
     """Get mistake statistics for a word"""
     async with db_cm as db:
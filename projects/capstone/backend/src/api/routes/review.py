@@ -0,0 +1,150 @@
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from contextlib import asynccontextmanager
+
+from ...database import get_db, get_read_db
+from ...db import rollups
+from ...models.word import Word
+from ...models.word_stats import WordStats
+from ...models.sample_sentence import SampleSentence
+from ...models.word_review_item import WordReviewItem
+from ...schemas.review import (
+    ReviewQueueItem,
+    ReviewAnswerBatch,
+    ReviewAnswerBatchResponse,
+    ReviewAnswerResult,
+)
+from ...utils.srs import apply_sm2
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/review", tags=["review"])
+
+
+@router.get("/queue", response_model=List[ReviewQueueItem])
+async def get_review_queue(
+    limit: int = Query(20, ge=1, le=500),
+    due_before: Optional[datetime] = None,
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
+    """Get the next due words, with their sample sentences, in due order"""
+    due_before = due_before or datetime.utcnow()
+    async with db_cm as db:
+        # Walks ix_word_stats_next_due_at_word_id, then joins sentences
+        # for just those words in the same statement
+        due = (
+            select(WordStats.word_id)
+            .where(
+                WordStats.next_due_at.is_not(None),
+                WordStats.next_due_at <= due_before,
+            )
+            .order_by(WordStats.next_due_at, WordStats.word_id)
+            .limit(limit)
+            .subquery()
+        )
+        query = (
+            select(Word, WordStats, SampleSentence)
+            .join(due, due.c.word_id == Word.id)
+            .join(WordStats, WordStats.word_id == Word.id)
+            .outerjoin(SampleSentence, SampleSentence.word_id == Word.id)
+            .order_by(
+                WordStats.next_due_at, WordStats.word_id, SampleSentence.id
+            )
+        )
+        result = await db.execute(query)
+
+        queue = {}
+        for word, stats, sentence in result.all():
+            item = queue.get(word.id)
+            if item is None:
+                item = queue[word.id] = {
+                    "word": word,
+                    "sample_sentences": [],
+                    "next_due_at": stats.next_due_at,
+                    "ease_factor": stats.ease_factor,
+                    "interval_days": stats.interval_days,
+                    "current_streak": stats.current_streak,
+                }
+            if sentence is not None:
+                item["sample_sentences"].append(sentence)
+        return list(queue.values())
+
+
+@router.post("/answers", response_model=ReviewAnswerBatchResponse)
+async def submit_review_answers(
+    batch: ReviewAnswerBatch, db_cm: asynccontextmanager = Depends(get_db)
+):
+    """Grade a whole review round with SM-2 in one transaction"""
+    word_ids = {answer.word_id for answer in batch.answers}
+    async with db_cm as db:
+        existing_res = await db.execute(
+            select(Word.id).filter(Word.id.in_(word_ids))
+        )
+        missing_ids = word_ids - set(existing_res.scalars().all())
+        if missing_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Words not found: {sorted(missing_ids)}",
+            )
+
+        stats_res = await db.execute(
+            select(WordStats).filter(WordStats.word_id.in_(word_ids))
+        )
+        stats_by_word = {
+            stats.word_id: stats for stats in stats_res.scalars().all()
+        }
+
+        now = datetime.utcnow()
+        due_deltas = Counter()
+        results = []
+        for answer in batch.answers:
+            stats = stats_by_word.get(answer.word_id)
+            if stats is None:
+                stats = WordStats(word_id=answer.word_id)
+                db.add(stats)
+                stats_by_word[answer.word_id] = stats
+
+            if stats.next_due_at is not None:
+                due_deltas[stats.next_due_at.date()] -= 1
+            apply_sm2(stats, answer.quality, now)
+            due_deltas[stats.next_due_at.date()] += 1
+
+            results.append(
+                ReviewAnswerResult(
+                    word_id=answer.word_id,
+                    correct=answer.correct,
+                    ease_factor=stats.ease_factor,
+                    interval_days=stats.interval_days,
+                    next_due_at=stats.next_due_at,
+                )
+            )
+
+        try:
+            await rollups.bump_many(db, rollups.SRS_DUE, due_deltas)
+            if batch.study_session_id is not None:
+                await db.execute(
+                    WordReviewItem.__table__.insert(),
+                    [
+                        {
+                            "word_id": answer.word_id,
+                            "study_session_id": batch.study_session_id,
+                            "correct": answer.correct,
+                            "created_at": now,
+                        }
+                        for answer in batch.answers
+                    ],
+                )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Failed to record review answers: {e}")
+            raise HTTPException(
+                status_code=500, detail="Failed to record review answers"
+            )
+
+        return {"updated": len(stats_by_word), "results": results}
@@ -0,0 +1,37 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from ...database import get_read_db
+from ...db.search import search_sentences, search_words
+from ...schemas.search import SearchResponse
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    topik_level: Optional[int] = Query(None, ge=1, le=6),
+    pos: Optional[str] = Query(None, description="part of speech"),
+    limit: int = Query(20, ge=1, le=100),
+    sentences: bool = Query(True, description="also search sample sentences"),
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
+    """Substring search over words and sample sentences.
+
+    Matches Korean, English and romanization; every whitespace-separated
+    term must match. Results are ranked by BM25 with matches highlighted.
+    """
+    async with db_cm as db:
+        words = await search_words(db, q, topik_level, pos, limit)
+        sentence_hits = (
+            await search_sentences(db, q, topik_level, pos, limit)
+            if sentences
+            else []
+        )
+    return SearchResponse(query=q, words=words, sentences=sentence_hits)
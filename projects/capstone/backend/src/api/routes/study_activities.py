@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 # Removed unused AsyncSession import
 from sqlalchemy import select
-from ...database import get_db
+from ...database import get_db, get_read_db
 from contextlib import asynccontextmanager  # Added import
 from ...models.study_activity import StudyActivity
 from ...models.study_session import StudySession
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/study_activities", tags=["study_activities"])
 
 @router.get("/{id}")
 async def get_study_activity(
-    id: int, db_cm: asynccontextmanager = Depends(get_db)
+    id: int, db_cm: asynccontextmanager = Depends(get_read_db)
 ):
     """Get a study activity by ID"""
     async with db_cm as db:
@@ -35,7 +35,7 @@ async def get_activity_sessions(
     id: int,
     skip: int = 0,
     limit: int = 100,
-    db_cm: asynccontextmanager = Depends(get_db),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
     """Get all study sessions for a study activity"""
     async with db_cm as db:
@@ -86,7 +86,9 @@ async def create_study_activity(
 
 
 @router.get("")
-async def get_study_activities(db_cm: asynccontextmanager = Depends(get_db)):
+async def get_study_activities(
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
     """Get all study activities"""
     async with db_cm as db:
         query = select(StudyActivity)
@@ -3,9 +3,12 @@ from fastapi import APIRouter, Depends, HTTPException
 
 # Removed unused AsyncSession import
 from sqlalchemy import select
-from typing import List
+from typing import List, Union
 from datetime import datetime
-from ...database import get_db
+from ...cache import response_cache
+from ...database import get_db, get_read_db
+from ...db import rollups
+from ..pagination import Pagination, pagination_params, paginate, page_response
 from contextlib import asynccontextmanager  # Added import
 from ...models.study_session import StudySession
 from ...models.session_stats import SessionStats
@@ -15,23 +18,30 @@ from ...schemas.study_session import (
     StudySessionResponse,
 )
 from ...schemas.session_stats import SessionStatsResponse, SessionStatsBase
+from ...schemas.pagination import CursorPage
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sessions", tags=["study_sessions"])
 
 
-@router.get("", response_model=List[StudySessionResponse])
+@router.get(
+    "",
+    response_model=Union[
+        List[StudySessionResponse], CursorPage[StudySessionResponse]
+    ],
+)
 async def list_sessions(
-    skip: int = 0,
-    limit: int = 100,
-    db_cm: asynccontextmanager = Depends(get_db),
+    pagination: Pagination = Depends(pagination_params),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
-    """List all study sessions with pagination"""
+    """List all study sessions with offset or cursor pagination"""
     async with db_cm as db:
-        query = select(StudySession).offset(skip).limit(limit)
+        query = paginate(select(StudySession), pagination, StudySession.id)
         result = await db.execute(query)
-        return result.scalars().all()
+        return page_response(
+            result.scalars().all(), pagination, lambda session: [session.id]
+        )
 
 
 @router.post("", response_model=StudySessionResponse, status_code=201)
@@ -47,6 +57,9 @@ async def start_session(
             # Create session
             db_session = StudySession(**session.dict())
             db.add(db_session)
+            await rollups.bump(
+                db, rollups.SESSIONS_STARTED, db_session.started_at
+            )
             await db.commit()
             await db.refresh(db_session)
 
@@ -54,6 +67,7 @@ async def start_session(
             stats = SessionStats(session_id=db_session.id)
             db.add(stats)
             await db.commit()  # Commit again for stats
+            await response_cache.invalidate("stats")
 
             logger.info(f"Session {db_session.id} created successfully")
             await db.refresh(
@@ -118,9 +132,13 @@ async def delete_session(
             raise HTTPException(status_code=404, detail="Session not found")
 
         try:
+            await rollups.bump(
+                db, rollups.SESSIONS_STARTED, session.started_at, delta=-1
+            )
             # Note: Cascading deletes should handle related stats, logs etc. if configured in models
             await db.delete(session)
             await db.commit()
+            await response_cache.invalidate("stats")
             return {"message": f"Session {session_id} deleted successfully"}
         except Exception as e:
             await db.rollback()
@@ -132,7 +150,7 @@ async def delete_session(
 
 @router.get("/{session_id}/stats", response_model=SessionStatsResponse)
 async def get_session_stats(
-    session_id: int, db_cm: asynccontextmanager = Depends(get_db)
+    session_id: int, db_cm: asynccontextmanager = Depends(get_read_db)
 ):
     """Get statistics for a study session"""
     async with db_cm as db:
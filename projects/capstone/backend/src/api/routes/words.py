@@ -1,17 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import select
-from typing import List
-from ...database import get_db
+from typing import List, Union
+from ...cache import response_cache
+from ...database import get_db, get_read_db
+from ...db import rollups
+from ...db.search import autocomplete_words
+from ...db.bulk_import import DEFAULT_BATCH_SIZE, import_words, parse_payload
+from ..pagination import Pagination, pagination_params, paginate, page_response
 from contextlib import asynccontextmanager
 from ...models.word import Word
 from ...models.sample_sentence import SampleSentence
 from ...models.word_stats import WordStats
-from ...schemas.word import WordCreate, WordUpdate, WordResponse
+from ...models.activity_log import ActivityLog
+from ...models.wrong_input import WrongInput
+from ...schemas.word import (
+    WordCreate,
+    WordUpdate,
+    WordResponse,
+    WordBulkResult,
+)
 from ...schemas.sample_sentence import (
     SampleSentenceCreate,
     SampleSentenceResponse,
 )
 from ...schemas.word_stats import WordStatsResponse, WordStatsUpdate
+from ...schemas.pagination import CursorPage
+from ...schemas.search import WordSuggestion
 import logging
 
 router = APIRouter(prefix="/words", tags=["words"])
@@ -20,21 +34,42 @@ router = APIRouter(prefix="/words", tags=["words"])
 logger = logging.getLogger(__name__)
 
 
-@router.get("", response_model=List[WordResponse])
+@router.get(
+    "", response_model=Union[List[WordResponse], CursorPage[WordResponse]]
+)
 async def list_words(
-    skip: int = 0,
-    limit: int = 100,
-    db_cm: asynccontextmanager = Depends(get_db),
+    pagination: Pagination = Depends(pagination_params),
+    db_cm: asynccontextmanager = Depends(get_read_db),
 ):
-    """List all words with pagination"""
+    """List all words with offset or cursor pagination"""
     async with db_cm as db:
-        query = select(Word).offset(skip).limit(limit)
+        query = paginate(select(Word), pagination, Word.id)
         result = await db.execute(query)
-        return result.scalars().all()
+        return page_response(
+            result.scalars().all(), pagination, lambda word: [word.id]
+        )
+
+
+@router.get("/autocomplete", response_model=List[WordSuggestion])
+async def autocomplete(
+    prefix: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(10, ge=1, le=50),
+    db_cm: asynccontextmanager = Depends(get_read_db),
+):
+    """Suggestions for a partially typed Korean word.
+
+    Accepts unfinished syllables (하 -> 한국) and initial consonants
+    only (ㅎㄱ -> 한국, 학교).
+    """
+    async with db_cm as db:
+        return await autocomplete_words(db, prefix, limit)
 
 
 @router.get("/{word_id}", response_model=WordResponse)
-async def get_word(word_id: int, db_cm: asynccontextmanager = Depends(get_db)):
+@response_cache.cached(tags=["word:{word_id}"], response_model=WordResponse)
+async def get_word(
+    word_id: int, db_cm: asynccontextmanager = Depends(get_read_db)
+):
     """Get a single word by ID"""
     async with db_cm as db:
         result = await db.execute(select(Word).filter(Word.id == word_id))
@@ -53,8 +88,10 @@ async def create_word(
         db_word = Word(**word.dict())
         db.add(db_word)
         try:
+            await rollups.bump(db, rollups.WORDS_ADDED, db_word.created_at)
             await db.commit()
             await db.refresh(db_word)
+            await response_cache.invalidate("stats")
             # Consider creating WordStats here too if it should always exist
             return db_word
         except Exception as e:  # Catch potential IntegrityError for duplicates
@@ -73,6 +110,46 @@ async def create_word(
             ) from e
 
 
+@router.post("/bulk", response_model=WordBulkResult)
+async def bulk_create_words(
+    request: Request,
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=5000),
+    added_by_agent: str | None = None,
+    db_cm: asynccontextmanager = Depends(get_db),
+):
+    """Import many words with nested sample sentences and groups.
+
+    Accepts a JSON array or NDJSON (one word object per line). Rows are
+    inserted in batches inside one transaction; invalid or duplicate rows
+    are reported in `conflicts` without aborting the import.
+    """
+    body = (await request.body()).decode("utf-8")
+    try:
+        rows = list(parse_payload(body))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async with db_cm as db:
+        try:
+            result = await import_words(
+                db, rows, batch_size=batch_size, added_by=added_by_agent
+            )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Bulk word import failed: {e}")
+            raise HTTPException(
+                status_code=500, detail="Failed to import words"
+            ) from e
+        await response_cache.invalidate("stats", "groups")
+
+    logger.info(
+        f"Bulk import: {result.inserted} words, {result.sentences} "
+        f"sentences, {len(result.conflicts)} conflicts"
+    )
+    return result
+
+
 @router.put("/{word_id}", response_model=WordResponse)
 async def update_word(
     word_id: int,
@@ -92,6 +169,7 @@ async def update_word(
         try:
             await db.commit()
             await db.refresh(db_word)
+            await response_cache.invalidate(f"word:{word_id}", "groups")
             return db_word
         except Exception as e:
             await db.rollback()
@@ -116,9 +194,25 @@ async def delete_word(
             raise HTTPException(status_code=404, detail="Word not found")
 
         try:
+            # Take cascaded logs, mistakes and stats out of the rollups first
+            await rollups.subtract_rows(
+                db, rollups.ACTIVITY, ActivityLog.word_id == word_id
+            )
+            await rollups.subtract_rows(
+                db, rollups.MISTAKES, WrongInput.word_id == word_id
+            )
+            await rollups.subtract_rows(
+                db, rollups.SRS_DUE, WordStats.word_id == word_id
+            )
+            await rollups.bump(
+                db, rollups.WORDS_ADDED, word.created_at, delta=-1
+            )
             # Cascading deletes should handle related sentences, stats, group maps etc.
             await db.delete(word)
             await db.commit()
+            await response_cache.invalidate(
+                f"word:{word_id}", "groups", "stats"
+            )
             return {"message": f"Word {word_id} deleted successfully"}
         except Exception as e:
             await db.rollback()
@@ -135,8 +229,11 @@ async def delete_word(
 @router.get(
     "/{word_id}/sentences", response_model=List[SampleSentenceResponse]
 )
+@response_cache.cached(
+    tags=["word:{word_id}"], response_model=List[SampleSentenceResponse]
+)
 async def get_word_sentences(
-    word_id: int, db_cm: asynccontextmanager = Depends(get_db)
+    word_id: int, db_cm: asynccontextmanager = Depends(get_read_db)
 ):
     """Get all sample sentences for a word"""
     async with db_cm as db:
@@ -176,6 +273,7 @@ async def add_word_sentence(
         try:
             await db.commit()
             await db.refresh(db_sentence)
+            await response_cache.invalidate(f"word:{word_id}")
             return db_sentence
         except Exception as e:
             await db.rollback()
@@ -183,6 +281,12 @@ async def add_word_sentence(
 
             logger = logging.getLogger(__name__)
             logger.error(f"Failed to add sentence for word {word_id}: {e}")
+
+            if "UNIQUE constraint failed" in str(e):
+                raise HTTPException(
+                    status_code=409,
+                    detail="Sentence already exists for this word",
+                )
             raise HTTPException(
                 status_code=500, detail="Failed to add sentence"
             ) from e
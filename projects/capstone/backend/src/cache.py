@@ -0,0 +1,223 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Protocol, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from .config import CACHE_ENABLED, CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized responses.
+
+    The in-process `MemoryBackend` is the default; anything implementing
+    these coroutines (e.g. a Redis-backed store shared by several workers)
+    can be passed to `ResponseCache` instead.
+    """
+
+    async def get(self, key: str) -> Any: ...
+
+    async def set(
+        self, key: str, value: Any, ttl: float, tags: Iterable[str]
+    ) -> None: ...
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int: ...
+
+    async def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryBackend:
+    """TTL + LRU dictionary with a tag -> keys index"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any, Set[str]]]" = (
+            OrderedDict()
+        )
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _drop(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                self._drop(key)
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(
+        self, key: str, value: Any, ttl: float, tags: Iterable[str]
+    ) -> None:
+        tags = set(tags)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys |= self._tags.get(tag, set())
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: float = CACHE_TTL_SECONDS,
+        enabled: bool = CACHE_ENABLED,
+    ):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        # Bumped by invalidate()/clear(): a response computed while one of
+        # its tags moved may predate the write, so it isn't stored
+        self._generations: Dict[str, int] = {}
+        self._clears = 0
+
+    def _generation(self, tags: Iterable[str]) -> tuple:
+        return (self._clears,) + tuple(
+            self._generations.get(tag, 0) for tag in tags
+        )
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every cached response carrying any of `tags`"""
+        if not self.enabled or not tags:
+            return
+        for tag in tags:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+        dropped = await self.backend.invalidate_tags(tags)
+        self.invalidated += dropped
+        if dropped:
+            logger.debug(f"Cache invalidated {dropped} entries for {tags}")
+
+    async def clear(self) -> None:
+        self._clears += 1
+        await self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidated": self.invalidated,
+            "evictions": getattr(self.backend, "evictions", None),
+        }
+
+    def cached(
+        self,
+        tags: Iterable[str] = (),
+        response_model: Any = None,
+        ttl: Optional[float] = None,
+        exclude: Iterable[str] = ("db_cm",),
+    ):
+        """Cache a route's serialized response.
+
+        The key is the route name plus its (non-dependency) arguments.
+        `tags` are format strings filled from those arguments, e.g.
+        ``"word:{word_id}"``, and are what write routes invalidate.
+        Pass the route's `response_model` so nested attributes (such as
+        relationships) are serialized exactly as FastAPI would.
+        """
+        tags = tuple(tags)
+        exclude = set(exclude)
+        adapter = TypeAdapter(response_model) if response_model else None
+
+        def serialize(result):
+            if adapter is not None:
+                validated = adapter.validate_python(
+                    result, from_attributes=True
+                )
+                return adapter.dump_python(validated, mode="json")
+            return jsonable_encoder(result)
+
+        def decorator(func):
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return await func(*args, **kwargs)
+
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                params = {
+                    name: value
+                    for name, value in bound.arguments.items()
+                    if name not in exclude
+                }
+                key = f"{func.__module__}.{func.__name__}:" + ",".join(
+                    f"{name}={params[name]!r}" for name in sorted(params)
+                )
+
+                value = await self.backend.get(key)
+                if value is not _MISSING:
+                    self.hits += 1
+                    return value
+
+                self.misses += 1
+                key_tags = [tag.format(**params) for tag in tags]
+                generation = self._generation(key_tags)
+                value = serialize(await func(*args, **kwargs))
+                if self._generation(key_tags) == generation:
+                    await self.backend.set(
+                        key, value, self.ttl if ttl is None else ttl, key_tags
+                    )
+                return value
+
+            return wrapper
+
+        return decorator
+
+
+response_cache = ResponseCache()
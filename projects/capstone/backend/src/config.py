@@ -7,6 +7,52 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 # Database configurations
 SQLITE_DB_PATH = os.getenv("SQLITE_DB_PATH", "/app/data/hagxwon.db")
 print(f"Using database at: {SQLITE_DB_PATH}")
+
+# SQLite engine profile: "production" applies the pragmas and pool limits
+# below, "default" keeps stock aiosqlite settings (useful for comparisons)
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "production")
+SQLITE_ECHO = os.getenv("SQLITE_ECHO", "false").lower() == "true"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Negative cache_size is in KiB rather than pages (-65536 = 64 MiB)
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+# SQLite allows a single writer, so a small write pool avoids lock churn
+SQLITE_WRITE_POOL_SIZE = int(os.getenv("SQLITE_WRITE_POOL_SIZE", "2"))
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+SQLITE_POOL_TIMEOUT = float(os.getenv("SQLITE_POOL_TIMEOUT", "30"))
+# In-process response cache for read-heavy endpoints
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+# Request timing and slow request warnings are always on. The ?_profile=1
+# report (and SQL text in Server-Timing) is for local debugging only: it
+# shows statements to any client, so it is off unless enabled here
+REQUEST_PROFILING = os.getenv("REQUEST_PROFILING", "false").lower() == "true"
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+# Skip create_all/seed checks when app_metadata says nothing changed, and
+# seed in the background so the server answers health checks right away
+FAST_STARTUP = os.getenv("FAST_STARTUP", "true").lower() == "true"
+BACKGROUND_SEED = os.getenv("BACKGROUND_SEED", "true").lower() == "true"
+# Seed files and how many processes parse them (0 = parse inline)
+SEED_DATA_DIR = os.getenv("SEED_DATA_DIR", "assets/data/processed")
+SEED_WORKERS = int(os.getenv("SEED_WORKERS", "0"))
+# Background admin jobs: concurrent jobs, threads for blocking DB/file
+# work, finished jobs kept for polling, and where export jobs write
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_THREADS = int(os.getenv("JOB_THREADS", "2"))
+JOB_HISTORY = int(os.getenv("JOB_HISTORY", "100"))
+EXPORT_DIR = os.getenv(
+    "EXPORT_DIR", str(Path(SQLITE_DB_PATH).parent / "exports")
+)
+# Columnar analytics snapshot: where it is kept and how often it is
+# refreshed (0 = only on POST /api/analytics/refresh)
+ANALYTICS_DIR = os.getenv(
+    "ANALYTICS_DIR", str(Path(SQLITE_DB_PATH).parent / "analytics")
+)
+ANALYTICS_REFRESH_SECONDS = float(
+    os.getenv("ANALYTICS_REFRESH_SECONDS", "900")
+)
+
 VECTOR_DB_PATH = str(PROJECT_ROOT / "database" / "vector_store")
 
 # Model configurations
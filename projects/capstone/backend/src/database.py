@@ -1,9 +1,21 @@
 from pathlib import Path
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from contextlib import asynccontextmanager
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
-from .config import SQLITE_DB_PATH
+from .config import (
+    SQLITE_DB_PATH,
+    SQLITE_PROFILE,
+    SQLITE_ECHO,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE,
+    SQLITE_WRITE_POOL_SIZE,
+    SQLITE_READ_POOL_SIZE,
+    SQLITE_POOL_TIMEOUT,
+)
+from .db import search  # noqa: F401  (registers the FTS5 index DDL)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,16 +24,74 @@ logger = logging.getLogger(__name__)
 data_dir = Path(SQLITE_DB_PATH).parent
 data_dir.mkdir(parents=True, exist_ok=True)
 
-# Create async engine
+PRODUCTION_PROFILE = SQLITE_PROFILE == "production"
+
+
+def _engine_options(pool_size: int) -> dict:
+    if not PRODUCTION_PROFILE:
+        return {}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": 0,
+        "pool_timeout": SQLITE_POOL_TIMEOUT,
+        # Python-level wait for the SQLite lock, in seconds
+        "connect_args": {"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+    }
+
+
+def _apply_pragmas(dbapi_connection, read_only: bool = False):
+    cursor = dbapi_connection.cursor()
+    try:
+        if not read_only:
+            # WAL lets readers run alongside the single writer
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+# Create async engine (read/write)
 engine = create_async_engine(
-    f"sqlite+aiosqlite:///{SQLITE_DB_PATH}", echo=True, future=True
+    f"sqlite+aiosqlite:///{SQLITE_DB_PATH}",
+    echo=SQLITE_ECHO,
+    future=True,
+    **_engine_options(SQLITE_WRITE_POOL_SIZE),
+)
+
+# Separate pool for GET routes so reads never queue behind writers
+read_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{SQLITE_DB_PATH}",
+    echo=SQLITE_ECHO,
+    future=True,
+    **_engine_options(SQLITE_READ_POOL_SIZE),
 )
 
+if PRODUCTION_PROFILE:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        _apply_pragmas(dbapi_connection)
+
+    @event.listens_for(read_engine.sync_engine, "connect")
+    def _on_read_connect(dbapi_connection, connection_record):
+        _apply_pragmas(dbapi_connection, read_only=True)
+
+
 # Create async session factory
 async_session_factory = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+read_session_factory = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
 # # Corrected dependency for routes
 # async def get_db() -> AsyncSession:
@@ -32,15 +102,26 @@ async_session_factory = sessionmaker(
 @asynccontextmanager
 async def get_db():
     try:
-        logger.info("Creating database session...")
+        logger.debug("Creating database session...")
         async with async_session_factory() as session:
             yield session
-            logger.info("Database session closed.")
+            logger.debug("Database session closed.")
     except Exception as e:
         logger.exception(f"Error with database session: {e}")
         raise
 
 
+@asynccontextmanager
+async def get_read_db():
+    """Read-only session for GET routes (PRAGMA query_only)"""
+    try:
+        async with read_session_factory() as session:
+            yield session
+    except Exception as e:
+        logger.exception(f"Error with read-only database session: {e}")
+        raise
+
+
 # Database initialization
 async def init_db():
     async with engine.begin() as conn:
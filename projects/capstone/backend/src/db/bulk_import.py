@@ -0,0 +1,207 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import rollups
+from ..models.associations import word_group_map
+from ..models.group import WordGroup
+from ..models.sample_sentence import SampleSentence
+from ..models.word import Word
+from ..schemas.word import WordBulkConflict, WordBulkItem, WordBulkResult
+
+DEFAULT_BATCH_SIZE = 500
+
+words_table = Word.__table__
+sentences_table = SampleSentence.__table__
+groups_table = WordGroup.__table__
+
+
+def parse_payload(text: str) -> Iterator[Any]:
+    """Yield raw rows from a JSON array or NDJSON document"""
+    stripped = text.lstrip()
+    if not stripped:
+        return
+    if stripped[0] == "[":
+        rows = json.loads(stripped)
+        yield from rows
+        return
+    for line_no, line in enumerate(stripped.splitlines(), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_no}: {e}") from e
+
+
+def _batches(
+    rows: Iterable[Tuple[int, WordBulkItem]], size: int
+) -> Iterator[List[Tuple[int, WordBulkItem]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _resolve_groups(
+    db: AsyncSession, names: Iterable[str], result: WordBulkResult
+) -> Dict[str, int]:
+    names = sorted(set(names))
+    if not names:
+        return {}
+    existing = await db.execute(
+        select(WordGroup.name, WordGroup.id).where(WordGroup.name.in_(names))
+    )
+    group_ids = {name: group_id for name, group_id in existing.all()}
+
+    missing = [name for name in names if name not in group_ids]
+    if missing:
+        now = datetime.utcnow()
+        created = await db.execute(
+            insert(groups_table).returning(
+                groups_table.c.name,
+                groups_table.c.id,
+                sort_by_parameter_order=True,
+            ),
+            [
+                {
+                    "name": name,
+                    "source_type": "bulk_import",
+                    "created_at": now,
+                    "is_editable": True,
+                }
+                for name in missing
+            ],
+        )
+        group_ids.update(dict(created.all()))
+        result.groups_created += len(missing)
+    return group_ids
+
+
+async def import_words(
+    db: AsyncSession,
+    rows: Iterable[Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    added_by: str | None = None,
+) -> WordBulkResult:
+    """Insert words with their sentences and group links in batches.
+
+    Every batch is written with executemany-style core inserts. Rows that
+    fail validation or whose (korean, english) pair already exists (in the
+    database or earlier in the payload) are reported as conflicts and
+    skipped, the rest of the batch still goes in. Homonyms such as 배/pear
+    and 배/boat are separate words, as they are for POST /words. Nothing is committed here, so the
+    caller decides whether the whole import is one transaction.
+    """
+    result = WordBulkResult()
+    seen = set()
+
+    def valid_rows() -> Iterator[Tuple[int, WordBulkItem]]:
+        for index, raw in enumerate(rows):
+            try:
+                item = WordBulkItem.model_validate(raw)
+            except ValidationError as e:
+                korean = raw.get("korean") if isinstance(raw, dict) else None
+                result.conflicts.append(
+                    WordBulkConflict(
+                        index=index,
+                        korean=korean,
+                        reason=f"invalid: {e.errors()[0]['msg']}",
+                    )
+                )
+                continue
+            if (item.korean, item.english) in seen:
+                result.conflicts.append(
+                    WordBulkConflict(
+                        index=index,
+                        korean=item.korean,
+                        reason="duplicate in payload",
+                    )
+                )
+                continue
+            seen.add((item.korean, item.english))
+            yield index, item
+
+    for batch in _batches(valid_rows(), batch_size):
+        # Filtering on korean alone still uses ux_words_korean_english
+        existing = await db.execute(
+            select(Word.korean, Word.english).where(
+                Word.korean.in_({item.korean for _, item in batch})
+            )
+        )
+        existing_pairs = set(existing.tuples().all())
+        fresh = []
+        for index, item in batch:
+            if (item.korean, item.english) in existing_pairs:
+                result.conflicts.append(
+                    WordBulkConflict(
+                        index=index,
+                        korean=item.korean,
+                        reason="word already exists",
+                    )
+                )
+            else:
+                fresh.append(item)
+        if not fresh:
+            continue
+
+        now = datetime.utcnow()
+        word_fields = set(WordBulkItem.model_fields) - {
+            "sample_sentences",
+            "groups",
+        }
+        word_rows = []
+        for item in fresh:
+            row = item.model_dump(include=word_fields)
+            row["source_type"] = row["source_type"] or "bulk_import"
+            row["added_by_agent"] = row["added_by_agent"] or added_by
+            row["created_at"] = now
+            word_rows.append(row)
+
+        inserted = await db.execute(
+            insert(words_table).returning(
+                words_table.c.id, sort_by_parameter_order=True
+            ),
+            word_rows,
+        )
+        word_ids = inserted.scalars().all()
+        result.inserted += len(word_ids)
+        await rollups.bump(db, rollups.WORDS_ADDED, now, delta=len(word_ids))
+
+        sentence_rows = [
+            {"word_id": word_id, **sentence.model_dump()}
+            for word_id, item in zip(word_ids, fresh)
+            for sentence in item.sample_sentences
+        ]
+        if sentence_rows:
+            # A word can't carry the same sentence twice (unique index)
+            await db.execute(
+                insert(sentences_table).prefix_with("OR IGNORE"),
+                sentence_rows,
+            )
+            result.sentences += len(sentence_rows)
+
+        group_ids = await _resolve_groups(
+            db, (name for item in fresh for name in item.groups), result
+        )
+        link_rows = [
+            {"word_id": word_id, "group_id": group_ids[name]}
+            for word_id, item in zip(word_ids, fresh)
+            for name in set(item.groups)
+        ]
+        if link_rows:
+            await db.execute(
+                word_group_map.insert().prefix_with("OR IGNORE"), link_rows
+            )
+            result.group_links += len(link_rows)
+
+    return result
@@ -0,0 +1,186 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.activity_log import ActivityLog
+from ..models.sample_sentence import SampleSentence
+from ..models.word import Word
+from ..models.word_stats import WordStats
+from ..models.wrong_input import WrongInput
+
+DEFAULT_CHUNK_SIZE = 1000
+
+WORD_COLUMNS = [
+    Word.id,
+    Word.korean,
+    Word.english,
+    Word.part_of_speech,
+    Word.romanization,
+    Word.topik_level,
+    Word.source_type,
+    Word.source_details,
+    Word.added_by_agent,
+    Word.created_at,
+    WordStats.times_seen,
+    WordStats.times_correct,
+    WordStats.current_streak,
+    WordStats.last_seen_at,
+    WordStats.next_due_at,
+    WordStats.ease_factor,
+    WordStats.interval_days,
+]
+
+ACTIVITY_COLUMNS = [
+    ActivityLog.id,
+    ActivityLog.session_id,
+    ActivityLog.word_id,
+    Word.korean,
+    ActivityLog.activity_type,
+    ActivityLog.correct,
+    ActivityLog.score,
+    ActivityLog.timestamp,
+]
+
+MISTAKE_COLUMNS = [
+    WrongInput.id,
+    WrongInput.word_id,
+    Word.korean,
+    Word.english,
+    WrongInput.input_text,
+    WrongInput.timestamp,
+]
+
+
+def _words_query(since: Optional[datetime]):
+    query = select(*WORD_COLUMNS).outerjoin(
+        WordStats, WordStats.word_id == Word.id
+    )
+    if since is not None:
+        # New words plus words whose review state changed since then
+        query = query.where(
+            or_(Word.created_at >= since, WordStats.last_seen_at >= since)
+        )
+    return query.order_by(Word.id)
+
+
+def _activity_query(since: Optional[datetime]):
+    query = select(*ACTIVITY_COLUMNS).join(
+        Word, Word.id == ActivityLog.word_id
+    )
+    if since is not None:
+        query = query.where(ActivityLog.timestamp >= since)
+    return query.order_by(ActivityLog.id)
+
+
+def _mistakes_query(since: Optional[datetime]):
+    query = select(*MISTAKE_COLUMNS).join(Word, Word.id == WrongInput.word_id)
+    if since is not None:
+        query = query.where(WrongInput.timestamp >= since)
+    return query.order_by(WrongInput.id)
+
+
+EXPORTS = {
+    "words": (_words_query, WORD_COLUMNS),
+    "activity": (_activity_query, ACTIVITY_COLUMNS),
+    "mistakes": (_mistakes_query, MISTAKE_COLUMNS),
+}
+
+
+def field_names(kind: str) -> List[str]:
+    names = [column.key for column in EXPORTS[kind][1]]
+    if kind == "words":
+        names.append("sample_sentences")
+    return names
+
+
+async def count_rows(
+    db: AsyncSession, kind: str, since: Optional[datetime] = None
+) -> int:
+    build_query, _ = EXPORTS[kind]
+    subquery = build_query(since).order_by(None).subquery()
+    result = await db.execute(select(func.count()).select_from(subquery))
+    return result.scalar_one()
+
+
+async def _sentences_for(
+    db: AsyncSession, word_ids: Sequence[int]
+) -> Dict[int, List[dict]]:
+    result = await db.execute(
+        select(
+            SampleSentence.word_id,
+            SampleSentence.sentence_korean,
+            SampleSentence.sentence_english,
+        )
+        .where(SampleSentence.word_id.in_(word_ids))
+        .order_by(SampleSentence.id)
+    )
+    sentences = {}
+    for word_id, korean, english in result.all():
+        sentences.setdefault(word_id, []).append(
+            {"sentence_korean": korean, "sentence_english": english}
+        )
+    return sentences
+
+
+async def iter_rows(
+    db: AsyncSession,
+    kind: str,
+    since: Optional[datetime] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[List[dict]]:
+    """Yield export rows in chunks of at most `chunk_size` dicts.
+
+    The query is streamed with a server-side cursor (`yield_per`), so only
+    one chunk is held in memory at a time. Word rows carry their sample
+    sentences, fetched with one IN query per chunk.
+    """
+    build_query, _ = EXPORTS[kind]
+    query = build_query(since).execution_options(yield_per=chunk_size)
+    result = await db.stream(query)
+    async for partition in result.partitions():
+        rows = [dict(row._mapping) for row in partition]
+        if kind == "words":
+            sentences = await _sentences_for(db, [row["id"] for row in rows])
+            for row in rows:
+                row["sample_sentences"] = sentences.get(row["id"], [])
+        yield rows
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def to_ndjson(rows: List[dict]) -> str:
+    return "".join(
+        json.dumps(row, ensure_ascii=False, default=_json_default) + "\n"
+        for row in rows
+    )
+
+
+def to_csv(rows: List[dict], fields: List[str], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    if header:
+        writer.writeheader()
+    for row in rows:
+        if "sample_sentences" in row:
+            # Nested sentences don't fit a flat row, keep them as JSON
+            row["sample_sentences"] = json.dumps(
+                row["sample_sentences"], ensure_ascii=False
+            )
+        writer.writerow(
+            {
+                key: (
+                    value.isoformat() if isinstance(value, datetime) else value
+                )
+                for key, value in row.items()
+            }
+        )
+    return buffer.getvalue()
@@ -1,73 +1,107 @@
 import sqlite3
 import logging
 from pathlib import Path
+from typing import Callable, Dict, Optional
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
-from ..database import engine
+from ..config import SQLITE_BUSY_TIMEOUT_MS
+from ..database import engine, async_session_factory
+from ..models.activity_log import ActivityLog
+from ..models.app_metadata import AppMetadata
+from ..models.session_stats import SessionStats
+from ..models.study_session import StudySession
+from . import rollups, search
 
 # from ..models.word_review_item import WordReviewItem
 
 
-def reset_all():
-    logging.basicConfig(filename="database.log", level=logging.ERROR)
-    """Reset the entire database and reinitialize with initial data."""
+def reset_all(
+    progress: Optional[Callable[[float, str], None]] = None,
+) -> Dict[str, int]:
+    """Delete every row from the model tables.
+
+    Blocking (plain sqlite3), so run it in a thread; the admin reset job
+    does. The FTS5 index tables are not touched directly, they are
+    rebuilt afterwards, and app_metadata is kept. Reseeding is up to the
+    caller. Returns the number of rows deleted per table.
+    """
     try:
-        conn = sqlite3.connect(str(Path(engine.url.database)))
-        cursor = conn.cursor()
-
-        # Get all tables
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name NOT LIKE 'sqlite_%'
-        """
+        tables = [
+            table.name
+            for table in reversed(SQLModel.metadata.sorted_tables)
+            if table.name != AppMetadata.__tablename__
+        ]
+        conn = sqlite3.connect(
+            str(Path(engine.url.database)),
+            timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
         )
-        tables = cursor.fetchall()
-
-        # Delete data from each table
-        for table in tables:
-            table_name = table[0]
-            cursor.execute(f"DELETE FROM {table_name}")
-
-        conn.commit()
-        conn.close()
-
-        # Reinitialize the database with initial data
-        import asyncio
-
-        asyncio.run(init_db(drop_existing=False))
+        try:
+            existing = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+            deleted = {}
+            with conn:
+                for done, table_name in enumerate(tables, start=1):
+                    if table_name in existing:
+                        cursor = conn.execute(f"DELETE FROM {table_name}")
+                        deleted[table_name] = cursor.rowcount
+                    if progress:
+                        progress(done / len(tables), table_name)
+                if "words_fts" in existing:
+                    for statement in search.REBUILD_DDL:
+                        conn.execute(statement)
+        finally:
+            conn.close()
+        return deleted
     except Exception as e:
         raise Exception(f"Database error: {e}")
 
 
-def reset_session(session_id: int):
-    logging.basicConfig(filename="database.log", level=logging.ERROR)
-    """Reset a specific study session."""
-    try:
-        conn = sqlite3.connect(str(Path(engine.url.database)))
-        cursor = conn.cursor()
+class SessionNotFoundError(LookupError):
+    """Raised by reset_session for an unknown session id"""
 
-        # Check if session exists
-        cursor.execute(
-            "SELECT id FROM study_sessions WHERE id = ?", (session_id,)
-        )
-        if not cursor.fetchone():
-            raise ValueError(f"Session {session_id} not found")
 
-        # Delete related data
-        cursor.execute(
-            "DELETE FROM activity_logs WHERE session_id = ?", (session_id,)
-        )
-        cursor.execute(
-            "DELETE FROM session_stats WHERE session_id = ?", (session_id,)
-        )
-        cursor.execute(
-            "DELETE FROM study_sessions WHERE id = ?", (session_id,)
-        )
+async def reset_session(session_id: int):
+    """Reset a specific study session.
 
-        conn.commit()
-        conn.close()
+    The session's activity logs and its start come out of the daily
+    rollups in the same transaction as the deletes. Raises
+    SessionNotFoundError when there is no such session.
+    """
+    try:
+        async with async_session_factory() as db:
+            # Check if session exists
+            session = await db.get(StudySession, session_id)
+            if session is None:
+                raise SessionNotFoundError(f"Session {session_id} not found")
+
+            await rollups.subtract_rows(
+                db, rollups.ACTIVITY, ActivityLog.session_id == session_id
+            )
+            await rollups.subtract_rows(
+                db, rollups.SESSIONS_STARTED, StudySession.id == session_id
+            )
+
+            # Delete related data
+            await db.execute(
+                delete(ActivityLog).where(ActivityLog.session_id == session_id)
+            )
+            await db.execute(
+                delete(SessionStats).where(
+                    SessionStats.session_id == session_id
+                )
+            )
+            await db.execute(
+                delete(StudySession).where(StudySession.id == session_id)
+            )
+            await db.commit()
+    except SessionNotFoundError:
+        raise
     except Exception as e:
         raise Exception(f"Database error: {e}")
 
@@ -105,3 +139,26 @@ async def init_db(drop_existing: bool = False):
 
         # Seed the database with initial data
         await seed_db(conn)
+
+
+async def rebuild_rollups():
+    """Backfill (or rebuild) the daily rollups from the source tables."""
+    async with async_session_factory() as db:
+        written = await rollups.rebuild(db)
+        await db.commit()
+    return written
+
+
+if __name__ == "__main__":
+    import asyncio
+    import sys
+
+    commands = {"rebuild-rollups": rebuild_rollups}
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        print("Usage: python -m src.db.init_db <command>")
+        print("Available commands:")
+        print("  rebuild-rollups   Backfill daily_rollups from source tables")
+        sys.exit(1)
+
+    result = asyncio.run(commands[sys.argv[1]]())
+    print(f"{sys.argv[1]}: {result}")
@@ -0,0 +1,128 @@
+"""Admin jobs run by the background job queue (src.jobs).
+
+Each handler receives a JobContext to report progress and a dict of
+params from ``POST /api/admin/jobs``.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+from sqlalchemy import select, text, update
+
+from ..cache import response_cache
+from ..config import EXPORT_DIR
+from ..database import get_db, get_read_db
+from ..jobs import JobContext, job_queue
+from ..models.word import Word
+from ..utils.hangul import search_keys
+from . import rollups
+from .export import count_rows, field_names, iter_rows, to_csv, to_ndjson
+from .init_db import reset_all
+from .search import rebuild_index
+from .startup import ensure_seeded
+
+logger = logging.getLogger(__name__)
+
+EXPORT_KINDS = ("words", "activity", "mistakes")
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+@job_queue.register("reset")
+async def reset_job(ctx: JobContext, params: Dict[str, Any]) -> dict:
+    """Delete all data, then reseed unless ``seed`` is false"""
+    seed = params.get("seed", True)
+    share = 0.5 if seed else 1.0
+    deleted = await ctx.run_blocking(
+        reset_all,
+        lambda fraction, table: ctx.progress(
+            fraction * share, f"Cleared {table}"
+        ),
+    )
+    await response_cache.clear()
+    if seed:
+        ctx.progress(share, "Reseeding")
+        await ensure_seeded(force=True)
+        await response_cache.clear()
+    return {"deleted": deleted, "seeded": seed}
+
+
+@job_queue.register("reseed")
+async def reseed_job(ctx: JobContext, params: Dict[str, Any]) -> dict:
+    """Re-apply the seed files (an upsert, existing data is kept)"""
+    ctx.progress(0.0, "Seeding")
+    await ensure_seeded(force=True)
+    await response_cache.clear()
+    return {"seeded": True}
+
+
+@job_queue.register("reindex")
+async def reindex_job(ctx: JobContext, params: Dict[str, Any]) -> dict:
+    """Rebuild derived data: search index, Hangul keys and rollups"""
+    async with get_db() as db:
+        ctx.progress(0.0, "Rebuilding search index")
+        await rebuild_index(db)
+
+        ctx.progress(0.3, "Backfilling Hangul keys")
+        result = await db.execute(
+            select(Word.id, Word.korean).where(
+                Word.korean_jamo.is_(None) | Word.korean_chosung.is_(None)
+            )
+        )
+        missing = [
+            {"id": word_id, **search_keys(korean)}
+            for word_id, korean in result.all()
+        ]
+        if missing:
+            await db.execute(update(Word), missing)
+
+        ctx.progress(0.5, "Rebuilding rollups")
+        rollup_rows = await rollups.rebuild(db)
+
+        ctx.progress(0.8, "Updating query planner statistics")
+        await db.execute(text("ANALYZE"))
+        await db.commit()
+    await response_cache.clear()
+    return {"hangul_keys": len(missing), "rollups": rollup_rows}
+
+
+@job_queue.register("export")
+async def export_job(ctx: JobContext, params: Dict[str, Any]) -> dict:
+    """Write an export file to EXPORT_DIR (``kind``, ``format``, ``since``)"""
+    kind = params.get("kind", "words")
+    fmt = params.get("format", "ndjson")
+    if kind not in EXPORT_KINDS:
+        raise ValueError(f"kind must be one of {', '.join(EXPORT_KINDS)}")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    since = params.get("since")
+    if since is not None:
+        since = datetime.fromisoformat(since)
+
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    path = Path(EXPORT_DIR) / f"{kind}-{stamp}-{ctx.job.id[:8]}.{fmt}"
+    await ctx.run_blocking(path.parent.mkdir, parents=True, exist_ok=True)
+    fields = field_names(kind)
+
+    exported = 0
+    f = await ctx.run_blocking(open, path, "w", encoding="utf-8", newline="")
+    try:
+        if fmt == "csv":
+            await ctx.run_blocking(f.write, to_csv([], fields, header=True))
+        async with get_read_db() as db:
+            total = await count_rows(db, kind, since)
+            async for rows in iter_rows(db, kind, since):
+                chunk = (
+                    to_csv(rows, fields) if fmt == "csv" else to_ndjson(rows)
+                )
+                await ctx.run_blocking(f.write, chunk)
+                exported += len(rows)
+                ctx.progress(
+                    exported / total if total else 1.0,
+                    f"Exported {exported} of {total} rows",
+                )
+    finally:
+        await ctx.run_blocking(f.close)
+    logger.info(f"Exported {exported} {kind} rows to {path}")
+    return {"path": str(path), "rows": exported, "format": fmt}
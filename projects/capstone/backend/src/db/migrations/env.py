@@ -15,6 +15,8 @@ from src.models.word_stats import WordStats
 from src.models.wrong_input import WrongInput
 from src.models.study_activity import StudyActivity
 from src.models.word_review_item import WordReviewItem
+from src.models.daily_rollup import DailyRollup
+from src.models.app_metadata import AppMetadata
 
 from src.config import SQLITE_DB_PATH
 
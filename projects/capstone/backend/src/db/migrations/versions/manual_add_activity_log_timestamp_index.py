@@ -0,0 +1,30 @@
+"""Index activity_logs.timestamp for bucketed dashboard aggregates
+
+Revision ID: manual_activity_log_ts_index
+Revises: manual_add_group_type
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_activity_log_ts_index"
+down_revision: Union[str, None] = "manual_add_group_type"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_activity_logs_timestamp",
+        "activity_logs",
+        ["timestamp"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activity_logs_timestamp", table_name="activity_logs")
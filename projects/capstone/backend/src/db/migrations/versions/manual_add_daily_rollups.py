@@ -0,0 +1,41 @@
+"""Add daily_rollups table
+
+Revision ID: manual_add_daily_rollups
+Revises: manual_activity_log_ts_index
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_add_daily_rollups"
+down_revision: Union[str, None] = "manual_activity_log_ts_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column(
+            "metric", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column(
+            "dimension", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "metric", "dimension"),
+    )
+    # Existing rows are backfilled on the next app startup
+    # (db.startup.ensure_rollups), or with:
+    #     python -m src.db.init_db rebuild-rollups
+
+
+def downgrade() -> None:
+    op.drop_table("daily_rollups")
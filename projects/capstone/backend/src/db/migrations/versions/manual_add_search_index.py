@@ -0,0 +1,47 @@
+"""FTS5 trigram search index over words and sample sentences
+
+Revision ID: manual_add_search_index
+Revises: manual_add_seed_natural_keys
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.db.search import DROP_DDL, REBUILD_DDL, SEARCH_DDL
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_add_search_index"
+down_revision: Union[str, None] = "manual_add_seed_natural_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Dropping the FTS tables doesn't drop these: they are on words and
+# sample_sentences, which stay
+TRIGGERS = [
+    "words_fts_ai",
+    "words_fts_ad",
+    "words_fts_au",
+    "sample_sentences_fts_ai",
+    "sample_sentences_fts_ad",
+    "sample_sentences_fts_au",
+]
+
+
+def upgrade() -> None:
+    # The same DDL create_all runs (src.db.search), so migrated and freshly
+    # created databases can't drift apart
+    for statement in SEARCH_DDL:
+        op.execute(statement)
+    # Index the rows that already exist
+    for statement in REBUILD_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    for statement in DROP_DDL:
+        op.execute(statement)
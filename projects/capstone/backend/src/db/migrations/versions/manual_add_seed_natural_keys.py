@@ -0,0 +1,77 @@
+"""Unique natural keys for idempotent seed upserts
+
+Revision ID: manual_add_seed_natural_keys
+Revises: manual_add_app_metadata
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_add_seed_natural_keys"
+down_revision: Union[str, None] = "manual_add_app_metadata"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNIQUE_INDEXES = [
+    ("ux_words_korean_english", "words", ["korean", "english"]),
+    ("ux_word_groups_name", "word_groups", ["name"]),
+    (
+        "ux_sample_sentences_word_sentence",
+        "sample_sentences",
+        ["word_id", "sentence_korean"],
+    ),
+    (
+        "ux_word_group_map_word_group",
+        "word_group_map",
+        ["word_id", "group_id"],
+    ),
+]
+
+
+def _assert_no_duplicates(table: str, columns: Sequence[str]) -> None:
+    key = ", ".join(columns)
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                f"SELECT {key}, COUNT(*) FROM {table} "
+                f"GROUP BY {key} HAVING COUNT(*) > 1 LIMIT 5"
+            )
+        )
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"Cannot add unique index on {table}({key}); merge these "
+            f"duplicates first: {duplicates}"
+        )
+
+
+def upgrade() -> None:
+    # Duplicate group links carry no information, drop them
+    op.execute(
+        "DELETE FROM word_group_map WHERE rowid NOT IN ("
+        "SELECT MIN(rowid) FROM word_group_map GROUP BY word_id, group_id)"
+    )
+    # Duplicate sentences for the same word are dropped the same way
+    op.execute(
+        "DELETE FROM sample_sentences WHERE id NOT IN ("
+        "SELECT MIN(id) FROM sample_sentences "
+        "GROUP BY word_id, sentence_korean)"
+    )
+    # Words and groups may be referenced elsewhere, so refuse to guess
+    _assert_no_duplicates("words", ["korean", "english"])
+    _assert_no_duplicates("word_groups", ["name"])
+
+    for name, table, columns in UNIQUE_INDEXES:
+        op.create_index(name, table, columns, unique=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(UNIQUE_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,52 @@
+"""Jamo and chosung keys on words for autocomplete
+
+Revision ID: manual_add_word_hangul_keys
+Revises: manual_add_search_index
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.utils.hangul import search_keys
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_add_word_hangul_keys"
+down_revision: Union[str, None] = "manual_add_search_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "words", sa.Column("korean_jamo", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "words", sa.Column("korean_chosung", sa.String(), nullable=True)
+    )
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, korean FROM words")).all()
+    if rows:
+        bind.execute(
+            sa.text(
+                "UPDATE words SET korean_jamo = :korean_jamo, "
+                "korean_chosung = :korean_chosung WHERE id = :id"
+            ),
+            [{"id": id, **search_keys(korean)} for id, korean in rows],
+        )
+
+    op.create_index("ix_words_korean_jamo", "words", ["korean_jamo"])
+    op.create_index(
+        "ix_words_korean_chosung", "words", ["korean_chosung", "korean_jamo"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_words_korean_chosung", table_name="words")
+    op.drop_index("ix_words_korean_jamo", table_name="words")
+    op.drop_column("words", "korean_chosung")
+    op.drop_column("words", "korean_jamo")
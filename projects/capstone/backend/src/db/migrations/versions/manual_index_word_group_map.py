@@ -0,0 +1,29 @@
+"""Index word_group_map foreign keys for grouped word counts
+
+Revision ID: manual_index_word_group_map
+Revises: manual_add_daily_rollups
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_index_word_group_map"
+down_revision: Union[str, None] = "manual_add_daily_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_word_group_map_word_id", "word_group_map", ["word_id"])
+    op.create_index(
+        "ix_word_group_map_group_id", "word_group_map", ["group_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_word_group_map_group_id", table_name="word_group_map")
+    op.drop_index("ix_word_group_map_word_id", table_name="word_group_map")
@@ -0,0 +1,29 @@
+"""Composite (next_due_at, word_id) index for the SRS review queue
+
+Revision ID: manual_index_word_stats_due
+Revises: manual_index_wrong_inputs
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_index_word_stats_due"
+down_revision: Union[str, None] = "manual_index_wrong_inputs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_word_stats_next_due_at_word_id",
+        "word_stats",
+        ["next_due_at", "word_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_word_stats_next_due_at_word_id", table_name="word_stats")
@@ -0,0 +1,31 @@
+"""Composite index for newest-first pagination of a word's mistakes
+
+Revision ID: manual_index_wrong_inputs
+Revises: manual_index_word_group_map
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "manual_index_wrong_inputs"
+down_revision: Union[str, None] = "manual_index_word_group_map"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_wrong_inputs_word_id_timestamp",
+        "wrong_inputs",
+        ["word_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_wrong_inputs_word_id_timestamp", table_name="wrong_inputs"
+    )
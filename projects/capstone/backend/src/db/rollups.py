@@ -0,0 +1,171 @@
+from datetime import date, datetime
+from typing import Dict, Optional, Union
+
+from sqlalchemy import String, delete, func, literal, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .aggregates import day_buckets
+from ..models.activity_log import ActivityLog
+from ..models.daily_rollup import DailyRollup
+from ..models.study_session import StudySession
+from ..models.word import Word
+from ..models.word_stats import WordStats
+from ..models.wrong_input import WrongInput
+
+ACTIVITY = "activity"
+WORDS_ADDED = "words_added"
+SESSIONS_STARTED = "sessions_started"
+MISTAKES = "mistakes"
+SRS_DUE = "srs_due"
+
+# metric -> (day column, dimension column or None)
+ROLLUP_SOURCES = {
+    ACTIVITY: (ActivityLog.timestamp, ActivityLog.activity_type),
+    WORDS_ADDED: (Word.created_at, None),
+    SESSIONS_STARTED: (StudySession.started_at, None),
+    MISTAKES: (WrongInput.timestamp, None),
+    SRS_DUE: (WordStats.next_due_at, None),
+}
+
+
+def _as_day(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+async def bump(
+    db: AsyncSession,
+    metric: str,
+    when: Optional[Union[date, datetime]],
+    dimension: str = "",
+    delta: int = 1,
+) -> None:
+    """Add `delta` to the rollup bucket for `when`.
+
+    Runs inside the caller's session so the rollup commits (or rolls back)
+    together with the row it counts.
+    """
+    if when is None or delta == 0:
+        return
+    stmt = insert(DailyRollup).values(
+        day=_as_day(when), metric=metric, dimension=dimension, count=delta
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["day", "metric", "dimension"],
+        set_={"count": DailyRollup.count + stmt.excluded.count},
+    )
+    await db.execute(stmt)
+
+
+async def bump_many(
+    db: AsyncSession,
+    metric: str,
+    deltas: Dict[date, int],
+    dimension: str = "",
+) -> None:
+    """Apply several per-day deltas with one executemany upsert"""
+    params = [
+        {"day": day, "metric": metric, "dimension": dimension, "count": delta}
+        for day, delta in deltas.items()
+        if day is not None and delta
+    ]
+    if not params:
+        return
+    stmt = insert(DailyRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["day", "metric", "dimension"],
+        set_={"count": DailyRollup.count + stmt.excluded.count},
+    )
+    await db.execute(stmt, params)
+
+
+async def subtract_rows(db: AsyncSession, metric: str, *filters) -> None:
+    """Remove the rows matching `filters` from `metric`'s rollups.
+
+    Used before deletes (including ORM cascades) so the rollups stay in
+    step with the source table.
+    """
+    day_column, dimension_column = ROLLUP_SOURCES[metric]
+    day = func.date(day_column, type_=String)
+    dimension = (
+        dimension_column if dimension_column is not None else literal("")
+    )
+    result = await db.execute(
+        select(day, dimension, func.count())
+        .where(day_column.is_not(None), *filters)
+        .group_by(day, dimension)
+    )
+    for day_value, dimension_value, count in result.all():
+        await bump(
+            db,
+            metric,
+            date.fromisoformat(day_value),
+            dimension_value or "",
+            delta=-count,
+        )
+
+
+async def rebuild(db: AsyncSession) -> Dict[str, int]:
+    """Recompute every rollup from the source tables.
+
+    Returns the number of rollup rows written per metric. The caller is
+    responsible for committing.
+    """
+    await db.execute(delete(DailyRollup))
+    written = {}
+    for metric, (day_column, dimension_column) in ROLLUP_SOURCES.items():
+        day = func.date(day_column, type_=String)
+        dimension = (
+            dimension_column if dimension_column is not None else literal("")
+        )
+        source = (
+            select(day, literal(metric), dimension, func.count())
+            .where(day_column.is_not(None))
+            .group_by(day, dimension)
+        )
+        result = await db.execute(
+            insert(DailyRollup).from_select(
+                ["day", "metric", "dimension", "count"], source
+            )
+        )
+        written[metric] = result.rowcount
+    return written
+
+
+async def daily_totals(
+    db: AsyncSession,
+    metric: str,
+    days: int = 7,
+    forward: bool = False,
+    today: Optional[date] = None,
+) -> Dict[str, int]:
+    """Read per-day totals for `metric` from the rollups.
+
+    Same shape as `aggregates.count_by_day` but touches at most
+    days x dimensions rollup rows instead of scanning the source table.
+    """
+    buckets = day_buckets(days, today=today, forward=forward)
+    result = await db.execute(
+        select(DailyRollup.day, func.sum(DailyRollup.count))
+        .where(
+            DailyRollup.metric == metric,
+            DailyRollup.day >= min(buckets),
+            DailyRollup.day <= max(buckets),
+        )
+        .group_by(DailyRollup.day)
+    )
+    counts = {day: total for day, total in result.all()}
+    return {day.isoformat(): counts.get(day, 0) for day in buckets}
+
+
+async def dimension_totals(db: AsyncSession, metric: str) -> Dict[str, int]:
+    """Read all-time totals for `metric` per dimension, largest first"""
+    total = func.sum(DailyRollup.count)
+    result = await db.execute(
+        select(DailyRollup.dimension, total)
+        .where(DailyRollup.metric == metric)
+        .group_by(DailyRollup.dimension)
+        .having(total > 0)
+        .order_by(total.desc())
+    )
+    return {dimension: count for dimension, count in result.all()}
@@ -0,0 +1,367 @@
+"""FTS5 search index over words and sample sentences.
+
+Two external-content FTS5 tables use the trigram tokenizer, so any
+substring of three or more characters matches (Hangul has no word
+boundaries a unicode61 tokenizer could use). Triggers keep them in step
+with ``words`` and ``sample_sentences``. Queries shorter than three
+characters can't use trigrams and fall back to a LIKE scan.
+
+Highlights and snippets are HTML: the stored text is escaped and only
+the ``<mark>`` tags around matches are markup.
+"""
+
+import html
+import logging
+import re
+from typing import List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from ..utils.hangul import decompose, is_chosung, normalize, prefix_range
+
+logger = logging.getLogger(__name__)
+
+MIN_TRIGRAM_LENGTH = 3
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+# Placeholders FTS5 wraps matches in, swapped for the tags once the text
+# around them is escaped (control characters don't occur in word data)
+_MARK_OPEN = "\x02"
+_MARK_CLOSE = "\x03"
+
+SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+        korean, english, romanization,
+        content='words', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS sample_sentences_fts USING fts5(
+        sentence_korean, sentence_english,
+        content='sample_sentences', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_ai AFTER INSERT ON words BEGIN
+        INSERT INTO words_fts(rowid, korean, english, romanization)
+        VALUES (new.id, new.korean, new.english, new.romanization);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_ad AFTER DELETE ON words BEGIN
+        INSERT INTO words_fts(words_fts, rowid, korean, english, romanization)
+        VALUES ('delete', old.id, old.korean, old.english, old.romanization);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_au
+    AFTER UPDATE OF korean, english, romanization ON words BEGIN
+        INSERT INTO words_fts(words_fts, rowid, korean, english, romanization)
+        VALUES ('delete', old.id, old.korean, old.english, old.romanization);
+        INSERT INTO words_fts(rowid, korean, english, romanization)
+        VALUES (new.id, new.korean, new.english, new.romanization);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS sample_sentences_fts_ai
+    AFTER INSERT ON sample_sentences BEGIN
+        INSERT INTO sample_sentences_fts(
+            rowid, sentence_korean, sentence_english
+        )
+        VALUES (new.id, new.sentence_korean, new.sentence_english);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS sample_sentences_fts_ad
+    AFTER DELETE ON sample_sentences BEGIN
+        INSERT INTO sample_sentences_fts(
+            sample_sentences_fts, rowid, sentence_korean, sentence_english
+        )
+        VALUES (
+            'delete', old.id, old.sentence_korean, old.sentence_english
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS sample_sentences_fts_au
+    AFTER UPDATE OF sentence_korean, sentence_english
+    ON sample_sentences BEGIN
+        INSERT INTO sample_sentences_fts(
+            sample_sentences_fts, rowid, sentence_korean, sentence_english
+        )
+        VALUES (
+            'delete', old.id, old.sentence_korean, old.sentence_english
+        );
+        INSERT INTO sample_sentences_fts(
+            rowid, sentence_korean, sentence_english
+        )
+        VALUES (new.id, new.sentence_korean, new.sentence_english);
+    END
+    """,
+]
+
+DROP_DDL = [
+    "DROP TABLE IF EXISTS words_fts",
+    "DROP TABLE IF EXISTS sample_sentences_fts",
+]
+
+REBUILD_DDL = [
+    "INSERT INTO words_fts(words_fts) VALUES ('rebuild')",
+    "INSERT INTO sample_sentences_fts(sample_sentences_fts) "
+    "VALUES ('rebuild')",
+]
+
+# Part of the schema fingerprint (src.db.startup), so a database created
+# before the index existed gets it on the next boot
+SQLModel.metadata.info.setdefault("extra_ddl", []).extend(SEARCH_DDL)
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_search_index(target, connection, **kw):
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master "
+        "WHERE type = 'table' AND name = 'words_fts'"
+    ).scalar()
+    for statement in SEARCH_DDL:
+        connection.exec_driver_sql(statement)
+    if not exists:
+        # Index rows that were there before the triggers
+        for statement in REBUILD_DDL:
+            connection.exec_driver_sql(statement)
+        logger.info("Created FTS5 search index.")
+
+
+@event.listens_for(SQLModel.metadata, "after_drop")
+def _drop_search_index(target, connection, **kw):
+    # The triggers go with their tables; the index tables would go stale
+    for statement in DROP_DDL:
+        connection.exec_driver_sql(statement)
+
+
+async def rebuild_index(db: AsyncSession) -> None:
+    for statement in REBUILD_DDL:
+        await db.execute(text(statement))
+
+
+def _match_expression(terms: List[str]) -> str:
+    # Each term is a quoted phrase (substring for trigrams); all must match
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%")
+    return "%" + escaped.replace("_", "\\_") + "%"
+
+
+def _marked_html(value: Optional[str]) -> Optional[str]:
+    """Escape text carrying _MARK_OPEN/_MARK_CLOSE, then turn those into
+    the highlight tags"""
+    if not value:
+        return value
+    return (
+        html.escape(value)
+        .replace(_MARK_OPEN, HIGHLIGHT_OPEN)
+        .replace(_MARK_CLOSE, HIGHLIGHT_CLOSE)
+    )
+
+
+def highlight(value: Optional[str], terms: List[str]) -> Optional[str]:
+    """Escaped `value` with occurrences of `terms` wrapped the way the
+    FTS5 queries below return them"""
+    if not value:
+        return value
+    value = value.replace(_MARK_OPEN, "").replace(_MARK_CLOSE, "")
+    pattern = re.compile(
+        "|".join(re.escape(term) for term in terms), re.IGNORECASE
+    )
+    return _marked_html(
+        pattern.sub(
+            lambda match: _MARK_OPEN + match.group(0) + _MARK_CLOSE, value
+        )
+    )
+
+
+def _filters(topik_level: Optional[int], pos: Optional[str]) -> str:
+    clauses = []
+    if topik_level is not None:
+        clauses.append("w.topik_level = :topik_level")
+    if pos is not None:
+        clauses.append("w.part_of_speech = :pos")
+    return "".join(f" AND {clause}" for clause in clauses)
+
+
+async def search_words(
+    db: AsyncSession,
+    q: str,
+    topik_level: Optional[int] = None,
+    pos: Optional[str] = None,
+    limit: int = 20,
+) -> List[dict]:
+    """Words matching every term of `q`, best match first.
+
+    Exact Korean matches come first, then BM25 with Korean weighted over
+    English and romanization.
+    """
+    terms = q.split()
+    if not terms:
+        return []
+    params = {
+        "q": q.strip(),
+        "topik_level": topik_level,
+        "pos": pos,
+        "limit": limit,
+    }
+    columns = (
+        "w.id, w.korean, w.english, w.romanization, w.part_of_speech, "
+        "w.topik_level"
+    )
+
+    if all(len(term) >= MIN_TRIGRAM_LENGTH for term in terms):
+        params["match"] = _match_expression(terms)
+        mark = f"'{_MARK_OPEN}', '{_MARK_CLOSE}'"
+        query = f"""
+            SELECT {columns},
+                highlight(words_fts, 0, {mark}) AS korean_highlight,
+                highlight(words_fts, 1, {mark}) AS english_highlight,
+                highlight(words_fts, 2, {mark}) AS romanization_highlight,
+                bm25(words_fts, 10.0, 5.0, 2.0) AS score
+            FROM words_fts
+            JOIN words w ON w.id = words_fts.rowid
+            WHERE words_fts MATCH :match{_filters(topik_level, pos)}
+            ORDER BY w.korean = :q DESC, score
+            LIMIT :limit
+        """
+        result = await db.execute(text(query), params)
+        rows = [dict(row._mapping) for row in result]
+        for row in rows:
+            for column in ("korean", "english", "romanization"):
+                key = f"{column}_highlight"
+                row[key] = _marked_html(row[key])
+        return rows
+
+    conditions = []
+    for index, term in enumerate(terms):
+        params[f"p{index}"] = _like_pattern(term)
+        conditions.append(
+            "("
+            + " OR ".join(
+                f"w.{column} LIKE :p{index} ESCAPE '\\'"
+                for column in ("korean", "english", "romanization")
+            )
+            + ")"
+        )
+    query = f"""
+        SELECT {columns}
+        FROM words w
+        WHERE {" AND ".join(conditions)}{_filters(topik_level, pos)}
+        ORDER BY w.korean = :q DESC, length(w.korean), w.id
+        LIMIT :limit
+    """
+    result = await db.execute(text(query), params)
+    rows = []
+    for row in result:
+        row = dict(row._mapping)
+        for column in ("korean", "english", "romanization"):
+            row[f"{column}_highlight"] = highlight(row[column], terms)
+        row["score"] = None
+        rows.append(row)
+    return rows
+
+
+async def search_sentences(
+    db: AsyncSession,
+    q: str,
+    topik_level: Optional[int] = None,
+    pos: Optional[str] = None,
+    limit: int = 20,
+) -> List[dict]:
+    """Sample sentences matching every term of `q`, with snippets"""
+    terms = q.split()
+    if not terms:
+        return []
+    params = {"topik_level": topik_level, "pos": pos, "limit": limit}
+    columns = (
+        "s.id, s.word_id, w.korean AS word_korean, "
+        "s.sentence_korean, s.sentence_english"
+    )
+
+    if all(len(term) >= MIN_TRIGRAM_LENGTH for term in terms):
+        params["match"] = _match_expression(terms)
+        mark = f"'{_MARK_OPEN}', '{_MARK_CLOSE}', '…', 12"
+        query = f"""
+            SELECT {columns},
+                snippet(sample_sentences_fts, 0, {mark}) AS korean_snippet,
+                snippet(sample_sentences_fts, 1, {mark}) AS english_snippet,
+                bm25(sample_sentences_fts) AS score
+            FROM sample_sentences_fts
+            JOIN sample_sentences s ON s.id = sample_sentences_fts.rowid
+            JOIN words w ON w.id = s.word_id
+            WHERE sample_sentences_fts MATCH :match{_filters(topik_level, pos)}
+            ORDER BY score
+            LIMIT :limit
+        """
+        result = await db.execute(text(query), params)
+        rows = [dict(row._mapping) for row in result]
+        for row in rows:
+            for key in ("korean_snippet", "english_snippet"):
+                row[key] = _marked_html(row[key])
+        return rows
+
+    conditions = []
+    for index, term in enumerate(terms):
+        params[f"p{index}"] = _like_pattern(term)
+        conditions.append(
+            f"(s.sentence_korean LIKE :p{index} ESCAPE '\\' "
+            f"OR s.sentence_english LIKE :p{index} ESCAPE '\\')"
+        )
+    query = f"""
+        SELECT {columns}
+        FROM sample_sentences s
+        JOIN words w ON w.id = s.word_id
+        WHERE {" AND ".join(conditions)}{_filters(topik_level, pos)}
+        ORDER BY length(s.sentence_korean), s.id
+        LIMIT :limit
+    """
+    result = await db.execute(text(query), params)
+    rows = []
+    for row in result:
+        row = dict(row._mapping)
+        row["korean_snippet"] = highlight(row["sentence_korean"], terms)
+        row["english_snippet"] = highlight(row["sentence_english"], terms)
+        row["score"] = None
+        rows.append(row)
+    return rows
+
+
+async def autocomplete_words(
+    db: AsyncSession, prefix: str, limit: int = 10
+) -> List[dict]:
+    """Words whose Korean starts with `prefix` as typed so far.
+
+    `prefix` may end in an unfinished syllable (하 -> 한국) or be initial
+    consonants only (ㅎㄱ -> 한국). Either way it is a range scan over
+    the precomputed keys on ``words``, returned in jamo order.
+    """
+    prefix = normalize(prefix).strip()
+    if not prefix:
+        return []
+    if is_chosung(prefix):
+        column, order = "korean_chosung", "korean_chosung, korean_jamo"
+        low, high = prefix_range(prefix)
+    else:
+        column, order = "korean_jamo", "korean_jamo"
+        low, high = prefix_range(decompose(prefix))
+    query = f"""
+        SELECT id, korean, english, romanization, part_of_speech, topik_level
+        FROM words
+        WHERE {column} >= :low AND {column} < :high
+        ORDER BY {order}, id
+        LIMIT :limit
+    """
+    result = await db.execute(
+        text(query), {"low": low, "high": high, "limit": limit}
+    )
+    return [dict(row._mapping) for row in result]
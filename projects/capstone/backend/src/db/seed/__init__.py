@@ -1,31 +1,47 @@
 import logging
 from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession
+from ...config import SEED_DATA_DIR, SEED_WORKERS
 from ...database import get_db
 from .words import load_words
 from .sentences import load_sentences
 from .groups import load_groups
+from .pipeline import SeedFiles, SeedResult, run_seed
 
 logger = logging.getLogger(__name__)
 
+# Bump when the bundled seed data changes so startup re-runs the seed
+# (it upserts, so existing rows are kept and only changes are applied)
+SEED_DATA_VERSION = "2"
 
-async def seed_all():
-    """Run all seeding operations in correct order"""
+
+async def seed_all(
+    data_dir: str = SEED_DATA_DIR, workers: int = SEED_WORKERS
+) -> SeedResult:
+    """Parse all seed files once and upsert words, sentences and groups"""
     async with get_db() as db:
         try:
             start_time = datetime.now()
             logger.info("Starting database seeding...")
 
-            # Pass db session to each seed function
-            await load_words(db)
-            await load_sentences(db)
-            await load_groups(db)
+            result = await run_seed(
+                db, SeedFiles.in_dir(data_dir), workers=workers
+            )
 
             duration = (datetime.now() - start_time).total_seconds()
             logger.info(f"Seeding completed in {duration:.2f} seconds")
+            return result
         except Exception as e:
+            await db.rollback()
             logger.error(f"Seeding failed: {str(e)}")
             raise
 
 
-__all__ = ["load_words", "load_sentences", "load_groups", "seed_all"]
+__all__ = [
+    "load_words",
+    "load_sentences",
+    "load_groups",
+    "seed_all",
+    "SeedFiles",
+    "SeedResult",
+    "SEED_DATA_VERSION",
+]
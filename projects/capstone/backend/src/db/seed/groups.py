@@ -1,80 +1,163 @@
 import json
 from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+
 from ...models.group import WordGroup
-from ...models.word import Word, word_group_map
+from ...models.word import word_group_map
+from ...models.word import Word
+from .words import WordKey, batched, upsert_words, word_id_map
+
+GROUPS_FILE = "word_groups.json"
+
+groups_table = WordGroup.__table__
+
+
+def parse_groups(path: str) -> List[dict]:
+    """Read the processed group file into groups with their word entries"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    groups = []
+    for group_name, group_info in data["groups"].items():
+        words = []
+        for word_obj in group_info.get("words", []):
+            hangul = word_obj.get("hangul")
+            english = word_obj.get("english")
+            if not hangul or not english:
+                print(f"⚠️ Skipping invalid word: {word_obj}")
+                continue
+            words.append(
+                {
+                    "korean": hangul,
+                    "english": (
+                        ", ".join(english)
+                        if isinstance(english, list)
+                        else str(english)
+                    ),
+                    "romanization": word_obj.get("romanization"),
+                    "part_of_speech": "noun",
+                }
+            )
+        groups.append(
+            {
+                "name": group_name,
+                "description": group_info.get("description"),
+                "source_type": group_info.get("source_type"),
+                "source_details": group_info.get("source_details"),
+                "words": words,
+            }
+        )
+    return groups
+
+
+def _korean_ids(word_ids: Dict[WordKey, int]) -> Dict[str, int]:
+    # Group files only name the hangul; link the lowest id for each form
+    by_korean = {}
+    for (korean, _), word_id in sorted(
+        word_ids.items(), key=lambda item: item[1]
+    ):
+        by_korean.setdefault(korean, word_id)
+    return by_korean
+
+
+async def upsert_groups(
+    db: AsyncSession,
+    groups: List[dict],
+    word_ids: Dict[WordKey, int],
+) -> Tuple[int, int]:
+    """Upsert groups by name, add words they reference, link both.
+
+    Words a group mentions that aren't in the database yet are created
+    (``group_generated``). Links use ON CONFLICT DO NOTHING so reruns only
+    add what's new. Returns (groups, links) sent.
+    """
+    korean_ids = _korean_ids(word_ids)
+    missing = {}
+    for group in groups:
+        for word in group["words"]:
+            if word["korean"] not in korean_ids:
+                missing.setdefault(group["name"], {})[word["korean"]] = word
+    for group_name, words in missing.items():
+        await upsert_words(
+            db,
+            words.values(),
+            source_type="group_generated",
+            source_details=f"auto from group: {group_name}",
+            added_by_agent="seed_script",
+            update_existing=False,
+        )
+    if missing:
+        new_korean = {korean for words in missing.values() for korean in words}
+        result = await db.execute(
+            select(Word.korean, Word.id)
+            .where(Word.korean.in_(new_korean))
+            .order_by(Word.id)
+        )
+        for korean, word_id in result.all():
+            korean_ids.setdefault(korean, word_id)
+
+    stmt = insert(groups_table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={
+            column: stmt.excluded[column]
+            for column in ("description", "source_type", "source_details")
+        },
+    )
+    now = datetime.utcnow()
+    group_rows = [
+        {
+            "name": group["name"],
+            "description": group["description"],
+            "source_type": group["source_type"],
+            "source_details": group["source_details"],
+            "created_at": now,
+            "is_editable": True,
+        }
+        for group in groups
+    ]
+    if group_rows:
+        await db.execute(stmt, group_rows)
+
+    names = [group["name"] for group in groups]
+    result = await db.execute(
+        select(WordGroup.name, WordGroup.id).where(WordGroup.name.in_(names))
+    )
+    group_ids = dict(result.all())
+
+    link_stmt = insert(word_group_map).on_conflict_do_nothing(
+        index_elements=["word_id", "group_id"]
+    )
+    links = 0
+    for batch in batched(
+        {
+            "word_id": korean_ids[word["korean"]],
+            "group_id": group_ids[group["name"]],
+        }
+        for group in groups
+        for word in group["words"]
+    ):
+        await db.execute(link_stmt, batch)
+        links += len(batch)
+    return len(group_rows), links
 
 
 async def load_groups(
-    db: AsyncSession, db_path: str = "assets/data/processed/word_groups.json"
+    db: AsyncSession, db_path: str = f"assets/data/processed/{GROUPS_FILE}"
 ) -> None:
     """Seed database with word groups and their word associations"""
     try:
         print("\n🌱 Loading word groups...")
         start_time = datetime.now()
 
-        with open(db_path, "r", encoding="utf-8") as f:
-            groups_data = json.load(f)
-
-        # Load all existing words (map: korean -> Word object)
-        existing_words = await db.execute(select(Word))
-        word_lookup = {word.korean: word for word in existing_words.scalars()}
-
-        group_count = 0
-        link_count = 0
-
-        for group_name, group_info in groups_data["groups"].items():
-            db_group = WordGroup(
-                name=group_name,
-                description=group_info.get("description"),
-                source_type=group_info.get("source_type"),
-                source_details=group_info.get("source_details"),
-            )
-            db.add(db_group)
-            await db.flush()
-
-            word_ids = []
-            for word_obj in group_info.get("words", []):
-                hangul = word_obj.get("hangul")
-                english = word_obj.get("english")
-                romanization = word_obj.get("romanization")
-
-                if not hangul or not english:
-                    print(f"⚠️ Skipping invalid word: {word_obj}")
-                    continue
-
-                # Insert missing words
-                if hangul not in word_lookup:
-                    new_word = Word(
-                        korean=hangul,
-                        english=(
-                            ", ".join(english)
-                            if isinstance(english, list)
-                            else str(english)
-                        ),
-                        part_of_speech="noun",
-                        romanization=romanization,
-                        source_type="group_generated",
-                        source_details=f"auto from group: {group_name}",
-                        added_by_agent="seed_script",
-                        created_at=datetime.utcnow(),
-                    )
-                    db.add(new_word)
-                    await db.flush()
-                    word_lookup[hangul] = new_word
-
-                word_ids.append(word_lookup[hangul].id)
-
-            if word_ids:
-                values = [
-                    {"word_id": wid, "group_id": db_group.id}
-                    for wid in word_ids
-                ]
-                await db.execute(word_group_map.insert(), values)
-                link_count += len(word_ids)
-
-            group_count += 1
-
+        groups = parse_groups(db_path)
+        group_count, link_count = await upsert_groups(
+            db, groups, await word_id_map(db)
+        )
         await db.commit()
 
         duration = (datetime.now() - start_time).total_seconds()
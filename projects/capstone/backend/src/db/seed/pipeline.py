@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import rollups
+from .groups import GROUPS_FILE, parse_groups, upsert_groups
+from .sentences import (
+    SENTENCES_FILE,
+    parse_sentences,
+    source_key_map,
+    upsert_sentences,
+)
+from .words import WORDS_FILE, parse_words, upsert_words, word_id_map
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SeedFiles:
+    words: str
+    sentences: str
+    groups: str
+
+    @classmethod
+    def in_dir(cls, data_dir: str) -> "SeedFiles":
+        base = Path(data_dir)
+        return cls(
+            words=str(base / WORDS_FILE),
+            sentences=str(base / SENTENCES_FILE),
+            groups=str(base / GROUPS_FILE),
+        )
+
+
+@dataclass
+class SeedData:
+    words: List[dict]
+    sentences: List[dict]
+    groups: List[dict]
+
+
+@dataclass
+class SeedResult:
+    words: int = 0
+    sentences: int = 0
+    groups: int = 0
+    group_links: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def rows(self) -> int:
+        return self.words + self.sentences + self.groups + self.group_links
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = sum(self.timings.values())
+        return self.rows / elapsed if elapsed else 0.0
+
+
+async def parse_seed_files(files: SeedFiles, workers: int = 0) -> SeedData:
+    """Parse every seed file exactly once.
+
+    With `workers` > 0 the files are parsed concurrently in a process
+    pool, which pays off once the JSON is large enough that decoding
+    outweighs pickling the rows back.
+    """
+    jobs = [
+        (parse_words, files.words),
+        (parse_sentences, files.sentences),
+        (parse_groups, files.groups),
+    ]
+    if workers > 0:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = await asyncio.gather(
+                *(loop.run_in_executor(pool, fn, path) for fn, path in jobs)
+            )
+    else:
+        parsed = [fn(path) for fn, path in jobs]
+    return SeedData(*parsed)
+
+
+async def write_seed_data(db: AsyncSession, data: SeedData) -> SeedResult:
+    """Upsert parsed seed data; safe to run again on a seeded database.
+
+    Word ids are resolved from one (korean, english) -> id map built after
+    the word upsert, instead of a lookup per sentence or group entry.
+    Nothing is committed here.
+    """
+    result = SeedResult()
+
+    started = time.perf_counter()
+    result.words = await upsert_words(db, data.words)
+    word_ids = await word_id_map(db)
+    result.timings["words"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result.sentences = await upsert_sentences(
+        db, data.sentences, source_key_map(data.words), word_ids
+    )
+    result.timings["sentences"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result.groups, result.group_links = await upsert_groups(
+        db, data.groups, word_ids
+    )
+    result.timings["groups"] = time.perf_counter() - started
+
+    # Seeds bypass the write routes, so backfill the rollups here
+    started = time.perf_counter()
+    await rollups.rebuild(db)
+    result.timings["rollups"] = time.perf_counter() - started
+    return result
+
+
+async def run_seed(
+    db: AsyncSession, files: SeedFiles, workers: int = 0
+) -> SeedResult:
+    started = time.perf_counter()
+    data = await parse_seed_files(files, workers=workers)
+    parse_seconds = time.perf_counter() - started
+
+    result = await write_seed_data(db, data)
+    await db.commit()
+    result.timings = {"parse": parse_seconds, **result.timings}
+    logger.info(
+        f"Seeded {result.words} words, {result.sentences} sentences, "
+        f"{result.groups} groups, {result.group_links} links "
+        f"({result.rows_per_second:,.0f} rows/s)"
+    )
+    return result
@@ -1,36 +1,92 @@
 import json
-from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+
 from ...models.sample_sentence import SampleSentence
+from .words import WordKey, batched, parse_words, word_id_map
+
+SENTENCES_FILE = "korean_sentences_2000.json"
+
+sentences_table = SampleSentence.__table__
+
+
+def parse_sentences(path: str) -> List[dict]:
+    """Read the processed sentence list.
+
+    ``word_id`` in the file is the ``id`` of an entry in the word list,
+    not a database id; it is resolved through the word's natural key.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [
+        {
+            "source_word_id": item["word_id"],
+            "sentence_korean": item["example_kr"],
+            "sentence_english": item["example_en"],
+        }
+        for item in data
+        if item.get("example_kr") and item.get("example_en")
+    ]
+
+
+async def upsert_sentences(
+    db: AsyncSession,
+    rows: Iterable[dict],
+    source_keys: Dict[object, WordKey],
+    word_ids: Dict[WordKey, int],
+) -> int:
+    """Insert sentences, skipping ones a word already has.
+
+    `source_keys` maps the word file's ids to (korean, english) and
+    `word_ids` maps those keys to database ids. Sentences whose word
+    can't be resolved are dropped. Returns the rows sent.
+    """
+    stmt = insert(sentences_table).on_conflict_do_nothing(
+        index_elements=["word_id", "sentence_korean"]
+    )
+    resolved = (
+        {
+            "word_id": word_ids.get(source_keys.get(row["source_word_id"])),
+            "sentence_korean": row["sentence_korean"],
+            "sentence_english": row["sentence_english"],
+        }
+        for row in rows
+    )
+    sent = 0
+    for batch in batched(row for row in resolved if row["word_id"]):
+        await db.execute(stmt, batch)
+        sent += len(batch)
+    return sent
+
+
+def source_key_map(word_rows: Iterable[dict]) -> Dict[object, WordKey]:
+    return {
+        row["source_id"]: (row["korean"], row["english"])
+        for row in word_rows
+        if row.get("source_id") is not None
+    }
 
 
 async def load_sentences(
     db: AsyncSession,
-    db_path: str = "assets/data/processed/korean_sentences_2000.json",
+    db_path: str = f"assets/data/processed/{SENTENCES_FILE}",
+    words_path: Optional[str] = None,
 ) -> None:
     """Seed database with sample sentences"""
+    words_path = words_path or db_path.replace(
+        SENTENCES_FILE, "korean_words_2000.json"
+    )
     try:
         print("\nLoading sample sentences...")
-        start_time = datetime.now()
-
-        with open(db_path, "r", encoding="utf-8") as f:
-            sentences_data = json.load(f)
-
-        for item in sentences_data:
-            sentence = SampleSentence(
-                word_id=item["word_id"],
-                sentence_korean=item["example_kr"],
-                sentence_english=item["example_en"],
-            )
-            db.add(sentence)
-        await db.commit()
-
-        end_time = datetime.now()
-        print(f"Successfully loaded {len(sentences_data)} sentences")
-        print(
-            f"Duration: {(end_time - start_time).total_seconds():.2f} seconds"
+        rows = parse_sentences(db_path)
+        source_keys = source_key_map(parse_words(words_path))
+        sent = await upsert_sentences(
+            db, rows, source_keys, await word_id_map(db)
         )
-
+        await db.commit()
+        print(f"Successfully loaded {sent} sentences")
     except Exception as e:
         print(f"Error loading sentences: {str(e)}")
         raise
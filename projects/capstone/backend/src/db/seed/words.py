@@ -1,34 +1,131 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+
 from ...models.word import Word
 
+WORDS_FILE = "korean_words_2000.json"
+BATCH_SIZE = 1000
 
-async def load_words(db: AsyncSession) -> None:
-    """Seed database with initial words"""
-    from pathlib import Path
-    import json
+words_table = Word.__table__
 
-    word_data_path = Path("assets/data/processed/korean_words_2000.json")
+# Columns a rerun of the seed may refresh on words it created itself
+SEED_UPDATABLE = ("part_of_speech", "romanization", "topik_level")
 
-    try:
-        with open(word_data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        for item in data:
-            # Convert raw JSON data to expected schema
-            word = Word(
-                korean=item.get("korean", ""),  # Add default values
-                english=item.get("meaning", ""),
-                part_of_speech=item.get("part_of_speech"),
-                romanization=item.get("romanization"),
-                topik_level=item.get("topik_level"),
-                source_type="initial_seed",
-                source_details="korean_words_2000.json",
-            )
-            db.add(word)
+WordKey = Tuple[str, str]
 
-        await db.commit()
-        print(f"Successfully seeded {len(data)} words")
 
+def batched(rows: Iterable[dict], size: int = BATCH_SIZE) -> Iterator[list]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_words(path: str) -> List[dict]:
+    """Read the processed word list into insert-ready rows.
+
+    Accepts both the cleaned-up export (``word``/``meaning``/``pos``) and
+    the API field names (``korean``/``english``/``part_of_speech``). Each
+    row keeps the file's ``id`` as ``source_id`` so sentences can be
+    matched to it. Runs without a database, so it can go to a process pool.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    rows = []
+    for item in data:
+        korean = item.get("korean") or item.get("word")
+        english = item.get("english") or item.get("meaning")
+        if not korean or not english:
+            continue
+        rows.append(
+            {
+                "source_id": item.get("id"),
+                "korean": korean,
+                "english": english,
+                "part_of_speech": item.get("part_of_speech")
+                or item.get("pos"),
+                "romanization": item.get("romanization"),
+                "topik_level": item.get("topik_level"),
+            }
+        )
+    return rows
+
+
+async def upsert_words(
+    db: AsyncSession,
+    rows: Iterable[dict],
+    source_type: str = "initial_seed",
+    source_details: str = WORDS_FILE,
+    added_by_agent: str = None,
+    update_existing: bool = True,
+) -> int:
+    """INSERT ... ON CONFLICT (korean, english) in executemany batches.
+
+    Existing words keep their id. When `update_existing` is set, words
+    this seed created earlier get the seed's latest column values; words
+    from any other source are left alone. Returns the rows sent.
+    """
+    stmt = insert(words_table)
+    if update_existing:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["korean", "english"],
+            set_={column: stmt.excluded[column] for column in SEED_UPDATABLE},
+            where=words_table.c.source_type == source_type,
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=["korean", "english"]
+        )
+
+    now = datetime.utcnow()
+    sent = 0
+    for batch in batched(
+        {
+            "korean": row["korean"],
+            "english": row["english"],
+            "part_of_speech": row.get("part_of_speech"),
+            "romanization": row.get("romanization"),
+            "topik_level": row.get("topik_level"),
+            "source_type": source_type,
+            "source_details": source_details,
+            "added_by_agent": added_by_agent,
+            "created_at": now,
+        }
+        for row in rows
+    ):
+        await db.execute(stmt, batch)
+        sent += len(batch)
+    return sent
+
+
+async def word_id_map(db: AsyncSession) -> Dict[WordKey, int]:
+    """(korean, english) -> id for every word, in one query"""
+    result = await db.execute(
+        select(Word.korean, Word.english, Word.id).order_by(Word.id)
+    )
+    return {(korean, english): id for korean, english, id in result.all()}
+
+
+async def load_words(
+    db: AsyncSession, db_path: str = f"assets/data/processed/{WORDS_FILE}"
+) -> None:
+    """Seed database with initial words"""
+    try:
+        rows = parse_words(db_path)
+        await upsert_words(db, rows, source_details=Path(db_path).name)
+        await db.commit()
+        print(f"Successfully seeded {len(rows)} words")
     except Exception as e:
         print(f"Error seeding words: {str(e)}")
         await db.rollback()
@@ -0,0 +1,248 @@
+"""Database startup steps: schema creation, initial seeding and the
+one-off daily rollup backfill.
+
+Each step records what it did in the ``app_metadata`` table (a hash of
+the model DDL, the seed version, whether rollups were built), so a warm
+boot against an unchanged database costs one small SELECT instead of
+``create_all`` plus a probe.
+
+    python -m src.db.startup --check-startup
+
+prints how long importing the app, the schema step and the seed step take.
+"""
+
+import hashlib
+import logging
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlmodel import SQLModel
+
+from .. import models  # noqa: F401  (every table, whoever imports us)
+from ..config import FAST_STARTUP
+from ..database import async_session_factory, engine
+from ..models.app_metadata import AppMetadata
+from . import search  # noqa: F401  (registers the FTS5 DDL)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_FINGERPRINT = "schema_fingerprint"
+SEED_VERSION = "seed_version"
+ROLLUPS_BUILT = "rollups_built"
+
+metadata_table = AppMetadata.__table__
+
+
+@dataclass
+class StartupReport:
+    timings: Dict[str, float] = field(default_factory=dict)
+    schema_created: bool = False
+    seeded: bool = False
+    seed_error: Optional[str] = None
+
+    @contextmanager
+    def timed(self, step: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[step] = time.perf_counter() - started
+
+    def format(self) -> str:
+        lines = [
+            f"  {step:<10} {seconds * 1000:9.1f} ms"
+            for step, seconds in self.timings.items()
+        ]
+        lines.append(
+            f"  {'total':<10} {sum(self.timings.values()) * 1000:9.1f} ms"
+        )
+        lines.append(
+            f"  schema created: {self.schema_created}, "
+            f"seeded: {self.seeded}"
+        )
+        if self.seed_error:
+            lines.append(f"  seed failed: {self.seed_error}")
+        return "\n".join(lines)
+
+
+def schema_fingerprint() -> str:
+    """Hash of the DDL for every model table and index.
+
+    Covers the whole ``src.models`` package (imported above), so the app
+    and ``--check-startup`` agree whatever else each of them imported.
+
+    Raw DDL registered in ``metadata.info["extra_ddl"]`` (the FTS5 search
+    index) is included too.
+    """
+    dialect = sqlite.dialect()
+    digest = hashlib.sha256()
+    for table in SQLModel.metadata.sorted_tables:
+        digest.update(
+            str(CreateTable(table).compile(dialect=dialect)).encode()
+        )
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            digest.update(
+                str(CreateIndex(index).compile(dialect=dialect)).encode()
+            )
+    for statement in SQLModel.metadata.info.get("extra_ddl", []):
+        digest.update(statement.encode())
+    return digest.hexdigest()
+
+
+async def _read_metadata(conn) -> Dict[str, str]:
+    exists = await conn.execute(
+        text(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'table' AND name = :name"
+        ),
+        {"name": metadata_table.name},
+    )
+    if exists.scalar() is None:
+        return {}
+    result = await conn.execute(
+        select(metadata_table.c.key, metadata_table.c.value)
+    )
+    return dict(result.all())
+
+
+async def _write_metadata(conn, key: str, value: str) -> None:
+    stmt = insert(metadata_table).values(
+        key=key, value=value, updated_at=datetime.utcnow()
+    )
+    await conn.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[metadata_table.c.key],
+            set_={
+                "value": stmt.excluded.value,
+                "updated_at": datetime.utcnow(),
+            },
+        )
+    )
+
+
+async def ensure_schema(force: bool = not FAST_STARTUP) -> bool:
+    """Run create_all unless the recorded fingerprint matches the models.
+
+    Returns True when create_all ran.
+    """
+    fingerprint = schema_fingerprint()
+    async with engine.begin() as conn:
+        stored = await _read_metadata(conn)
+        if not force and stored.get(SCHEMA_FINGERPRINT) == fingerprint:
+            logger.info("Schema unchanged, skipping create_all.")
+            return False
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await _write_metadata(conn, SCHEMA_FINGERPRINT, fingerprint)
+    logger.info("Schema created/updated.")
+    return True
+
+
+async def ensure_rollups() -> bool:
+    """Backfill daily_rollups from the source tables, once per database.
+
+    The table is created empty on existing databases (by create_all or
+    the migration), and from then on writes keep it current. Returns True
+    when the backfill ran.
+    """
+    from . import rollups
+
+    async with engine.connect() as conn:
+        stored = await _read_metadata(conn)
+    if stored.get(ROLLUPS_BUILT):
+        return False
+
+    logger.info("Backfilling daily rollups...")
+    async with async_session_factory() as db:
+        await rollups.rebuild(db)
+        await _write_metadata(db, ROLLUPS_BUILT, "1")
+        await db.commit()
+    return True
+
+
+async def ensure_seeded(force: bool = not FAST_STARTUP) -> bool:
+    """Run the seed once per seed version.
+
+    The seed upserts, so on a database seeded by an older version it only
+    adds or refreshes what changed. Returns True when the seed ran.
+    """
+    # Deferred: the seed loaders are only needed when the seed runs
+    from .seed import SEED_DATA_VERSION, seed_all
+
+    async with engine.connect() as conn:
+        stored = await _read_metadata(conn)
+    if not force and stored.get(SEED_VERSION) == SEED_DATA_VERSION:
+        logger.info("Seed version unchanged, skipping seed check.")
+        return False
+
+    logger.info(f"Applying seed version {SEED_DATA_VERSION}...")
+    await seed_all()
+
+    async with engine.begin() as conn:
+        await _write_metadata(conn, SEED_VERSION, SEED_DATA_VERSION)
+    return True
+
+
+def measure_import(module: str = "src.main") -> float:
+    """Seconds a fresh interpreter needs to import `module`"""
+    code = (
+        "import time; started = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - started)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+async def check_startup() -> StartupReport:
+    report = StartupReport()
+    report.timings["import"] = measure_import()
+    with report.timed("schema"):
+        report.schema_created = await ensure_schema()
+        await ensure_rollups()
+    with report.timed("seed"):
+        try:
+            report.seeded = await ensure_seeded()
+        except Exception as e:
+            report.seed_error = str(e)
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Database startup steps for the HagXwon API"
+    )
+    parser.add_argument(
+        "--check-startup",
+        action="store_true",
+        help="time app import, schema and seed steps and print a report",
+    )
+    args = parser.parse_args()
+    if not args.check_startup:
+        parser.print_help()
+        raise SystemExit(1)
+
+    async def run():
+        try:
+            return await check_startup()
+        finally:
+            await engine.dispose()
+
+    report = asyncio.run(run())
+    print("Startup timing:")
+    print(report.format())
@@ -0,0 +1,203 @@
+"""In-process queue for long-running admin jobs.
+
+Jobs are coroutines registered per kind with `job_queue.register`. They
+run one at a time by default, since SQLite has a single writer anyway.
+Blocking work (plain sqlite3 connections, file writes) goes through
+`JobContext.run_blocking`, which uses a thread pool so the event loop
+keeps serving requests. Job state lives in memory: the most recent
+JOB_HISTORY jobs can be polled with progress and result.
+"""
+
+import asyncio
+import functools
+import logging
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .config import JOB_HISTORY, JOB_THREADS, JOB_WORKERS
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    kind: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = QUEUED
+    progress: float = 0.0
+    message: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+
+class JobContext:
+    """Handed to a running job to report progress and offload work"""
+
+    def __init__(self, job: Job, queue: "JobQueue"):
+        self.job = job
+        self._queue = queue
+
+    def progress(self, fraction: float, message: Optional[str] = None):
+        self.job.progress = min(max(fraction, 0.0), 1.0)
+        if message is not None:
+            self.job.message = message
+
+    async def run_blocking(self, fn: Callable, *args, **kwargs):
+        return await self._queue.run_blocking(fn, *args, **kwargs)
+
+
+JobHandler = Callable[[JobContext, Dict[str, Any]], Awaitable[Any]]
+
+
+class JobQueue:
+    def __init__(
+        self,
+        workers: int = JOB_WORKERS,
+        threads: int = JOB_THREADS,
+        history: int = JOB_HISTORY,
+    ):
+        self.workers = workers
+        self.threads = threads
+        self.history = history
+        self._handlers: Dict[str, JobHandler] = {}
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def register(self, kind: str):
+        """Decorator registering the coroutine that runs jobs of `kind`"""
+
+        def decorator(handler: JobHandler) -> JobHandler:
+            self._handlers[kind] = handler
+            return handler
+
+        return decorator
+
+    @property
+    def kinds(self) -> List[str]:
+        return sorted(self._handlers)
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="job"
+        )
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{n}")
+            for n in range(self.workers)
+        ]
+        # Jobs submitted before a restart are picked up again
+        for job in self._jobs.values():
+            if job.status == QUEUED:
+                self._queue.put_nowait(job)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(self, kind: str, params: Optional[Dict[str, Any]] = None):
+        """Queue a job and return it immediately.
+
+        Raises KeyError for an unknown kind.
+        """
+        if kind not in self._handlers:
+            raise KeyError(kind)
+        self.start()
+        job = Job(kind=kind, params=params or {})
+        self._jobs[job.id] = job
+        self._trim()
+        self._queue.put_nowait(job)
+        logger.info(f"Queued {kind} job {job.id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        return list(reversed(self._jobs.values()))
+
+    async def wait(self, job_id: str, poll: float = 0.05) -> Job:
+        job = self._jobs[job_id]
+        while not job.done:
+            await asyncio.sleep(poll)
+        return job
+
+    async def run_blocking(self, fn: Callable, *args, **kwargs):
+        """Run `fn` in the job thread pool without blocking the loop"""
+        if self._executor is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    def _trim(self) -> None:
+        # Forget the oldest finished jobs beyond the history limit
+        excess = len(self._jobs) - self.history
+        for job_id in [j.id for j in self._jobs.values() if j.done][:excess]:
+            del self._jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = RUNNING
+        job.started_at = datetime.utcnow()
+        logger.info(f"Running {job.kind} job {job.id}")
+        try:
+            job.result = await self._handlers[job.kind](
+                JobContext(job, self), job.params
+            )
+            job.status = SUCCEEDED
+            job.progress = 1.0
+        except asyncio.CancelledError:
+            job.status = FAILED
+            job.error = "cancelled (server shutting down)"
+            raise
+        except Exception as e:
+            logger.exception(f"{job.kind} job {job.id} failed")
+            job.status = FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.utcnow()
+            elapsed = (job.finished_at - job.started_at).total_seconds()
+            logger.info(
+                f"{job.kind} job {job.id} {job.status} in {elapsed:.2f}s"
+            )
+
+
+job_queue = JobQueue()
@@ -1,6 +1,5 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.sql import select
 
 from .api.routes.words import router as words_router
 from .api.routes.groups import router as groups_router
@@ -10,10 +9,25 @@ from .api.routes.mistakes import router as mistakes_router
 from .api.routes.dashboard import router as dashboard_router
 from .api.routes.admin import router as admin_router
 from .api.routes.study_activities import router as study_activities_router
-
-from .database import init_db, async_session_factory, get_db
-from .models.word import Word
-from .db.seed import seed_all  # Import the seeding function
+from .api.routes.review import router as review_router
+from .api.routes.export import router as export_router
+from .api.routes.search import router as search_router
+from .api.routes.analytics import router as analytics_router
+
+from .analytics import refresh_periodically
+from .cache import response_cache
+from .config import BACKGROUND_SEED
+from .database import get_db, engine, read_engine
+from .db.startup import ensure_rollups, ensure_schema, ensure_seeded
+from .jobs import job_queue
+from .profiling import (
+    PROMETHEUS_ENABLED,
+    TimingMiddleware,
+    instrument_engine,
+    render_metrics,
+    track_queries,
+)
+import asyncio
 import os
 import logging  # Import logging
 
@@ -30,7 +44,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(TimingMiddleware)
+instrument_engine(engine)
+instrument_engine(read_engine)
 
 
 # Register routes with proper prefixes
@@ -42,6 +60,10 @@ app.include_router(mistakes_router, prefix="/api")
 app.include_router(dashboard_router, prefix="/api")
 app.include_router(admin_router, prefix="/api")
 app.include_router(study_activities_router, prefix="/api")
+app.include_router(review_router, prefix="/api")
+app.include_router(export_router, prefix="/api")
+app.include_router(search_router, prefix="/api")
+app.include_router(analytics_router, prefix="/api")
 
 
 @app.get("/debug/routes")
@@ -56,48 +78,69 @@ async def list_routes():
     ]
 
 
+@app.get("/debug/cache")
+async def cache_stats():
+    """Hit/miss counters for the response cache"""
+    return response_cache.stats()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus request and SQL timing histograms"""
+    if not PROMETHEUS_ENABLED:
+        raise HTTPException(
+            status_code=404, detail="prometheus_client is not installed"
+        )
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    seed_task = getattr(app.state, "seed_task", None)
+    return {
+        "status": "healthy",
+        "seeding": seed_task is not None and not seed_task.done(),
+    }
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize database and seed data if needed"""
     logger.info("Initializing database...")
-    await init_db()
+    await ensure_schema()
+    await ensure_rollups()
     logger.info("Database initialization check complete.")
-
-    # Check if seeding is needed
-    async with async_session_factory() as db:
-        try:
-            result = await db.execute(
-                select(Word).limit(1)
-            )  # Check if at least one word exists
-            first_word = result.scalar_one_or_none()
-
-            if first_word is None:
-                logger.info(
-                    "Database appears empty. Starting seeding process..."
-                )
-                try:
-                    await seed_all()  # Call the seeding function
-                    logger.info("Database seeding completed successfully.")
-                except Exception as seed_e:
-                    logger.error(
-                        f"Database seeding failed: {seed_e}", exc_info=True
-                    )
-                    # Decide if the app should fail to start if seeding fails
-                    # raise seed_e
-            else:
-                logger.info(
-                    "Database already contains data. Skipping seeding."
-                )
-
-        except Exception as e:
-            logger.error(
-                f"Error during startup database check/seeding: {e}",
-                exc_info=True,
+    job_queue.start()
+    app.state.analytics_task = asyncio.create_task(refresh_periodically())
+
+    if BACKGROUND_SEED:
+        # Accept requests (health checks) while a cold database seeds
+        app.state.seed_task = asyncio.create_task(seed_database())
+    else:
+        await seed_database()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.analytics_task.cancel()
+    await job_queue.stop()
+
+
+async def seed_database():
+    try:
+        with track_queries() as stats:
+            seeded = await ensure_seeded()
+        if seeded:
+            logger.info(
+                f"Database seeding completed successfully "
+                f"({stats.queries} queries, "
+                f"{stats.db_seconds:.2f}s in SQL)."
             )
-            # Decide if the app should fail to start on other DB errors
-            # raise e
+    except Exception as e:
+        logger.error(
+            f"Error during startup database check/seeding: {e}",
+            exc_info=True,
+        )
+        # Decide if the app should fail to start on other DB errors
+        # raise e
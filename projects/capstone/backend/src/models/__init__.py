@@ -11,6 +11,9 @@ from .word_stats import WordStats
 from .wrong_input import WrongInput
 from .word_review_item import WordReviewItem
 from .sample_sentence import SampleSentence
+from .daily_rollup import DailyRollup
+from .app_metadata import AppMetadata
+from .study_activity import StudyActivity
 
 # Update export order
 __all__ = [
@@ -24,4 +27,7 @@ __all__ = [
     "WrongInput",
     "WordReviewItem",
     "SampleSentence",
+    "DailyRollup",
+    "AppMetadata",
+    "StudyActivity",
 ]
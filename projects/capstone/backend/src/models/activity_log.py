@@ -51,7 +51,7 @@ class ActivityLog(SQLModel, table=True):
     activity_type: str = Field(nullable=False)
     correct: bool = Field(default=False)
     score: int = Field(default=0)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=datetime.utcnow, index=True)
 
     # Relationships
     word: "Word" = Relationship(back_populates="activity_logs")
@@ -0,0 +1,16 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+
+class AppMetadata(SQLModel, table=True):
+    """Key/value facts about the database itself.
+
+    Startup records the schema fingerprint and seed version here so warm
+    boots can skip `create_all` and the seed check (see src.db.startup).
+    """
+
+    __tablename__ = "app_metadata"
+
+    key: str = Field(primary_key=True)
+    value: str = Field(nullable=False)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -1,10 +1,20 @@
-from sqlmodel import SQLModel, Table, Column, Integer, ForeignKey
+from sqlmodel import SQLModel, Table, Column, Integer, ForeignKey, Index
 
 word_group_map = Table(
     "word_group_map",
     SQLModel.metadata,
-    Column("word_id", Integer, ForeignKey("words.id", ondelete="CASCADE")),
     Column(
-        "group_id", Integer, ForeignKey("word_groups.id", ondelete="CASCADE")
+        "word_id",
+        Integer,
+        ForeignKey("words.id", ondelete="CASCADE"),
+        index=True,
     ),
+    Column(
+        "group_id",
+        Integer,
+        ForeignKey("word_groups.id", ondelete="CASCADE"),
+        index=True,
+    ),
+    # A word is linked to a group at most once (INSERT OR IGNORE relies on it)
+    Index("ux_word_group_map_word_group", "word_id", "group_id", unique=True),
 )
@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+
+
+class DailyRollup(SQLModel, table=True):
+    """Pre-aggregated row counts per calendar day.
+
+    One row per (day, metric, dimension), e.g. ("2025-04-01", "activity",
+    "flashcard"). Maintained incrementally by the write routes and rebuilt
+    from the source tables by `src.db.init_db rebuild-rollups`.
+    """
+
+    __tablename__ = "daily_rollups"
+
+    day: date = Field(primary_key=True)
+    metric: str = Field(primary_key=True)
+    dimension: str = Field(default="", primary_key=True)
+    count: int = Field(default=0)
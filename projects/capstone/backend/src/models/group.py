@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 from .associations import word_group_map  # Import from single source of truth
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 class WordGroup(SQLModel, table=True):
     __tablename__ = "word_groups"
+    __table_args__ = (Index("ux_word_groups_name", "name", unique=True),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(nullable=False)
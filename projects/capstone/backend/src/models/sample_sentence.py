@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -7,6 +7,14 @@ if TYPE_CHECKING:
 
 class SampleSentence(SQLModel, table=True):
     __tablename__ = "sample_sentences"
+    __table_args__ = (
+        Index(
+            "ux_sample_sentences_word_sentence",
+            "word_id",
+            "sentence_korean",
+            unique=True,
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     word_id: int = Field(foreign_key="words.id")
@@ -1,7 +1,9 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import event, inspect
+from sqlmodel import SQLModel, Field, Relationship, Index
 from datetime import datetime, timezone
 from typing import Optional, List, TYPE_CHECKING
 from .associations import word_group_map  # Import from single source of truth
+from ..utils.hangul import chosung, decompose, search_keys
 
 if TYPE_CHECKING:
     from .group import WordGroup
@@ -12,8 +14,23 @@ if TYPE_CHECKING:
     from .word_review_item import WordReviewItem
 
 
+def _jamo_default(context):
+    return decompose(context.get_current_parameters()["korean"])
+
+
+def _chosung_default(context):
+    return chosung(context.get_current_parameters()["korean"])
+
+
 class Word(SQLModel, table=True):
     __tablename__ = "words"  # Explicitly set table name
+    __table_args__ = (
+        # Natural key for seed upserts; one row per meaning of a word
+        Index("ux_words_korean_english", "korean", "english", unique=True),
+        # Prefix range scans for autocomplete
+        Index("ix_words_korean_jamo", "korean_jamo"),
+        Index("ix_words_korean_chosung", "korean_chosung", "korean_jamo"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     korean: str = Field(nullable=False)
@@ -25,6 +42,14 @@ class Word(SQLModel, table=True):
     source_details: Optional[str] = None
     added_by_agent: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Autocomplete keys derived from `korean` (see src.utils.hangul);
+    # filled on insert for ORM and Core statements alike
+    korean_jamo: Optional[str] = Field(
+        default=None, sa_column_kwargs={"default": _jamo_default}
+    )
+    korean_chosung: Optional[str] = Field(
+        default=None, sa_column_kwargs={"default": _chosung_default}
+    )
 
     # Relationships
     groups: List["WordGroup"] = Relationship(
@@ -59,6 +84,13 @@ class Word(SQLModel, table=True):
     )
 
 
+@event.listens_for(Word, "before_update")
+def _refresh_search_keys(mapper, connection, target):
+    if inspect(target).attrs.korean.history.has_changes():
+        for key, value in search_keys(target.korean).items():
+            setattr(target, key, value)
+
+
 @property
 def created_at_utc(self):
     return datetime.now(timezone.utc)
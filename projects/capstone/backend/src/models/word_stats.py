@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 from typing import Optional
 from datetime import datetime
 from .word import Word  # Import the Word class
@@ -6,6 +6,10 @@ from .word import Word  # Import the Word class
 
 class WordStats(SQLModel, table=True):
     __tablename__ = "word_stats"
+    __table_args__ = (
+        # Review queue: scan due words in due order without sorting
+        Index("ix_word_stats_next_due_at_word_id", "next_due_at", "word_id"),
+    )
 
     word_id: int = Field(foreign_key="words.id", primary_key=True)
     times_seen: int = Field(default=0)
@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
@@ -8,6 +8,10 @@ if TYPE_CHECKING:
 
 class WrongInput(SQLModel, table=True):
     __tablename__ = "wrong_inputs"
+    __table_args__ = (
+        # Newest-first keyset pagination of a word's mistakes
+        Index("ix_wrong_inputs_word_id_timestamp", "word_id", "timestamp"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     word_id: int = Field(foreign_key="words.id")
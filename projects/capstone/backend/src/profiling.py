@@ -0,0 +1,234 @@
+import cProfile
+import io
+import logging
+import pstats
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+from urllib.parse import parse_qs
+
+from sqlalchemy import event
+
+from .config import REQUEST_PROFILING, SLOW_REQUEST_MS
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        Histogram,
+        generate_latest,
+    )
+except ImportError:  # pragma: no cover - /metrics is disabled without it
+    Histogram = None
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # pragma: no cover - optional, falls back to cProfile
+    Profiler = None
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_ENABLED = Histogram is not None
+
+if PROMETHEUS_ENABLED:
+    REQUEST_SECONDS = Histogram(
+        "hagxwon_request_duration_seconds",
+        "Wall time per HTTP request",
+        ["method", "route", "status"],
+    )
+    REQUEST_DB_SECONDS = Histogram(
+        "hagxwon_request_db_seconds",
+        "Time spent in SQL statements per HTTP request",
+        ["method", "route"],
+    )
+    REQUEST_DB_QUERIES = Histogram(
+        "hagxwon_request_db_queries",
+        "SQL statements executed per HTTP request",
+        ["method", "route"],
+        buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250, 1000),
+    )
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect SQL statement counts and timings for the enclosed block"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, params, context, many):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, params, context, many):
+    started = conn.info["query_start"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def instrument_engine(engine) -> None:
+    """Feed every statement run on `engine` into the active QueryStats"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus exposition of the request histograms"""
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def _server_timing(total_seconds: float, stats: QueryStats) -> bytes:
+    metrics = [
+        f"app;dur={total_seconds * 1000:.2f}",
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries"',
+    ]
+    if REQUEST_PROFILING and stats.slowest_statement:
+        desc = " ".join(stats.slowest_statement.split())[:80]
+        desc = desc.replace('"', "'").replace("\\", "")
+        metrics.append(
+            f'db-slowest;dur={stats.slowest_seconds * 1000:.2f};desc="{desc}"'
+        )
+    return ", ".join(metrics).encode("latin-1", "replace")
+
+
+class TimingMiddleware:
+    """Per-request wall time and SQL profile.
+
+    Adds a Server-Timing header (total time, SQL time and count, slowest
+    statement), records Prometheus histograms labelled by route template,
+    and with ``?_profile=1`` replaces the response with a profiler report.
+    Both the report and the slowest-statement text need REQUEST_PROFILING,
+    and only GET/HEAD requests are profiled: the report replaces the real
+    response, which for a write would hide the outcome of a change that
+    was still made.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        query = parse_qs(scope.get("query_string", b"").decode())
+        if (
+            REQUEST_PROFILING
+            and scope["method"] in ("GET", "HEAD")
+            and query.get("_profile") == ["1"]
+        ):
+            await self._profile(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (
+                        b"server-timing",
+                        _server_timing(time.perf_counter() - started, stats),
+                    )
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._observe(scope, status, started, stats)
+
+    def _observe(self, scope, status, started, stats: QueryStats) -> None:
+        elapsed = time.perf_counter() - started
+        route = scope.get("route")
+        # Label by template (/api/words/{word_id}) to keep cardinality low
+        path = getattr(route, "path", None) or "unmatched"
+        method = scope["method"]
+        if PROMETHEUS_ENABLED:
+            REQUEST_SECONDS.labels(method, path, str(status)).observe(elapsed)
+            REQUEST_DB_SECONDS.labels(method, path).observe(stats.db_seconds)
+            REQUEST_DB_QUERIES.labels(method, path).observe(stats.queries)
+        if elapsed * 1000 >= SLOW_REQUEST_MS:
+            logger.warning(
+                f"Slow request {method} {scope['path']}: "
+                f"{elapsed * 1000:.1f} ms, {stats.queries} queries, "
+                f"{stats.db_seconds * 1000:.1f} ms in SQL"
+            )
+
+    async def _profile(self, scope, receive, send):
+        async def discard(message):
+            pass
+
+        with track_queries() as stats:
+            if Profiler is not None:
+                profiler = Profiler(async_mode="enabled")
+                profiler.start()
+                try:
+                    await self.app(scope, receive, discard)
+                finally:
+                    profiler.stop()
+                report = profiler.output_text(unicode=True)
+            else:
+                # cProfile sees every task on the loop, not just this one
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    await self.app(scope, receive, discard)
+                finally:
+                    profiler.disable()
+                buffer = io.StringIO()
+                pstats.Stats(profiler, stream=buffer).sort_stats(
+                    "cumulative"
+                ).print_stats(40)
+                report = buffer.getvalue()
+
+        summary = (
+            f"{stats.queries} SQL statements, "
+            f"{stats.db_seconds * 1000:.2f} ms in SQL\n"
+            f"slowest ({stats.slowest_seconds * 1000:.2f} ms): "
+            f"{stats.slowest_statement}\n\n"
+        )
+        body = (summary + report).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import Any, Dict, Literal, Optional
+from datetime import datetime
+
+
+class JobCreate(BaseModel):
+    kind: Literal["reset", "reseed", "reindex", "export", "analytics"]
+    # reset: {"seed": bool}; export: {"kind", "format", "since"}
+    params: Dict[str, Any] = {}
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str
+    progress: float
+    message: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
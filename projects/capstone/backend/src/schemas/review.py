@@ -0,0 +1,49 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from datetime import datetime
+from .word import WordResponse
+from .sample_sentence import SampleSentenceResponse
+
+
+class ReviewQueueItem(BaseModel):
+    word: WordResponse
+    sample_sentences: List[SampleSentenceResponse] = []
+    next_due_at: Optional[datetime] = None
+    ease_factor: float
+    interval_days: int
+    current_streak: int
+
+
+class ReviewAnswer(BaseModel):
+    word_id: int
+    # SM-2 recall grade 0-5; `correct` is a shortcut for 4 (pass) / 1 (fail)
+    quality: Optional[int] = Field(None, ge=0, le=5)
+    correct: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def resolve_quality(self):
+        if self.quality is None:
+            if self.correct is None:
+                raise ValueError("Either quality or correct is required")
+            self.quality = 4 if self.correct else 1
+        if self.correct is None:
+            self.correct = self.quality >= 3
+        return self
+
+
+class ReviewAnswerBatch(BaseModel):
+    answers: List[ReviewAnswer] = Field(..., min_length=1)
+    study_session_id: Optional[int] = None
+
+
+class ReviewAnswerResult(BaseModel):
+    word_id: int
+    correct: bool
+    ease_factor: float
+    interval_days: int
+    next_due_at: datetime
+
+
+class ReviewAnswerBatchResponse(BaseModel):
+    updated: int
+    results: List[ReviewAnswerResult]
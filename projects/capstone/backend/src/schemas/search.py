@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from typing import Optional, List
+
+
+class WordSearchHit(BaseModel):
+    id: int
+    korean: str
+    english: str
+    romanization: Optional[str] = None
+    part_of_speech: Optional[str] = None
+    topik_level: Optional[int] = None
+    # HTML: escaped field values with matches wrapped in <mark>...</mark>
+    korean_highlight: Optional[str] = None
+    english_highlight: Optional[str] = None
+    romanization_highlight: Optional[str] = None
+    score: Optional[float] = None  # bm25, lower is better
+
+
+class WordSuggestion(BaseModel):
+    id: int
+    korean: str
+    english: str
+    romanization: Optional[str] = None
+    part_of_speech: Optional[str] = None
+    topik_level: Optional[int] = None
+
+
+class SentenceSearchHit(BaseModel):
+    id: int
+    word_id: int
+    word_korean: str
+    sentence_korean: str
+    sentence_english: str
+    korean_snippet: Optional[str] = None
+    english_snippet: Optional[str] = None
+    score: Optional[float] = None
+
+
+class SearchResponse(BaseModel):
+    query: str
+    words: List[WordSearchHit] = []
+    sentences: List[SentenceSearchHit] = []
@@ -35,3 +35,29 @@ class WordUpdate(WordBase):
     source_type: Optional[str] = None
     source_details: Optional[str] = None
     added_by_agent: Optional[str] = None
+
+
+class WordBulkSentence(BaseModel):
+    sentence_korean: str
+    sentence_english: str
+
+
+class WordBulkItem(WordCreate):
+    """One row of a bulk import: a word plus its sentences and groups"""
+
+    sample_sentences: List[WordBulkSentence] = []
+    groups: List[str] = []  # group names, created if missing
+
+
+class WordBulkConflict(BaseModel):
+    index: int
+    korean: Optional[str] = None
+    reason: str
+
+
+class WordBulkResult(BaseModel):
+    inserted: int = 0
+    sentences: int = 0
+    group_links: int = 0
+    groups_created: int = 0
+    conflicts: List[WordBulkConflict] = []
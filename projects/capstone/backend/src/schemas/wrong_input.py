@@ -17,3 +17,8 @@ class WrongInputResponse(WrongInputBase):
 
     class Config:
         orm_mode = True
+
+
+class WrongInputBatchResponse(BaseModel):
+    inserted: int
+    words_updated: int
@@ -0,0 +1,196 @@
+"""Hangul syllable (de)composition and search keys.
+
+Learners type Korean one jamo at a time, so an unfinished syllable ("하"
+on the way to "한") or initial consonants only ("ㅎㄱ" for 한국) should
+still find the word. Both become plain prefix matches once words are
+stored as:
+
+- a jamo key: every syllable split into compatibility jamo, with compound
+  vowels and final clusters split into the keys typed for them
+  (한국 -> ㅎㅏㄴㄱㅜㄱ, 과 -> ㄱㅗㅏ)
+- a chosung key: the initial consonant of every syllable (한국 -> ㅎㄱ)
+
+Standard library only, so the typing games and the MUD can import it
+without the backend's dependencies.
+"""
+
+import unicodedata
+from typing import Dict, Optional, Tuple
+
+SYLLABLE_FIRST = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("",) + tuple(
+    "ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+)
+
+# Jamo typed as two keys on a standard (2-beolsik) keyboard
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+# Conjoining jamo (U+1100 block, e.g. from NFD input) that NFC leaves
+# alone when they don't form a full syllable
+CONJOINING_JAMO = {
+    **{0x1100 + i: jamo for i, jamo in enumerate(CHOSEONG)},
+    **{0x1161 + i: jamo for i, jamo in enumerate(JUNGSEONG)},
+    **{0x11A7 + i: jamo for i, jamo in enumerate(JONGSEONG) if jamo},
+}
+
+# Upper bound for prefix range scans: sorts after any text with the prefix
+PREFIX_END = chr(0x10FFFF)
+
+
+def normalize(text: str) -> str:
+    """NFC-normalize and map leftover conjoining jamo to compatibility jamo"""
+    return unicodedata.normalize("NFC", text).translate(CONJOINING_JAMO)
+
+
+def is_syllable(char: str) -> bool:
+    return SYLLABLE_FIRST <= ord(char) <= SYLLABLE_LAST
+
+
+def split_syllable(char: str) -> Tuple[str, str, str]:
+    """(initial, medial, final) jamo of a precomposed syllable.
+
+    `final` is "" for open syllables. Raises ValueError for anything that
+    is not a precomposed Hangul syllable.
+    """
+    if len(char) != 1 or not is_syllable(char):
+        raise ValueError(f"Not a Hangul syllable: {char!r}")
+    offset = ord(char) - SYLLABLE_FIRST
+    initial, rest = divmod(offset, JUNGSEONG_COUNT * JONGSEONG_COUNT)
+    medial, final = divmod(rest, JONGSEONG_COUNT)
+    return CHOSEONG[initial], JUNGSEONG[medial], JONGSEONG[final]
+
+
+def compose(initial: str, medial: str, final: str = "") -> str:
+    """Inverse of split_syllable. Raises ValueError for invalid jamo."""
+    try:
+        offset = (
+            CHOSEONG.index(initial) * JUNGSEONG_COUNT + JUNGSEONG.index(medial)
+        ) * JONGSEONG_COUNT + JONGSEONG.index(final)
+    except ValueError:
+        raise ValueError(
+            f"Cannot compose syllable from {initial!r}, {medial!r}, "
+            f"{final!r}"
+        ) from None
+    return chr(SYLLABLE_FIRST + offset)
+
+
+def decompose(text: str, split_compound: bool = True) -> str:
+    """Spell `text` out as compatibility jamo.
+
+    With `split_compound` compound vowels and final clusters are split
+    into their keystrokes (ㅘ -> ㅗㅏ), so any partially typed word is a
+    prefix of the full word's key. Non-Hangul characters are kept.
+    """
+    jamo = []
+    for char in normalize(text):
+        if is_syllable(char):
+            jamo.extend(split_syllable(char))
+        else:
+            jamo.append(char)
+    if split_compound:
+        return "".join(COMPOUND_JAMO.get(j, j) for j in jamo)
+    return "".join(jamo)
+
+
+def chosung(text: str) -> str:
+    """Initial consonant of every syllable; other characters are kept"""
+    return "".join(
+        split_syllable(char)[0] if is_syllable(char) else char
+        for char in normalize(text)
+    )
+
+
+def is_chosung(text: str) -> bool:
+    """True when `text` is only initial consonants (and spaces), e.g. ㅎㄱ"""
+    text = normalize(text)
+    return bool(text.strip()) and all(
+        char in CHOSEONG or char.isspace() for char in text
+    )
+
+
+def search_keys(korean: Optional[str]) -> Dict[str, Optional[str]]:
+    """Jamo and chosung keys stored alongside a word"""
+    if korean is None:
+        return {"korean_jamo": None, "korean_chosung": None}
+    return {
+        "korean_jamo": decompose(korean),
+        "korean_chosung": chosung(korean),
+    }
+
+
+def prefix_range(prefix: str) -> Tuple[str, str]:
+    """[low, high) bounds matching every string that starts with `prefix`"""
+    return prefix, prefix + PREFIX_END
+
+
+TYPO_KINDS = (
+    "spacing",
+    "initial",
+    "vowel",
+    "final",
+    "syllable",
+    "non_hangul",
+    "mixed",
+)
+
+
+def typo_kind(expected: str, typed: str) -> str:
+    """Rough category of a wrong Korean answer, for grouping mistakes.
+
+    One of TYPO_KINDS: "spacing", "initial", "vowel", "final" (batchim),
+    "syllable" (one syllable missing or extra), "non_hangul" (nothing
+    Korean was typed, e.g. an English answer) or "mixed".
+    """
+    expected = "".join(normalize(expected).split())
+    typed = "".join(normalize(typed).split())
+    if not any(is_syllable(char) or char in CHOSEONG for char in typed):
+        return "non_hangul"
+    if expected == typed:
+        return "spacing"
+    if len(expected) == len(typed):
+        parts = set()
+        for want, got in zip(expected, typed):
+            if want == got:
+                continue
+            if not (is_syllable(want) and is_syllable(got)):
+                return "mixed"
+            for part, a, b in zip(
+                ("initial", "vowel", "final"),
+                split_syllable(want),
+                split_syllable(got),
+            ):
+                if a != b:
+                    parts.add(part)
+        return parts.pop() if len(parts) == 1 else "mixed"
+    if abs(len(expected) - len(typed)) == 1:
+        longer, shorter = sorted((expected, typed), key=len, reverse=True)
+        if any(
+            longer[:i] + longer[i + 1 :] == shorter for i in range(len(longer))
+        ):
+            return "syllable"
+    return "mixed"
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+
+MIN_EASE_FACTOR = 1.3
+PASSING_QUALITY = 3
+
+
+def apply_sm2(stats, quality: int, now: datetime) -> None:
+    """Update a WordStats row in place using the SM-2 algorithm.
+
+    `quality` is the 0-5 recall grade; anything below 3 counts as a lapse
+    and restarts the interval. `current_streak` doubles as the SM-2
+    repetition count.
+    """
+    correct = quality >= PASSING_QUALITY
+
+    if correct:
+        if stats.current_streak == 0:
+            stats.interval_days = 1
+        elif stats.current_streak == 1:
+            stats.interval_days = 6
+        else:
+            stats.interval_days = max(
+                1, round(stats.interval_days * stats.ease_factor)
+            )
+        stats.current_streak += 1
+    else:
+        stats.current_streak = 0
+        stats.interval_days = 1
+
+    penalty = 5 - quality
+    stats.ease_factor = max(
+        MIN_EASE_FACTOR,
+        stats.ease_factor + (0.1 - penalty * (0.08 + penalty * 0.02)),
+    )
+    stats.times_seen += 1
+    stats.times_correct += int(correct)
+    stats.last_seen_at = now
+    stats.next_due_at = now + timedelta(days=stats.interval_days)
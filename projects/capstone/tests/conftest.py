@@ -0,0 +1,31 @@
+"""Setup for the backend tests: the app runs against a throwaway SQLite
+database, so they never touch SQLITE_DB_PATH from the environment.
+
+Usage (from projects/capstone):
+    python -m pytest tests
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+_data_dir = tempfile.mkdtemp(prefix="hagxwon-tests-")
+# Read by src.config on import, so set before the app is imported
+os.environ["SQLITE_DB_PATH"] = os.path.join(_data_dir, "test.db")
+os.environ["SEED_DATA_DIR"] = _data_dir  # No seed files: start empty
+os.environ["BACKGROUND_SEED"] = "false"
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    from src.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,127 @@
+"""Locust-style load test for the HagXwon API.
+
+Simulates concurrent users hitting a weighted mix of read and write
+endpoints and reports p50/p99 latency per endpoint. Run it against a
+server started with SQLITE_PROFILE=default and again with the default
+production profile to compare before/after numbers.
+
+Usage:
+    python tests/load_test.py --users 50 --duration 30
+    API_BASE_URL=http://localhost:8000/api python tests/load_test.py
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api")
+
+# (weight, method, path, json body factory)
+TASKS = [
+    (10, "GET", "/words?limit=50", None),
+    (6, "GET", "/words/{word_id}", None),
+    (4, "GET", "/words/{word_id}/sentences", None),
+    (4, "GET", "/groups", None),
+    (3, "GET", "/dashboard/summary", None),
+    (2, "GET", "/dashboard/quick-stats", None),
+    (
+        3,
+        "POST",
+        "/mistakes",
+        lambda word_id: {"word_id": word_id, "input_text": "load-test"},
+    ),
+    (
+        3,
+        "POST",
+        "/logs",
+        lambda word_id: {
+            "session_id": 1,
+            "word_id": word_id,
+            "activity_type": "flashcard",
+            "correct": random.random() < 0.7,
+            "score": random.randint(0, 10),
+        },
+    ),
+]
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def user(client, deadline, max_word_id, latencies, errors):
+    weights = [task[0] for task in TASKS]
+    while time.perf_counter() < deadline:
+        _, method, path, body = random.choices(TASKS, weights=weights)[0]
+        word_id = random.randint(1, max_word_id)
+        url = path.format(word_id=word_id)
+        name = f"{method} {path}"
+        start = time.perf_counter()
+        try:
+            response = await client.request(
+                method, url, json=body(word_id) if body else None
+            )
+            if response.status_code >= 400:
+                errors[name] += 1
+        except httpx.HTTPError:
+            errors[name] += 1
+        latencies[name].append((time.perf_counter() - start) * 1000)
+
+
+async def run(users, duration, max_word_id):
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    limits = httpx.Limits(max_connections=users)
+    async with httpx.AsyncClient(
+        base_url=API_BASE_URL, limits=limits, timeout=30
+    ) as client:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(
+                user(client, deadline, max_word_id, latencies, errors)
+                for _ in range(users)
+            )
+        )
+
+    total = sum(len(samples) for samples in latencies.values())
+    print(f"\n{users} users, {duration}s against {API_BASE_URL}")
+    print(f"{total} requests, {total / duration:.1f} req/s\n")
+    header = f"{'endpoint':<34}{'reqs':>7}{'errs':>6}{'p50 ms':>9}"
+    print(f"{header}{'p99 ms':>9}{'mean ms':>9}")
+    for name in sorted(latencies):
+        samples = latencies[name]
+        print(
+            f"{name:<34}{len(samples):>7}{errors[name]:>6}"
+            f"{percentile(samples, 50):>9.1f}{percentile(samples, 99):>9.1f}"
+            f"{statistics.fmean(samples):>9.1f}"
+        )
+    everything = [s for samples in latencies.values() for s in samples]
+    print(
+        f"\n{'ALL':<34}{len(everything):>7}{sum(errors.values()):>6}"
+        f"{percentile(everything, 50):>9.1f}"
+        f"{percentile(everything, 99):>9.1f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=int, default=30, help="seconds")
+    parser.add_argument(
+        "--max-word-id",
+        type=int,
+        default=2000,
+        help="word ids are sampled from 1..N (2000 for the seed set)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.duration, args.max_word_id))
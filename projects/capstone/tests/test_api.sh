@@ -98,10 +98,11 @@ test_delete() {
 reset_database() {
   echo -e "\n🔄 Resetting the database..."
   local code=$(curl -s -o /dev/null -w "%{http_code}" -X POST "$API_BASE_URL/admin/reset/all")
-  if [[ "$code" -eq 200 ]]; then
-    echo -e "✅ \033[32mPASS\033[0m Database reset [$code]"
+  # The reset runs as a background job; poll /admin/jobs for completion
+  if [[ "$code" -eq 202 ]]; then
+    echo -e "✅ \033[32mPASS\033[0m Database reset queued [$code]"
   else
-    echo -e "❌ \033[31mFAIL\033[0m Database reset → $code (Expected 200)"
+    echo -e "❌ \033[31mFAIL\033[0m Database reset → $code (Expected 202)"
   fi
 }
 
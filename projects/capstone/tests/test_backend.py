@@ -0,0 +1,94 @@
+"""API and cache behaviour tests for the backend (see conftest.py)"""
+
+
+def test_bulk_import_keeps_homonyms(client):
+    rows = [
+        {"korean": "배", "english": "pear"},
+        {"korean": "배", "english": "boat"},
+        {"korean": "배", "english": "pear"},
+    ]
+    response = client.post("/api/words/bulk", json=rows)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["inserted"] == 2
+    assert [(c["index"], c["reason"]) for c in result["conflicts"]] == [
+        (2, "duplicate in payload")
+    ]
+
+    # A later import sees both homonyms in the table, and a third sense
+    # of the same korean form still goes in
+    response = client.post(
+        "/api/words/bulk",
+        json=[
+            {"korean": "배", "english": "boat"},
+            {"korean": "배", "english": "belly"},
+        ],
+    )
+    result = response.json()
+    assert result["inserted"] == 1
+    assert [(c["index"], c["reason"]) for c in result["conflicts"]] == [
+        (0, "word already exists")
+    ]
+
+
+def test_cache_skips_responses_invalidated_while_computed():
+    import asyncio
+
+    from src.cache import ResponseCache
+
+    async def scenario():
+        cache = ResponseCache(enabled=True)
+        version = {"value": 1}
+        reading = asyncio.Event()
+        written = asyncio.Event()
+
+        @cache.cached(tags=("word:{word_id}",))
+        async def get_word(word_id: int):
+            value = version["value"]
+            reading.set()
+            await written.wait()  # The write commits mid-read
+            return {"id": word_id, "version": value}
+
+        async def write():
+            await reading.wait()
+            version["value"] = 2
+            await cache.invalidate("word:1")
+            written.set()
+
+        stale, _ = await asyncio.gather(get_word(1), write())
+        assert stale["version"] == 1  # This read began before the write
+        assert len(cache.backend) == 0  # ... so it wasn't cached
+
+        assert (await get_word(1))["version"] == 2
+        assert (await get_word(1))["version"] == 2
+        assert cache.hits == 1
+
+    asyncio.run(scenario())
+
+
+def test_search_highlights_escape_stored_text(client):
+    response = client.post(
+        "/api/words",
+        json={"korean": "꼬리표", "english": "<b>tag</b> & label"},
+    )
+    assert response.status_code in (200, 201)
+    client.post(
+        f"/api/words/{response.json()['id']}/sentences",
+        json={
+            "sentence_korean": "꼬리표를 <붙이다>",
+            "sentence_english": "Attach a <tag> & go",
+        },
+    )
+
+    # Trigram (FTS5) path, then the LIKE fallback for short terms
+    for q, english in (
+        ("tag", "&lt;b&gt;<mark>tag</mark>&lt;/b&gt; &amp; label"),
+        ("ta", "&lt;b&gt;<mark>ta</mark>g&lt;/b&gt; &amp; label"),
+    ):
+        result = client.get("/api/search", params={"q": q}).json()
+        (word,) = [w for w in result["words"] if w["korean"] == "꼬리표"]
+        assert word["english_highlight"] == english
+        (sentence,) = result["sentences"]
+        assert "<tag>" not in sentence["english_snippet"]
+        assert "&lt;" in sentence["english_snippet"]
+        assert "<mark>" in sentence["english_snippet"]
@@ -1,6 +1,7 @@
 from flask import Flask, jsonify
 from models import db
 from routes import words, groups, study_sessions, dashboard
+import read_model
 import os
 
 def create_app():
@@ -20,6 +21,11 @@ def create_app():
     
     # Initialize SQLAlchemy with the Flask app
     db.init_app(app)
+
+    # Add the word list read model to databases created before it existed
+    with app.app_context():
+        with db.engine.begin() as connection:
+            read_model.ensure(connection)
     
     # Register blueprints with URL prefixes
     app.register_blueprint(words.bp, url_prefix='/api')
@@ -40,6 +46,8 @@ def create_app():
                     'get': '/api/words/<id>',
                     'parameters': {
                         'page': 'Page number (default: 1)',
+                        'cursor': 'Keyset cursor from the X-Next-Cursor header (instead of page)',
+                        'limit': 'Page size (default: 100)',
                         'sort_by': 'Sort field (hangul, romanization, english, type)',
                         'order': 'Sort order (asc, desc)'
                     }
@@ -47,13 +55,14 @@ def create_app():
                 'groups': {
                     'list': '/api/groups',
                     'get': '/api/groups/<id>',
-                    'words': '/api/groups/<id>/words',
+                    'words': '/api/groups/<id>/words (streams the whole group, or pages with limit/cursor)',
                     'study_sessions': '/api/groups/<id>/study_sessions'
                 },
                 'study_sessions': {
                     'list': '/api/study_sessions',
                     'create': '/api/study_sessions',
-                    'review': '/api/study_sessions/<id>/words/<word_id>/review'
+                    'review': '/api/study_sessions/<id>/words/<word_id>/review',
+                    'reviews': '/api/study_sessions/<id>/reviews (POST a list of {word_id, correct})'
                 },
                 'dashboard': {
                     'last_session': '/api/dashboard/last_study_session',
@@ -0,0 +1,26 @@
+"""Gunicorn settings: gunicorn -c gunicorn.conf.py
+
+Defaults to threaded workers. create_app() serves every route through
+Flask-SQLAlchemy, whose engine pools connections per process, so size
+GUNICORN_THREADS against that (the lib/db.py pool is only used by the
+raw-SQL study-activity routes, which are mounted by scripts/bench_db.py
+and not by create_app). For gevent set GUNICORN_WORKER_CLASS=gevent;
+SQLite calls still block the worker while they run, so keep queries short.
+"""
+import multiprocessing
+import os
+
+wsgi_app = 'app:create_app()'
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.environ.get('GUNICORN_WORKERS', min(multiprocessing.cpu_count(), 4)))
+# gthread: threads per worker
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+# gevent: concurrent greenlets per worker
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', '200'))
+
+timeout = 30
+keepalive = 5
+# Don't preload: each worker opens its own connections after the fork
+preload_app = False
@@ -1,16 +1,128 @@
+import os
+import queue
 import sqlite3
 import json
+import threading
+from itertools import islice
 from flask import g
+from sqlalchemy import insert
+
+from lib.json_stream import iter_json_array
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sql')
+
+# Connection pool settings (override with environment variables)
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '16'))
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '30'))
+DB_CACHE_SIZE_KB = int(os.environ.get('DB_CACHE_SIZE_KB', '16384'))
+DB_MMAP_SIZE = int(os.environ.get('DB_MMAP_SIZE', str(256 * 1024 * 1024)))
+DB_BUSY_TIMEOUT_MS = int(os.environ.get('DB_BUSY_TIMEOUT_MS', '5000'))
+# Compiled statements kept per connection by the sqlite3 module
+DB_STATEMENT_CACHE = int(os.environ.get('DB_STATEMENT_CACHE', '256'))
+# Rows per executemany batch when importing seed files
+IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', '5000'))
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """A bounded pool of SQLite connections shared by all threads.
+
+    Connections are opened lazily (up to `size`), configured once with
+    the pragmas below and handed back and forth between threads, so the
+    sqlite3 statement cache stays warm across requests. Uses only
+    `queue` and `threading`, which gevent's monkey patching makes
+    cooperative. After a fork the inherited connections are dropped and
+    the child starts with an empty pool.
+    """
+
+    def __init__(self, database, size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT):
+        self.database = database
+        self.size = size
+        self.timeout = timeout
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._all = []
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.database,
+            timeout=DB_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,  # connections move between threads
+            cached_statements=DB_STATEMENT_CACHE,
+        )
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute(f'PRAGMA cache_size = -{DB_CACHE_SIZE_KB}')
+        conn.execute(f'PRAGMA mmap_size = {DB_MMAP_SIZE}')
+        conn.execute(f'PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        with self._lock:
+            self._all.append(conn)
+        return conn
+
+    def acquire(self):
+        if os.getpid() != self._pid:
+            self._reset()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(f'No database connection free after {self.timeout}s')
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn):
+        if os.getpid() != self._pid:
+            return  # Belongs to the parent process
+        try:
+            if conn.in_transaction:
+                # Don't hand uncommitted work to the next request
+                conn.rollback()
+            self._idle.put(conn)
+        except sqlite3.Error:
+            with self._lock:
+                self._all.remove(conn)
+            conn.close()
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close every connection (call when the process shuts down)"""
+        with self._lock:
+            conns, self._all = self._all, []
+        for conn in conns:
+            conn.close()
+        self._reset()
+
 
 class Db:
-    def __init__(self, database='words.db'):
+    def __init__(self, database='words.db', pool_size=DB_POOL_SIZE):
         self.database = database
-        self.connection = None
+        self.pool = ConnectionPool(database, size=pool_size)
+        self._sql = None
+
+    def init_app(self, app):
+        """Attach to a Flask app: `app.db`, and return connections to the
+        pool when each app context ends"""
+        app.db = self
+        app.teardown_appcontext(lambda exception: self.close())
 
     def get(self):
         if 'db' not in g:
-            g.db = sqlite3.connect(self.database)
-            g.db.row_factory = sqlite3.Row  # Return rows as dictionaries
+            g.db = self.pool.acquire()
         return g.db
 
     def commit(self):
@@ -23,11 +135,24 @@ class Db:
     def close(self):
         db = g.pop('db', None)
         if db is not None:
-            db.close()
+            self.pool.release(db)
 
     def sql(self, filepath):
-        with open('sql/' + filepath, 'r') as file:
-            return file.read()
+        # Every file under sql/ is read once, on first use
+        if self._sql is None:
+            self._sql = self._load_sql()
+        return self._sql[filepath]
+
+    def _load_sql(self):
+        statements = {}
+        for root, _, files in os.walk(SQL_DIR):
+            for name in files:
+                if name.endswith('.sql'):
+                    path = os.path.join(root, name)
+                    key = os.path.relpath(path, SQL_DIR).replace(os.sep, '/')
+                    with open(path, 'r', encoding='utf-8') as file:
+                        statements[key] = file.read()
+        return statements
 
     def load_json(self, filepath):
         with open(filepath, 'r') as file:
@@ -41,120 +166,179 @@ class Db:
             'setup/create_table_groups.sql',
             'setup/create_table_word_groups.sql',
             'setup/create_table_study_activities.sql',
-            'setup/create_table_study_sessions.sql'
+            'setup/create_table_study_sessions.sql',
+            'setup/create_indexes.sql'
         ]
         for table in tables:
-            cursor.execute(self.sql(table))
+            cursor.executescript(self.sql(table))
             self.get().commit()
 
     def import_study_activities_json(self, cursor, data_json_path):
-        study_activities = self.load_json(data_json_path)
-        for activity in study_activities:
-            cursor.execute('''
-                INSERT INTO study_activities (name, url, preview_url) 
-                VALUES (?, ?, ?)
-            ''', (activity['name'], activity['url'], activity['preview_url']))
+        cursor.executemany('''
+            INSERT INTO study_activities (name, url, preview_url)
+            VALUES (?, ?, ?)
+        ''', (
+            (activity['name'], activity['url'], activity['preview_url'])
+            for activity in iter_json_array(data_json_path)
+        ))
         self.get().commit()
 
     def import_word_json(self, cursor, group_name, data_json_path):
-        # ✅ Ensure the group exists before inserting words
-        cursor.execute('INSERT OR IGNORE INTO groups (name) VALUES (?)', (group_name,))
-        self.get().commit()
+        return self.import_word_files(cursor, {group_name: data_json_path})
+
+    def import_word_files(self, cursor, group_files):
+        """Import word files into groups in a single transaction.
 
-        cursor.execute('SELECT id FROM groups WHERE name = ?', (group_name,))
-        core_words_group_id = cursor.fetchone()
-        if core_words_group_id:
-            core_words_group_id = core_words_group_id[0]  # ✅ Prevents `NoneType` error
-        else:
-            raise Exception(f"Error: Group '{group_name}' was not created properly.")
-
-        words = self.load_json(data_json_path)
-        for word in words:
-            # ✅ Extract `example["korean"]` and `example["english"]` safely
-            example_korean = word.get('example', {}).get('korean', '')
-            example_english = word.get('example', {}).get('english', '')
-
-            cursor.execute('''
-                INSERT INTO words (hangul, romanization, english, type, parts, example_korean, example_english)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                word['hangul'], 
-                word['romanization'], 
-                ', '.join(word['english']),  # ✅ Converts list to string
-                word['type'],  # ✅ Properly stores noun, verb, etc.
-                json.dumps(word['parts']), 
-                example_korean,  # ✅ Properly extracts from JSON
-                example_english
-            ))
-
-            word_id = cursor.lastrowid  # ✅ Get the last inserted word's ID
-
-            cursor.execute('INSERT INTO word_groups (word_id, group_id) VALUES (?, ?)', (word_id, core_words_group_id))
-        self.get().commit()  # ✅ Ensures words & relationships are saved
+        `group_files` maps group names to JSON arrays of words, or is a
+        list of (group_name, path) pairs when a group takes several files.
+        Files are streamed and inserted with executemany in batches of
+        IMPORT_BATCH_SIZE, so memory stays flat for any deck size. Word ids
+        are assigned here (the write lock is held throughout), which is how
+        word_groups rows are built without a lastrowid per word.
+        Returns the number of words added per group.
+        """
+        if isinstance(group_files, dict):
+            group_files = group_files.items()
+        connection = self.get()
+        if not connection.in_transaction:
+            cursor.execute('BEGIN IMMEDIATE')
+        imported = {}
+        try:
+            next_id = self._next_word_id(cursor)
+            for group_name, data_json_path in group_files:
+                group_id = self._group_id(cursor, group_name)
+                count = 0
+                for batch in _batches(iter_json_array(data_json_path)):
+                    ids = range(next_id, next_id + len(batch))
+                    cursor.executemany('''
+                        INSERT INTO words (id, hangul, romanization, english, type, parts, example_korean, example_english)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', [(word_id, *_word_row(word)) for word_id, word in zip(ids, batch)])
+                    cursor.executemany(
+                        'INSERT INTO word_groups (word_id, group_id) VALUES (?, ?)',
+                        [(word_id, group_id) for word_id in ids]
+                    )
+                    next_id += len(batch)
+                    count += len(batch)
+                # Counter cache: add what was imported instead of recounting
+                cursor.execute(
+                    'UPDATE groups SET words_count = COALESCE(words_count, 0) + ? WHERE id = ?',
+                    (count, group_id)
+                )
+                imported[group_name] = imported.get(group_name, 0) + count
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
 
+        for group_name, count in imported.items():
+            print(f"Successfully added {count} words to the '{group_name}' group.")
+        return imported
+
+    def _next_word_id(self, cursor):
+        # AUTOINCREMENT never reuses ids, so honour sqlite_sequence as well
         cursor.execute('''
-            UPDATE groups
-            SET words_count = (SELECT COUNT(*) FROM word_groups WHERE group_id = ?)
-            WHERE id = ?
-        ''', (core_words_group_id, core_words_group_id))
-        self.get().commit()  # ✅ Updates word count after inserting words
+            SELECT MAX(
+                COALESCE((SELECT MAX(id) FROM words), 0),
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'words'), 0)
+            ) + 1
+        ''')
+        return cursor.fetchone()[0]
 
-        print(f"Successfully added {len(words)} words to the '{group_name}' group.")
+    def _group_id(self, cursor, group_name):
+        cursor.execute('SELECT id FROM groups WHERE name = ? ORDER BY id LIMIT 1', (group_name,))
+        row = cursor.fetchone()
+        if row:
+            return row[0]
+        cursor.execute('INSERT INTO groups (name, words_count) VALUES (?, 0)', (group_name,))
+        return cursor.lastrowid
 
     def init(self, app):
         with app.app_context():
             cursor = self.cursor()
             self.setup_tables(cursor)
- 
-            # ✅ Now properly imports Korean words (Handles `example["korean"]` and `example["english"]`)
+
             self.import_word_json(cursor, 'Core Korean', 'seed/data_korean.json')
 
             self.import_study_activities_json(cursor, 'seed/study_activities.json')
 
-def load_seed_data(db, Word, Group, StudyActivity):
-    """Load seed data from JSON files into the database"""
-    # Load Korean words
-    with open('seed/data_korean.json', 'r', encoding='utf-8') as f:
-        words_data = json.load(f)
-        
-    # Create or get Core Korean group
-    core_group = Group.query.filter_by(name='Core Korean').first()
-    if not core_group:
-        core_group = Group(name='Core Korean')
-        db.session.add(core_group)
-    
-    # Add words
-    for word_data in words_data:
-        # Ensure english is a list
-        english_meanings = word_data['english']
-        if isinstance(english_meanings, str):
-            english_meanings = [english_meanings]
-            
-        word = Word(
-            hangul=word_data['hangul'],
-            romanization=word_data['romanization'],
-            english=english_meanings,  # Will be automatically handled by SQLAlchemy
-            type=word_data['type'],
-            example_korean=word_data.get('example', {}).get('korean', ''),
-            example_english=word_data.get('example', {}).get('english', '')
-        )
-        word.groups.append(core_group)
-        db.session.add(word)
-    
+
+def _batches(items, size=IMPORT_BATCH_SIZE):
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _english(word):
+    # Seed files store meanings as a list or a single string
+    english = word['english']
+    return [english] if isinstance(english, str) else english
+
+
+def _word_row(word):
+    example = word.get('example') or {}
+    return (
+        word['hangul'],
+        word['romanization'],
+        ', '.join(_english(word)),
+        word['type'],
+        json.dumps(word.get('parts', [])),
+        example.get('korean', ''),
+        example.get('english', '')
+    )
+
+
+def load_seed_data(db, Word, Group, StudyActivity, word_files=None):
+    """Load seed data from JSON files into the database.
+
+    `word_files` maps group names to word files (default: Core Korean), or
+    is a list of (group_name, path) pairs when a group takes several files.
+    Words are streamed and bulk-inserted in batches, and everything is
+    committed once at the end.
+    """
+    word_files = word_files or {'Core Korean': 'seed/data_korean.json'}
+    if isinstance(word_files, dict):
+        word_files = word_files.items()
+    words_groups = Word.groups.property.secondary
+    insert_words = insert(Word).returning(Word.id, sort_by_parameter_order=True)
+
+    for group_name, path in word_files:
+        # Create or get the group
+        group = Group.query.filter_by(name=group_name).first()
+        if not group:
+            group = Group(name=group_name, words_count=0)
+            db.session.add(group)
+            db.session.flush()
+
+        count = 0
+        for batch in _batches(iter_json_array(path)):
+            word_ids = db.session.scalars(insert_words, [{
+                'hangul': word_data['hangul'],
+                'romanization': word_data['romanization'],
+                'english': _english(word_data),  # Will be automatically handled by SQLAlchemy
+                'type': word_data['type'],
+                'example_korean': (word_data.get('example') or {}).get('korean', ''),
+                'example_english': (word_data.get('example') or {}).get('english', '')
+            } for word_data in batch]).all()
+            db.session.execute(insert(words_groups), [
+                {'word_id': word_id, 'group_id': group.id} for word_id in word_ids
+            ])
+            count += len(word_ids)
+
+        # Update group word count
+        group.words_count = (group.words_count or 0) + count
+
     # Load study activities
-    with open('seed/study_activities.json', 'r', encoding='utf-8') as f:
-        activities_data = json.load(f)
-        
-    for activity_data in activities_data:
-        activity = StudyActivity(
-            name=activity_data['name'],
-            url=activity_data['url'],
-            thumbnail_url=activity_data.get('preview_url', '')
-        )
-        db.session.add(activity)
-    
-    # Update group word count
-    core_group.words_count = len(words_data)
-    
+    activities = [{
+        'name': activity_data['name'],
+        'url': activity_data['url'],
+        'thumbnail_url': activity_data.get('preview_url', '')
+    } for activity_data in iter_json_array('seed/study_activities.json')]
+    if activities:
+        db.session.execute(insert(StudyActivity), activities)
+
     # Commit all changes
     db.session.commit()
@@ -0,0 +1,83 @@
+import json
+import re
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = re.compile(r'\s*')
+
+
+class _Buffer:
+    """Text read from a file in chunks, dropping what has been consumed"""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character ('' at the end)"""
+        while True:
+            self.pos = WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.more():
+                return ''
+
+
+def _item_complete(text, end):
+    # Decoded up to `end` and followed by the array's next separator
+    if end is None:
+        return False
+    after = WHITESPACE.match(text, end).end()
+    return after < len(text) and text[after] in ',]'
+
+
+def iter_json_array(path, chunk_size=CHUNK_SIZE):
+    """Yield the items of a top-level JSON array one at a time.
+
+    Only the current item (plus one chunk) is held in memory, unlike
+    json.load, so seed files of any size can be imported.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as file:
+        buffer = _Buffer(file, chunk_size)
+        if buffer.peek() != '[':
+            raise ValueError(f'{path}: expected a JSON array')
+        buffer.pos += 1
+        if buffer.peek() == ']':
+            return
+
+        while True:
+            buffer.peek()
+            try:
+                item, end = decoder.raw_decode(buffer.text, buffer.pos)
+            except json.JSONDecodeError as e:
+                error, end = e, None
+            else:
+                error = None
+            if not _item_complete(buffer.text, end) and buffer.more():
+                # The item (or the digits of a number) continues in the
+                # next chunk
+                continue
+            if error is not None:
+                raise error
+            buffer.pos = end
+            yield item
+
+            separator = buffer.peek()
+            if separator == ',':
+                buffer.pos += 1
+            elif separator == ']':
+                return
+            else:
+                raise ValueError(f'{path}: expected "," or "]" after an array item')
@@ -0,0 +1,259 @@
+"""Denormalized read model for the list and dashboard endpoints.
+
+`word_documents` keeps one row per word: the sortable columns plus the
+word's API JSON, prebuilt, so list endpoints concatenate stored JSON
+instead of loading ORM objects and serializing them. `table_versions`
+counts writes per table; list endpoints derive their ETag from it.
+`study_session_summaries` keeps correct/wrong review counts per session
+for the dashboard.
+
+All are maintained by SQLite triggers, so every write path (ORM, bulk
+inserts, raw SQL) keeps them current.
+"""
+import base64
+import hashlib
+import json
+
+from flask import Response, request, stream_with_context, url_for
+from sqlalchemy import event, inspect, text
+
+from models import db
+
+VERSIONED_TABLES = ('words', 'words_groups', 'groups')
+SORT_COLUMNS = ('hangul', 'romanization', 'english', 'type')
+MAX_PAGE_SIZE = 1000
+
+
+def _word_body(row):
+    # Same JSON as routes/words.py builds (keys sorted, like jsonify)
+    return f'''json_object(
+        'english', CASE WHEN json_valid({row}.english) THEN json({row}.english) ELSE {row}.english END,
+        'example', json_object('english', {row}.example_english, 'korean', {row}.example_korean),
+        'hangul', {row}.hangul,
+        'id', {row}.id,
+        'romanization', {row}.romanization,
+        'type', {row}.type
+    )'''
+
+
+def _upsert_document(row):
+    return f'''
+        INSERT OR REPLACE INTO word_documents (word_id, hangul, romanization, english, type, body)
+        VALUES ({row}.id, {row}.hangul, {row}.romanization, {row}.english, {row}.type, {_word_body(row)});
+    '''
+
+
+def _count_review(row, sign):
+    # Add (sign=+1) or remove (sign=-1) one review from its session summary
+    return f'''
+        INSERT OR IGNORE INTO study_session_summaries (study_session_id) VALUES ({row}.study_session_id);
+        UPDATE study_session_summaries SET
+            correct_count = correct_count + CASE WHEN {row}.correct THEN {sign} ELSE 0 END,
+            wrong_count = wrong_count + CASE WHEN {row}.correct THEN 0 ELSE {sign} END
+        WHERE study_session_id = {row}.study_session_id;
+    '''
+
+
+def _bump(table):
+    return f"UPDATE table_versions SET version = version + 1 WHERE name = '{table}';"
+
+
+DDL = [
+    '''CREATE TABLE IF NOT EXISTS word_documents (
+        word_id INTEGER PRIMARY KEY,
+        hangul TEXT NOT NULL,
+        romanization TEXT NOT NULL,
+        english TEXT NOT NULL,
+        type TEXT NOT NULL,
+        body TEXT NOT NULL
+    )''',
+    '''CREATE TABLE IF NOT EXISTS table_versions (
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )''',
+    *(
+        f'CREATE INDEX IF NOT EXISTS idx_word_documents_{column} ON word_documents ({column}, word_id)'
+        for column in SORT_COLUMNS
+    ),
+    'CREATE INDEX IF NOT EXISTS idx_words_groups_group ON words_groups (group_id, word_id)',
+    f'''CREATE TRIGGER IF NOT EXISTS word_documents_ai AFTER INSERT ON words BEGIN
+        {_upsert_document('NEW')}
+    END''',
+    f'''CREATE TRIGGER IF NOT EXISTS word_documents_au AFTER UPDATE ON words BEGIN
+        DELETE FROM word_documents WHERE word_id = OLD.id AND OLD.id != NEW.id;
+        {_upsert_document('NEW')}
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS word_documents_ad AFTER DELETE ON words BEGIN
+        DELETE FROM word_documents WHERE word_id = OLD.id;
+    END''',
+    '''CREATE TABLE IF NOT EXISTS study_session_summaries (
+        study_session_id INTEGER PRIMARY KEY,
+        correct_count INTEGER NOT NULL DEFAULT 0,
+        wrong_count INTEGER NOT NULL DEFAULT 0
+    )''',
+    f'''CREATE TRIGGER IF NOT EXISTS study_session_summaries_ai AFTER INSERT ON word_review_items BEGIN
+        {_count_review('NEW', 1)}
+    END''',
+    f'''CREATE TRIGGER IF NOT EXISTS study_session_summaries_au AFTER UPDATE ON word_review_items BEGIN
+        {_count_review('OLD', -1)}
+        {_count_review('NEW', 1)}
+    END''',
+    f'''CREATE TRIGGER IF NOT EXISTS study_session_summaries_ad AFTER DELETE ON word_review_items BEGIN
+        {_count_review('OLD', -1)}
+    END''',
+    *(
+        f'''CREATE TRIGGER IF NOT EXISTS {table}_version_{suffix} AFTER {action} ON {table} BEGIN
+            {_bump(table)}
+        END'''
+        for table in VERSIONED_TABLES
+        for suffix, action in (('ai', 'INSERT'), ('au', 'UPDATE'), ('ad', 'DELETE'))
+    ),
+]
+
+
+def ensure(connection):
+    """Create the read model if missing and fill it from the source tables.
+
+    Idempotent; a no-op until the ORM tables exist.
+    """
+    if not inspect(connection).has_table('words'):
+        return
+    for statement in DDL:
+        connection.exec_driver_sql(statement)
+    connection.execute(
+        text('INSERT OR IGNORE INTO table_versions (name, version) VALUES (:name, 0)'),
+        [{'name': table} for table in VERSIONED_TABLES]
+    )
+    if _is_empty(connection, 'word_documents'):
+        rebuild_word_documents(connection)
+    if _is_empty(connection, 'study_session_summaries'):
+        rebuild_session_summaries(connection)
+
+
+def _is_empty(connection, table):
+    return connection.exec_driver_sql(f'SELECT NOT EXISTS (SELECT 1 FROM {table})').scalar()
+
+
+def rebuild(connection):
+    """Regenerate the whole read model from the source tables"""
+    rebuild_word_documents(connection)
+    rebuild_session_summaries(connection)
+
+
+def rebuild_word_documents(connection):
+    connection.exec_driver_sql('DELETE FROM word_documents')
+    connection.exec_driver_sql(f'''
+        INSERT INTO word_documents (word_id, hangul, romanization, english, type, body)
+        SELECT id, hangul, romanization, english, type, {_word_body('words')} FROM words
+    ''')
+
+
+def rebuild_session_summaries(connection):
+    connection.exec_driver_sql('DELETE FROM study_session_summaries')
+    connection.exec_driver_sql('''
+        INSERT INTO study_session_summaries (study_session_id, correct_count, wrong_count)
+        SELECT study_session_id,
+               SUM(CASE WHEN correct THEN 1 ELSE 0 END),
+               SUM(CASE WHEN correct THEN 0 ELSE 1 END)
+        FROM word_review_items
+        GROUP BY study_session_id
+    ''')
+
+
+@event.listens_for(db.metadata, 'after_create')
+def _after_create(target, connection, **kw):
+    ensure(connection)
+
+
+def etag(tables, *parts):
+    """ETag value for a response built from `tables`, varying by `parts`"""
+    versions = dict(db.session.execute(text('SELECT name, version FROM table_versions')).all())
+    key = json.dumps([[versions.get(table, 0) for table in tables], parts], default=str)
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+
+def not_modified(tag):
+    """A 304 response when the client already has `tag`, else None"""
+    if request.if_none_match.contains_weak(tag):
+        response = Response(status=304)
+        response.set_etag(tag, weak=True)
+        return response
+    return None
+
+
+def json_array(bodies, tag, next_cursor=None):
+    """Response joining prebuilt JSON documents into an array"""
+    response = Response('[' + ','.join(bodies) + ']', mimetype='application/json')
+    return _with_headers(response, tag, next_cursor)
+
+
+def stream_json_array(result, tag, batch_size=500):
+    """Streamed response for a result with a `body` column, fetching
+    `batch_size` rows at a time so memory stays flat for any size"""
+    def generate():
+        yield '['
+        separator = ''
+        for rows in result.partitions(batch_size):
+            yield separator + ','.join(row.body for row in rows)
+            separator = ','
+        yield ']'
+
+    response = Response(stream_with_context(generate()), mimetype='application/json')
+    return _with_headers(response, tag)
+
+
+def _with_headers(response, tag, next_cursor=None):
+    response.set_etag(tag, weak=True)
+    # Clients may keep the body but must revalidate (cheap: a 304)
+    response.headers['Cache-Control'] = 'no-cache'
+    if next_cursor:
+        args = request.args.to_dict()
+        args.pop('page', None)
+        args['cursor'] = next_cursor
+        response.headers['X-Next-Cursor'] = next_cursor
+        response.headers['Link'] = f'<{url_for(request.endpoint, **request.view_args, **args)}>; rel="next"'
+    return response
+
+
+def review_stats():
+    """Review totals in one pass over the per-session summaries, instead
+    of counting word_review_items"""
+    return db.session.execute(text('''
+        SELECT COALESCE(SUM(correct_count), 0) AS correct_count,
+               COALESCE(SUM(wrong_count), 0) AS wrong_count,
+               (SELECT COUNT(*) FROM study_sessions) AS total_study_sessions
+        FROM study_session_summaries
+    ''')).one()
+
+
+def session_summary(study_session_id):
+    """(correct_count, wrong_count) of one session"""
+    row = db.session.execute(text(
+        'SELECT correct_count, wrong_count FROM study_session_summaries WHERE study_session_id = :id'
+    ), {'id': study_session_id}).first()
+    return row or (0, 0)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """[sort value, word id] from encode_cursor, or None when the cursor is
+    malformed: the id must be an integer SQLite can hold and the sort value
+    a string, number or null, since both are bound straight into SQL"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list) or len(values) != 2:
+        return None
+    value, id = values
+    if type(id) is not int or not -2**63 <= id < 2**63:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (str, int, float, type(None))):
+        return None
+    if isinstance(value, int) and not -2**63 <= value < 2**63:
+        return None
+    return values
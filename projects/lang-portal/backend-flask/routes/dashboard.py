@@ -1,10 +1,10 @@
 from flask import Blueprint, jsonify
-from models import StudySession, WordReviewItem, db
-from sqlalchemy import func
+from models import StudySession
+import read_model
 
 bp = Blueprint('dashboard', __name__)
 
-@bp.route('/api/dashboard/last_study_session')
+@bp.route('/dashboard/last_study_session')
 def last_study_session():
     session = StudySession.query.order_by(StudySession.created_at.desc()).first()
     if not session:
@@ -17,23 +17,21 @@ def last_study_session():
         'study_activity_id': session.study_activity_id
     })
 
-@bp.route('/api/dashboard/study_progress')
+@bp.route('/dashboard/study_progress')
 def study_progress():
-    correct_count = WordReviewItem.query.filter_by(correct=True).count()
-    wrong_count = WordReviewItem.query.filter_by(correct=False).count()
+    stats = read_model.review_stats()
     
     return jsonify({
-        'correct_count': correct_count,
-        'wrong_count': wrong_count,
-        'total_reviews': correct_count + wrong_count
+        'correct_count': stats.correct_count,
+        'wrong_count': stats.wrong_count,
+        'total_reviews': stats.correct_count + stats.wrong_count
     })
 
-@bp.route('/api/dashboard/quick-stats')
+@bp.route('/dashboard/quick-stats')
 def quick_stats():
-    total_words = WordReviewItem.query.count()
-    total_sessions = StudySession.query.count()
+    stats = read_model.review_stats()
     
     return jsonify({
-        'total_words_reviewed': total_words,
-        'total_study_sessions': total_sessions
+        'total_words_reviewed': stats.correct_count + stats.wrong_count,
+        'total_study_sessions': stats.total_study_sessions
     })
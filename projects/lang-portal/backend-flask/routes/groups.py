@@ -1,10 +1,11 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, abort, jsonify, request
 from models import Group, Word, StudySession, db
-from sqlalchemy import desc
+from sqlalchemy import desc, text
+import read_model
 
 bp = Blueprint('groups', __name__)
 
-@bp.route('/api/groups')
+@bp.route('/groups')
 def list_groups():
     page = request.args.get('page', 1, type=int)
     sort_by = request.args.get('sort_by', 'name')
@@ -26,7 +27,7 @@ def list_groups():
         'words_count': group.words_count
     } for group in paginated.items])
 
-@bp.route('/api/groups/<int:id>')
+@bp.route('/groups/<int:id>')
 def get_group(id):
     group = Group.query.get_or_404(id)
     return jsonify({
@@ -35,22 +36,45 @@ def get_group(id):
         'words_count': group.words_count
     })
 
-@bp.route('/api/groups/<int:id>/words')
+@bp.route('/groups/<int:id>/words')
 def get_group_words(id):
-    group = Group.query.get_or_404(id)
-    return jsonify([{
-        'id': word.id,
-        'hangul': word.hangul,
-        'romanization': word.romanization,
-        'english': word.english,
-        'type': word.type,
-        'example': {
-            'korean': word.example_korean,
-            'english': word.example_english
-        }
-    } for word in group.words])
-
-@bp.route('/api/groups/<int:id>/study_sessions')
+    limit = request.args.get('limit', type=int)
+    cursor = request.args.get('cursor')
+
+    tag = read_model.etag(['words', 'words_groups', 'groups'], id, limit, cursor)
+    cached = read_model.not_modified(tag)
+    if cached:
+        return cached
+    Group.query.get_or_404(id)
+
+    after = 0
+    if cursor:
+        values = read_model.decode_cursor(cursor)
+        if values is None:
+            abort(400, 'Invalid cursor')
+        after = values[1]
+    query = text('''
+        SELECT wg.word_id, d.body
+        FROM words_groups wg
+        JOIN word_documents d ON d.word_id = wg.word_id
+        WHERE wg.group_id = :group_id AND wg.word_id > :after
+        ORDER BY wg.word_id
+        LIMIT :limit
+    ''')
+
+    if limit is None and cursor is None:
+        # The whole group, streamed (LIMIT -1 means no limit in SQLite)
+        result = db.session.execute(query, {'group_id': id, 'after': 0, 'limit': -1})
+        return read_model.stream_json_array(result, tag)
+
+    limit = min(max(limit or 100, 1), read_model.MAX_PAGE_SIZE)
+    rows = db.session.execute(query, {'group_id': id, 'after': after, 'limit': limit}).all()
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = read_model.encode_cursor([None, rows[-1].word_id])
+    return read_model.json_array([row.body for row in rows], tag, next_cursor)
+
+@bp.route('/groups/<int:id>/study_sessions')
 def get_group_sessions(id):
     group = Group.query.get_or_404(id)
     return jsonify([{
@@ -7,7 +7,7 @@ def load(app):
     @cross_origin()
     def get_study_activities():
         cursor = app.db.cursor()
-        cursor.execute('SELECT id, name, url, preview_url FROM study_activities')
+        cursor.execute(app.db.sql('queries/study_activities/list.sql'))
         activities = cursor.fetchall()
         
         return jsonify([{
@@ -21,7 +21,7 @@ def load(app):
     @cross_origin()
     def get_study_activity(id):
         cursor = app.db.cursor()
-        cursor.execute('SELECT id, name, url, preview_url FROM study_activities WHERE id = ?', (id,))
+        cursor.execute(app.db.sql('queries/study_activities/get.sql'), (id,))
         activity = cursor.fetchone()
         
         if not activity:
@@ -40,7 +40,7 @@ def load(app):
         cursor = app.db.cursor()
         
         # Verify activity exists
-        cursor.execute('SELECT id FROM study_activities WHERE id = ?', (id,))
+        cursor.execute(app.db.sql('queries/study_activities/get.sql'), (id,))
         if not cursor.fetchone():
             return jsonify({'error': 'Activity not found'}), 404
 
@@ -49,36 +49,18 @@ def load(app):
         per_page = request.args.get('per_page', 10, type=int)
         offset = (page - 1) * per_page
 
-        # Get total count
-        cursor.execute('''
-            SELECT COUNT(*) as count 
-            FROM study_sessions ss
-            JOIN groups g ON g.id = ss.group_id
-            WHERE ss.study_activity_id = ?
-        ''', (id,))
-        total_count = cursor.fetchone()['count']
-
         # Get paginated sessions
-        cursor.execute('''
-            SELECT 
-                ss.id,
-                ss.group_id,
-                g.name as group_name,
-                sa.name as activity_name,
-                ss.created_at,
-                ss.study_activity_id as activity_id,
-                COUNT(wri.id) as review_items_count
-            FROM study_sessions ss
-            JOIN groups g ON g.id = ss.group_id
-            JOIN study_activities sa ON sa.id = ss.study_activity_id
-            LEFT JOIN word_review_items wri ON wri.study_session_id = ss.id
-            WHERE ss.study_activity_id = ?
-            GROUP BY ss.id, ss.group_id, g.name, sa.name, ss.created_at, ss.study_activity_id
-            ORDER BY ss.created_at DESC
-            LIMIT ? OFFSET ?
-        ''', (id, per_page, offset))
+        cursor.execute(app.db.sql('queries/study_activities/sessions_page.sql'), (id, per_page, offset))
         sessions = cursor.fetchall()
 
+        # A short page ends the list, so it already tells us the total;
+        # only count when there may be more rows (or the page is past the end)
+        if len(sessions) < per_page and (sessions or page == 1):
+            total_count = offset + len(sessions)
+        else:
+            cursor.execute(app.db.sql('queries/study_activities/sessions_count.sql'), (id,))
+            total_count = cursor.fetchone()['count']
+
         return jsonify({
             'items': [{
                 'id': session['id'],
@@ -102,14 +84,14 @@ def load(app):
         cursor = app.db.cursor()
         
         # Get activity details
-        cursor.execute('SELECT id, name, url, preview_url FROM study_activities WHERE id = ?', (id,))
+        cursor.execute(app.db.sql('queries/study_activities/get.sql'), (id,))
         activity = cursor.fetchone()
         
         if not activity:
             return jsonify({'error': 'Activity not found'}), 404
         
         # Get available groups
-        cursor.execute('SELECT id, name FROM groups')
+        cursor.execute(app.db.sql('queries/study_activities/launch_groups.sql'))
         groups = cursor.fetchall()
         
         return jsonify({
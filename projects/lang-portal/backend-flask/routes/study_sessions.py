@@ -1,10 +1,14 @@
 from flask import Blueprint, jsonify, request
 from models import StudySession, WordReviewItem, db
+from sqlalchemy import insert
+import read_model
 from datetime import datetime
 
 bp = Blueprint('study_sessions', __name__)
 
-@bp.route('/api/study_sessions')
+MAX_REVIEWS_PER_REQUEST = 1000
+
+@bp.route('/study_sessions')
 def list_sessions():
     page = request.args.get('page', 1, type=int)
     sessions = StudySession.query.paginate(page=page, per_page=100)
@@ -16,7 +20,7 @@ def list_sessions():
         'study_activity_id': session.study_activity_id
     } for session in sessions.items])
 
-@bp.route('/api/study_sessions', methods=['POST'])
+@bp.route('/study_sessions', methods=['POST'])
 def create_session():
     data = request.get_json()
     if 'group_id' not in data:
@@ -31,7 +35,7 @@ def create_session():
         'group_id': session.group_id
     })
 
-@bp.route('/api/study_sessions/<int:id>/words/<int:word_id>/review', methods=['POST'])
+@bp.route('/study_sessions/<int:id>/words/<int:word_id>/review', methods=['POST'])
 def review_word(id, word_id):
     data = request.get_json()
     if 'correct' not in data:
@@ -45,4 +49,48 @@ def review_word(id, word_id):
     db.session.add(review)
     db.session.commit()
     
-    return jsonify({'status': 'success', 'message': 'Review recorded.'})
\ No newline at end of file
+    return jsonify({'status': 'success', 'message': 'Review recorded.'})
+
+@bp.route('/study_sessions/<int:id>/reviews', methods=['POST'])
+def review_words(id):
+    """Record a whole round of answers in one transaction.
+
+    Body: {"reviews": [{"word_id": 1, "correct": true}, ...]} (or just
+    the list).
+    """
+    data = request.get_json(silent=True)
+    reviews = data.get('reviews') if isinstance(data, dict) else data
+    if not isinstance(reviews, list) or not reviews:
+        return jsonify({'error': 'Invalid input', 'message': 'reviews must be a non-empty list'}), 400
+    if len(reviews) > MAX_REVIEWS_PER_REQUEST:
+        return jsonify({
+            'error': 'Invalid input',
+            'message': f'at most {MAX_REVIEWS_PER_REQUEST} reviews per request'
+        }), 400
+    for index, review in enumerate(reviews):
+        if not (
+            isinstance(review, dict)
+            and isinstance(review.get('word_id'), int) and not isinstance(review['word_id'], bool)
+            and isinstance(review.get('correct'), bool)
+        ):
+            return jsonify({
+                'error': 'Invalid input',
+                'message': f'reviews[{index}] needs an integer word_id and a boolean correct'
+            }), 400
+
+    StudySession.query.get_or_404(id)
+    db.session.execute(insert(WordReviewItem), [{
+        'word_id': review['word_id'],
+        'study_session_id': id,
+        'correct': review['correct']
+    } for review in reviews])
+    db.session.commit()
+
+    correct_count, wrong_count = read_model.session_summary(id)
+    return jsonify({
+        'status': 'success',
+        'message': f'{len(reviews)} reviews recorded.',
+        'recorded': len(reviews),
+        'correct_count': correct_count,
+        'wrong_count': wrong_count
+    })
@@ -1,39 +1,54 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, abort, jsonify, request
 from models import Word, db
-from sqlalchemy import desc
+from sqlalchemy import text
+import read_model
 
 bp = Blueprint('words', __name__)
 
+PER_PAGE = 100
+
 @bp.route('/words')
 def list_words():
-    page = request.args.get('page', 1, type=int)
+    page = request.args.get('page', type=int)
+    cursor = request.args.get('cursor')
     sort_by = request.args.get('sort_by', 'hangul')
     order = request.args.get('order', 'asc')
-    
-    query = Word.query
-    
-    if sort_by in ['hangul', 'romanization', 'english', 'type']:
-        if order == 'desc':
-            query = query.order_by(desc(getattr(Word, sort_by)))
-        else:
-            query = query.order_by(getattr(Word, sort_by))
-            
-    paginated = query.paginate(page=page, per_page=100, error_out=False)
-    
-    if not paginated.items:
-        return jsonify([])
-    
-    return jsonify([{
-        'id': word.id,
-        'hangul': word.hangul,
-        'romanization': word.romanization,
-        'english': word.english,
-        'type': word.type,
-        'example': {
-            'korean': word.example_korean,
-            'english': word.example_english
-        }
-    } for word in paginated.items])
+    limit = min(max(request.args.get('limit', PER_PAGE, type=int), 1), read_model.MAX_PAGE_SIZE)
+
+    if sort_by not in read_model.SORT_COLUMNS:
+        sort_by = 'word_id'
+    direction, comparison = ('DESC', '<') if order == 'desc' else ('ASC', '>')
+
+    tag = read_model.etag(['words'], sort_by, direction, limit, page, cursor)
+    cached = read_model.not_modified(tag)
+    if cached:
+        return cached
+
+    # Keyset pagination over idx_word_documents_<sort_by>; `page` (an
+    # OFFSET) still works for old clients. Neither needs a COUNT.
+    params = {'limit': limit, 'offset': 0}
+    where = ''
+    if cursor:
+        values = read_model.decode_cursor(cursor)
+        if values is None or values[0] is None:
+            abort(400, 'Invalid cursor')
+        params['value'], params['id'] = values
+        where = f'WHERE ({sort_by}, word_id) {comparison} (:value, :id)'
+    elif page:
+        params['offset'] = (max(page, 1) - 1) * limit
+
+    rows = db.session.execute(text(f'''
+        SELECT {sort_by} AS sort_value, word_id, body
+        FROM word_documents
+        {where}
+        ORDER BY {sort_by} {direction}, word_id {direction}
+        LIMIT :limit OFFSET :offset
+    '''), params).all()
+
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = read_model.encode_cursor([rows[-1].sort_value, rows[-1].word_id])
+    return read_model.json_array([row.body for row in rows], tag, next_cursor)
 
 @bp.route('/words/<int:id>')
 def get_word(id):
@@ -0,0 +1,142 @@
+"""Benchmark lib/db.py under concurrent requests.
+
+Builds a throwaway database (sql/setup schema, --sessions study sessions
+with --reviews review items), mounts routes/study_activities.py on a bare
+Flask app and fires --requests requests from --concurrency threads
+through Flask's test client. Each run is done twice: with the pooled
+Db, and with a copy of the old behaviour (sqlite3.connect per request
+and the SQL file read on every Db.sql call).
+
+Usage (from the backend-flask directory):
+    python scripts/bench_db.py --concurrency 200 --requests 4000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, g  # noqa: E402
+
+from lib.db import SQL_DIR, Db  # noqa: E402
+from routes import study_activities  # noqa: E402
+
+
+class LegacyDb(Db):
+    """Db as it was: one connection per request, SQL read from disk"""
+
+    def get(self):
+        if 'db' not in g:
+            g.db = sqlite3.connect(self.database)
+            g.db.row_factory = sqlite3.Row
+        return g.db
+
+    def close(self):
+        db = g.pop('db', None)
+        if db is not None:
+            db.close()
+
+    def sql(self, filepath):
+        with open(os.path.join(SQL_DIR, filepath), 'r') as file:
+            return file.read()
+
+
+def build_database(path, groups, sessions, reviews):
+    app = Flask(__name__)
+    db = Db(path)
+    db.init_app(app)
+    with app.app_context():
+        cursor = db.cursor()
+        db.setup_tables(cursor)
+        cursor.execute(
+            "INSERT INTO study_activities (name, url, preview_url) "
+            "VALUES ('Typing Tutor', 'http://localhost:8080', '/typing.png')"
+        )
+        cursor.executemany(
+            'INSERT INTO groups (name) VALUES (?)',
+            [(f'Group {n}',) for n in range(groups)],
+        )
+        cursor.executemany(
+            'INSERT INTO study_sessions (group_id, study_activity_id, created_at) '
+            "VALUES (?, 1, datetime('now', ?))",
+            [(random.randint(1, groups), f'-{n} minutes') for n in range(sessions)],
+        )
+        cursor.executemany(
+            'INSERT INTO word_review_items (word_id, study_session_id, correct) '
+            'VALUES (?, ?, ?)',
+            (
+                (random.randint(1, 2000), random.randint(1, sessions), random.random() < 0.7)
+                for _ in range(reviews)
+            ),
+        )
+        db.commit()
+    db.pool.close()
+
+
+def make_app(db_class, path):
+    app = Flask(__name__)
+    db_class(path).init_app(app)
+    study_activities.load(app)
+    return app
+
+
+def run(app, requests, concurrency, pages):
+    urls = [
+        '/api/study-activities',
+        '/api/study-activities/1',
+        '/api/study-activities/1/launch',
+    ] + [f'/api/study-activities/1/sessions?page={page}' for page in range(1, pages + 1)]
+
+    def call(n):
+        client = app.test_client()
+        started = time.perf_counter()
+        response = client.get(urls[n % len(urls)])
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(concurrency)))  # warm up
+        started = time.perf_counter()
+        latencies = sorted(pool.map(call, range(requests)))
+        elapsed = time.perf_counter() - started
+    return {
+        'rps': requests / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=4000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--groups', type=int, default=50)
+    parser.add_argument('--sessions', type=int, default=20000)
+    parser.add_argument('--reviews', type=int, default=200000)
+    parser.add_argument('--pages', type=int, default=20)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix='lang-portal-bench-'), 'words.db')
+    build_database(path, args.groups, args.sessions, args.reviews)
+    print(f'{args.sessions:,} sessions, {args.reviews:,} review items in {path}')
+    print(f'{args.requests:,} requests from {args.concurrency} threads')
+
+    for label, db_class in (('per-request connect', LegacyDb), ('pooled', Db)):
+        app = make_app(db_class, path)
+        result = run(app, args.requests, args.concurrency, args.pages)
+        print(
+            f"{label:>20}: {result['rps']:7.0f} req/s  "
+            f"p50 {result['p50_ms']:6.1f} ms  p95 {result['p95_ms']:6.1f} ms"
+        )
+        if db_class is Db:
+            print(f'{"":>20}  {len(app.db.pool._all)} connections opened')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark importing a large word deck.
+
+Writes a synthetic --words word JSON file, then imports it into fresh
+databases three ways. Each import runs twice: once timed, once under
+tracemalloc for peak Python memory (tracing slows it down).
+
+- the old Db.import_word_json: json.load, then an INSERT per word and
+  per word_groups row
+- Db.import_word_json: streamed, executemany in batches
+- load_seed_data (the Flask-SQLAlchemy schema): streamed, bulk inserts
+
+Usage (from the backend-flask directory):
+    python scripts/bench_import.py --words 50000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask  # noqa: E402
+
+from lib.db import Db, load_seed_data  # noqa: E402
+
+
+def write_deck(path, words):
+    syllables = [chr(code) for code in range(0xAC00, 0xD7A4, 37)]
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump([{
+            'hangul': ''.join(random.choices(syllables, k=random.randint(1, 4))),
+            'romanization': f'word{n}',
+            'type': random.choice(['noun', 'verb', 'adjective']),
+            'english': [f'meaning {n}', f'sense {n}'],
+            'example': {'korean': '이것은 예문입니다. ' * 3, 'english': 'This is an example. ' * 3},
+        } for n in range(words)], file, ensure_ascii=False, indent=2)
+
+
+def legacy_import(db, cursor, group_name, data_json_path):
+    cursor.execute('INSERT OR IGNORE INTO groups (name) VALUES (?)', (group_name,))
+    db.get().commit()
+    cursor.execute('SELECT id FROM groups WHERE name = ?', (group_name,))
+    group_id = cursor.fetchone()[0]
+    words = db.load_json(data_json_path)
+    for word in words:
+        cursor.execute('''
+            INSERT INTO words (hangul, romanization, english, type, parts, example_korean, example_english)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            word['hangul'], word['romanization'], ', '.join(word['english']), word['type'],
+            json.dumps(word.get('parts', [])), word['example']['korean'], word['example']['english']
+        ))
+        cursor.execute('INSERT INTO word_groups (word_id, group_id) VALUES (?, ?)', (cursor.lastrowid, group_id))
+    db.get().commit()
+    cursor.execute('''
+        UPDATE groups
+        SET words_count = (SELECT COUNT(*) FROM word_groups WHERE group_id = ?)
+        WHERE id = ?
+    ''', (group_id, group_id))
+    db.get().commit()
+
+
+def measure(label, run):
+    """`run(name)` imports into a fresh database called `name`"""
+    started = time.perf_counter()
+    run(f'{label}-timed')
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    run(f'{label}-traced')
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'{label:>28}: {elapsed:6.2f}s  peak {peak / 1024 / 1024:7.1f} MB')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=50000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='lang-portal-import-')
+    deck = os.path.join(directory, 'deck.json')
+    write_deck(deck, args.words)
+    print(f'{args.words:,} words, {os.path.getsize(deck) / 1024 / 1024:.1f} MB of JSON')
+
+    def sqlite_import(importer):
+        def run(name):
+            app = Flask(__name__)
+            db = Db(os.path.join(directory, f'{name}.db'))
+            db.init_app(app)
+            with app.app_context():
+                cursor = db.cursor()
+                db.setup_tables(cursor)
+                importer(db, cursor, 'Deck', deck)
+                count = cursor.execute("SELECT words_count FROM groups WHERE name = 'Deck'").fetchone()[0]
+                assert count == args.words, count
+        return run
+
+    def orm_import(name):
+        from models import db, Group, StudyActivity, Word
+
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(directory, f'{name}.db')
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            load_seed_data(db, Word, Group, StudyActivity, {'Deck': deck})
+
+    measure('legacy', sqlite_import(legacy_import))
+    measure('batched', sqlite_import(lambda db, *params: db.import_word_json(*params)))
+    measure('orm', orm_import)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark the word list endpoints against the old ORM handlers.
+
+Loads a synthetic group of --words words into a throwaway database and
+times, through Flask's test client:
+
+- GET /api/words pages: the old query.paginate handler vs the read model
+  (offset and keyset), and a revalidation answered with 304
+- GET /api/groups/<id>/words for the whole group: the old relationship
+  handler vs the streamed read model, with peak Python memory
+
+Usage (from the backend-flask directory):
+    python scripts/bench_lists.py --words 50000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify, request  # noqa: E402
+
+from lib.db import load_seed_data  # noqa: E402
+from models import Group, StudyActivity, Word, db  # noqa: E402
+from routes import groups, words  # noqa: E402
+
+
+def word_json(word):
+    return {
+        'id': word.id,
+        'hangul': word.hangul,
+        'romanization': word.romanization,
+        'english': word.english,
+        'type': word.type,
+        'example': {'korean': word.example_korean, 'english': word.example_english},
+    }
+
+
+def add_legacy_routes(app):
+    @app.route('/legacy/words')
+    def legacy_words():
+        page = request.args.get('page', 1, type=int)
+        paginated = Word.query.order_by(Word.hangul).paginate(page=page, per_page=100, error_out=False)
+        return jsonify([word_json(word) for word in paginated.items])
+
+    @app.route('/legacy/groups/<int:id>/words')
+    def legacy_group_words(id):
+        group = Group.query.get_or_404(id)
+        return jsonify([word_json(word) for word in group.words])
+
+
+def make_app(path, count):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + path
+    db.init_app(app)
+    app.register_blueprint(words.bp, url_prefix='/api')
+    app.register_blueprint(groups.bp, url_prefix='/api')
+    add_legacy_routes(app)
+
+    deck = path + '.json'
+    syllables = [chr(code) for code in range(0xAC00, 0xD7A4, 37)]
+    with open(deck, 'w', encoding='utf-8') as file:
+        json.dump([{
+            'hangul': ''.join(random.choices(syllables, k=random.randint(1, 4))),
+            'romanization': f'word{n}',
+            'type': 'noun',
+            'english': [f'meaning {n}'],
+            'example': {'korean': '예문입니다.', 'english': 'An example.'},
+        } for n in range(count)], file, ensure_ascii=False)
+    with app.app_context():
+        db.create_all()
+        load_seed_data(db, Word, Group, StudyActivity, {'Deck': deck})
+    return app
+
+
+def timed(client, url, repeat, headers=None):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(url, headers=headers)
+        response.get_data()
+    return (time.perf_counter() - started) / repeat * 1000, response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix='lang-portal-lists-'), 'words.db')
+    app = make_app(path, args.words)
+    client = app.test_client()
+    deep_page = args.words // 100 // 2
+    print(f'{args.words:,} words in one group')
+
+    for label, url in (
+        ('old paginate, page 1', '/legacy/words?page=1'),
+        (f'old paginate, page {deep_page}', f'/legacy/words?page={deep_page}'),
+        ('read model, page 1', '/api/words?page=1'),
+        (f'read model, page {deep_page}', f'/api/words?page={deep_page}'),
+    ):
+        ms, _ = timed(client, url, args.repeat)
+        print(f'{label:>32}: {ms:7.2f} ms')
+
+    _, response = timed(client, f'/api/words?page={deep_page - 1}', 1)
+    url = f"/api/words?cursor={response.headers['X-Next-Cursor']}"
+    ms, response = timed(client, url, args.repeat)
+    print(f'{"read model, keyset cursor":>32}: {ms:7.2f} ms')
+    ms, revalidated = timed(client, url, args.repeat, {'If-None-Match': response.headers['ETag']})
+    assert revalidated.status_code == 304
+    print(f'{"read model, 304 revalidation":>32}: {ms:7.2f} ms')
+
+    for label, url in (
+        ('old group words (full)', '/legacy/groups/1/words'),
+        ('streamed group words (full)', '/api/groups/1/words'),
+    ):
+        ms, _ = timed(client, url, 3)
+        tracemalloc.start()
+        client.get(url).get_data()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'{label:>32}: {ms:7.0f} ms  peak {peak / 1024 / 1024:6.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
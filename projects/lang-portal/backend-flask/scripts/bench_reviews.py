@@ -0,0 +1,111 @@
+"""Benchmark dashboard stats and review writes.
+
+Fills a throwaway database with --sessions study sessions holding
+--reviews word_review_items, then times through Flask's test client:
+
+- /api/dashboard/study_progress: the old two filtered COUNTs vs the
+  summary table query
+- recording a --round-word flashcard round: one POST per answer vs one
+  POST to /api/study_sessions/<id>/reviews
+
+Usage (from the backend-flask directory):
+    python scripts/bench_reviews.py --reviews 500000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from models import Group, StudySession, WordReviewItem, db  # noqa: E402
+from routes import dashboard, study_sessions  # noqa: E402
+
+
+def make_app(path, sessions, reviews):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + path
+    db.init_app(app)
+    app.register_blueprint(dashboard.bp, url_prefix='/api')
+    app.register_blueprint(study_sessions.bp, url_prefix='/api')
+
+    @app.route('/legacy/dashboard/study_progress')
+    def legacy_study_progress():
+        correct_count = WordReviewItem.query.filter_by(correct=True).count()
+        wrong_count = WordReviewItem.query.filter_by(correct=False).count()
+        return jsonify({
+            'correct_count': correct_count,
+            'wrong_count': wrong_count,
+            'total_reviews': correct_count + wrong_count
+        })
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(Group(name='Deck'))
+        db.session.execute(insert(StudySession), [{'group_id': 1} for _ in range(sessions)])
+        for start in range(0, reviews, 50000):
+            db.session.execute(insert(WordReviewItem), [{
+                'word_id': random.randint(1, 2000),
+                'study_session_id': random.randint(1, sessions),
+                'correct': random.random() < 0.7,
+            } for _ in range(start, min(start + 50000, reviews))])
+        db.session.commit()
+    return app
+
+
+def timed(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=5000)
+    parser.add_argument('--reviews', type=int, default=500000)
+    parser.add_argument('--round-words', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix='lang-portal-reviews-'), 'words.db')
+    started = time.perf_counter()
+    app = make_app(path, args.sessions, args.reviews)
+    print(f'{args.reviews:,} reviews in {args.sessions:,} sessions (loaded in {time.perf_counter() - started:.1f}s)')
+    client = app.test_client()
+
+    legacy_ms, legacy = timed(lambda: client.get('/legacy/dashboard/study_progress').get_json(), args.repeat)
+    new_ms, new = timed(lambda: client.get('/api/dashboard/study_progress').get_json(), args.repeat)
+    assert legacy == new, (legacy, new)
+    print(f'{"study_progress, two COUNTs":>36}: {legacy_ms:8.2f} ms')
+    print(f'{"study_progress, summary table":>36}: {new_ms:8.2f} ms')
+
+    answers = [
+        {'word_id': word_id, 'correct': random.random() < 0.7}
+        for word_id in range(1, args.round_words + 1)
+    ]
+
+    def one_by_one():
+        for answer in answers:
+            client.post(
+                f"/api/study_sessions/1/words/{answer['word_id']}/review",
+                json={'correct': answer['correct']}
+            )
+
+    def batched():
+        response = client.post('/api/study_sessions/1/reviews', json={'reviews': answers})
+        assert response.status_code == 200, response.get_json()
+
+    per_answer_ms, _ = timed(one_by_one, 3)
+    batch_ms, _ = timed(batched, 3)
+    print(f'{f"{args.round_words} answers, one POST each":>36}: {per_answer_ms:8.2f} ms')
+    print(f'{f"{args.round_words} answers, one batch POST":>36}: {batch_ms:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
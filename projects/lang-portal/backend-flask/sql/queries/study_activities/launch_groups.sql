@@ -0,0 +1 @@
+SELECT id, name FROM groups
@@ -0,0 +1 @@
+SELECT id, name, url, preview_url FROM study_activities
@@ -0,0 +1,5 @@
+-- Answered from idx_study_sessions_activity alone (group_id is NOT NULL
+-- and references groups, so joining groups only added table lookups)
+SELECT COUNT(*) as count
+FROM study_sessions
+WHERE study_activity_id = ?
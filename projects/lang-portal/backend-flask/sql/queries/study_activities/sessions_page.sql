@@ -0,0 +1,20 @@
+-- Pages through idx_study_sessions_activity, then counts review items
+-- for the returned rows only (grouping first would aggregate every session)
+SELECT
+    ss.id,
+    ss.group_id,
+    g.name as group_name,
+    sa.name as activity_name,
+    ss.created_at,
+    ss.study_activity_id as activity_id,
+    (
+        SELECT COUNT(*)
+        FROM word_review_items wri
+        WHERE wri.study_session_id = ss.id
+    ) as review_items_count
+FROM study_sessions ss
+JOIN groups g ON g.id = ss.group_id
+JOIN study_activities sa ON sa.id = ss.study_activity_id
+WHERE ss.study_activity_id = ?
+ORDER BY ss.created_at DESC
+LIMIT ? OFFSET ?
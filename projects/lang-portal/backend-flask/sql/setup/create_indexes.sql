@@ -0,0 +1,3 @@
+CREATE INDEX IF NOT EXISTS idx_study_sessions_activity ON study_sessions (study_activity_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_word_review_items_session ON word_review_items (study_session_id);
+CREATE INDEX IF NOT EXISTS idx_word_groups_group ON word_groups (group_id, word_id);
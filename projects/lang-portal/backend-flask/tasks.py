@@ -23,15 +23,23 @@ def init_db(ctx):
         print(f"Error initializing database: {e}")
         raise
 
-@task
-def seed_db(ctx):
+@task(iterable=['words'], help={'words': 'GROUP=path/to/words.json (repeatable)'})
+def seed_db(ctx, words=None):
     """Load seed data into the database"""
     try:
+        # (group, path) pairs: a group may be given several files
+        word_files = []
+        for option in words or []:
+            group_name, _, path = option.partition('=')
+            if not path:
+                raise ValueError(f"Expected GROUP=path, got '{option}'")
+            word_files.append((group_name, path))
+
         app = create_app()
         with app.app_context():
             # Load data from JSON files
             from lib.db import load_seed_data
-            load_seed_data(db, Word, Group, StudyActivity)
+            load_seed_data(db, Word, Group, StudyActivity, word_files or None)
             print("Database seeded successfully!")
     except Exception as e:
         print(f"Error seeding database: {e}")
@@ -7,6 +7,8 @@ from qdrant_client import QdrantClient, models
 from sentence_transformers import SentenceTransformer
 import torch  # To check for GPU availability
 
+from src.tools.vector_store import FILTER_FIELDS
+
 
 def main():
     # Parse command line arguments
@@ -115,6 +117,14 @@ def main():
             # Add optimized HNSW indexing for faster search
             hnsw_config=models.HnswConfigDiff(m=16, ef_construct=200),
         )
+        # Keyword indexes for the metadata agents filter on, created
+        # before the upload so Qdrant indexes points with them
+        for field in FILTER_FIELDS:
+            client.create_payload_index(
+                collection_name=COLLECTION_NAME,
+                field_name=field,
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
         print(f"Collection '{COLLECTION_NAME}' ensured.")
     except Exception as e:
         print(f"Error creating Qdrant collection: {e}")
@@ -0,0 +1,543 @@
+"""
+Ingestion pipeline: text files -> chunks -> embeddings -> Qdrant
+
+Does the work of process_text_data.py followed by embed_and_upload.py in
+one streaming run, into Qdrant or the embedded local store (--store).
+The stages run at the same time, connected by bounded queues so memory
+stays flat for any corpus size:
+
+    discover *.txt -> chunk (process pool) -> embed (batches)
+                   -> upsert (at most --max_in_flight batches at once)
+
+A manifest (SQLite, next to the processed chunks) records each chunk once
+the store has acknowledged its batch, with a hash of its content. Reruns
+skip unchanged files and chunks and delete points whose text went away,
+so only new or edited text is embedded, and an interrupted run resumes
+after the last committed batch.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from process_text_data import (
+    CHUNK_OVERLAP,
+    CHUNK_SIZE,
+    PROCESSED_FOLDER,
+    TEXT_FOLDER,
+    chunk_text_with_metadata,
+)
+from src.tools.embeddings import DEFAULT_MODEL, EmbeddingService
+from src.tools.vector_store import (
+    chunk_payload,
+    make_vector_store,
+    point_id,
+)
+
+MANIFEST_FILE = PROCESSED_FOLDER / "manifest.sqlite3"
+_DONE = object()  # End-of-stream marker passed down the queues
+
+
+# --- Chunking (runs in worker processes) ---
+def content_hash(model_name: str, payload: dict) -> str:
+    """Changes whenever the point would: new text, metadata or model"""
+    key = json.dumps([model_name, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def chunk_file(path: str, chunk_size: int, chunk_overlap: int, model: str):
+    """Chunk one file into (point_id, payload, content_hash) tuples"""
+    chunks = chunk_text_with_metadata(Path(path), chunk_size, chunk_overlap)
+    result = []
+    for chunk in chunks:
+        if not chunk.get("text"):
+            continue
+        payload = chunk_payload(chunk)
+        result.append(
+            (
+                point_id(chunk["chunk_id"]),
+                payload,
+                content_hash(model, payload),
+            )
+        )
+    return result
+
+
+# --- Manifest ---
+class Manifest:
+    """Which chunks and files are committed to which collection"""
+
+    def __init__(self, path: Path, collection: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.collection = collection
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS chunks (
+                collection TEXT NOT NULL,
+                point_id TEXT NOT NULL,
+                file TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                PRIMARY KEY (collection, point_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_chunks_file
+                ON chunks (collection, file);
+            CREATE TABLE IF NOT EXISTS files (
+                collection TEXT NOT NULL,
+                file TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                PRIMARY KEY (collection, file)
+            ) WITHOUT ROWID;
+            """)
+        self._lock = threading.Lock()
+
+    def _transaction(self, statements):
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for sql, params in statements:
+                    if isinstance(params, list):
+                        self._conn.executemany(sql, params)
+                    else:
+                        self._conn.execute(sql, params)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql, params):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def files(self) -> set:
+        return {
+            file
+            for (file,) in self._query(
+                "SELECT DISTINCT file FROM chunks WHERE collection = ?"
+                " UNION SELECT file FROM files WHERE collection = ?",
+                (self.collection, self.collection),
+            )
+        }
+
+    def file_unchanged(self, file: str, stat: os.stat_result) -> bool:
+        """True when the file was fully committed and has not changed since"""
+        return bool(
+            self._query(
+                "SELECT 1 FROM files WHERE collection = ? AND file = ?"
+                " AND size = ? AND mtime_ns = ?",
+                (self.collection, file, stat.st_size, stat.st_mtime_ns),
+            )
+        )
+
+    def chunk_hashes(self, file: str) -> dict:
+        return dict(
+            self._query(
+                "SELECT point_id, content_hash FROM chunks"
+                " WHERE collection = ? AND file = ?",
+                (self.collection, file),
+            )
+        )
+
+    def commit_chunks(self, rows):
+        """Record (point_id, file, content_hash) rows of an upserted batch"""
+        self._transaction(
+            [
+                (
+                    "INSERT OR REPLACE INTO chunks"
+                    " (collection, point_id, file, content_hash)"
+                    " VALUES (?, ?, ?, ?)",
+                    [(self.collection, *row) for row in rows],
+                )
+            ]
+        )
+
+    def commit_file(self, file: str, stat: os.stat_result):
+        self._transaction(
+            [
+                (
+                    "INSERT OR REPLACE INTO files"
+                    " (collection, file, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                    (self.collection, file, stat.st_size, stat.st_mtime_ns),
+                )
+            ]
+        )
+
+    def forget(self, file: str, point_ids=None):
+        """Drop a file, or only some of its chunks, from the manifest"""
+        if point_ids is None:
+            self._transaction(
+                [
+                    (
+                        "DELETE FROM chunks WHERE collection = ? AND file = ?",
+                        (self.collection, file),
+                    ),
+                    (
+                        "DELETE FROM files WHERE collection = ? AND file = ?",
+                        (self.collection, file),
+                    ),
+                ]
+            )
+        else:
+            self._transaction(
+                [
+                    (
+                        "DELETE FROM chunks"
+                        " WHERE collection = ? AND point_id = ?",
+                        [(self.collection, pid) for pid in point_ids],
+                    )
+                ]
+            )
+
+    def reset(self):
+        self._transaction(
+            [
+                (
+                    "DELETE FROM chunks WHERE collection = ?",
+                    (self.collection,),
+                ),
+                ("DELETE FROM files WHERE collection = ?", (self.collection,)),
+            ]
+        )
+
+
+# --- Pipeline ---
+def ensure_collection(store, dimension, manifest, recreate):
+    """Create the collection if needed; a new collection starts an empty
+    manifest, since nothing in it is committed any more"""
+    if store.exists() and not recreate:
+        if not store.count():
+            # Emptied or recreated by another tool (embed_and_upload.py)
+            manifest.reset()
+        store.create_payload_indexes()
+        return
+    print(f"Creating collection: {store.collection_name}")
+    store.create(dimension, recreate=recreate)
+    manifest.reset()
+
+
+def ingest(
+    store,
+    service,
+    manifest,
+    text_folder=TEXT_FOLDER,
+    workers=None,
+    batch_size=64,
+    max_in_flight=4,
+    chunk_size=CHUNK_SIZE,
+    chunk_overlap=CHUNK_OVERLAP,
+):
+    """
+    Bring the collection in line with the text files in `text_folder`
+
+    Args:
+        store: VectorStore holding manifest.collection
+        service: EmbeddingService used to embed the chunks
+        manifest: Manifest of what is already committed
+        text_folder: Folder with the *.txt files to ingest
+        workers: Chunking processes (defaults to the CPU count)
+        batch_size: Chunks per embedding and upsert batch
+        max_in_flight: Upserts running at once, and queue depth per stage
+        chunk_size: Characters per chunk
+        chunk_overlap: Characters shared by consecutive chunks
+
+    Returns:
+        Dict of counters: files, skipped_files, chunks, skipped_chunks,
+        uploaded and deleted
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = dict.fromkeys(
+        ("files", "skipped_files", "chunks", "skipped_chunks"), 0
+    )
+    stats.update(uploaded=0, deleted=0)
+    stats_lock = threading.Lock()
+    stop = threading.Event()
+    errors = []
+
+    embed_queue = queue.Queue(maxsize=max_in_flight)
+    upload_queue = queue.Queue(maxsize=max_in_flight)
+    # file -> [stat, chunks not committed yet]; a file is committed to
+    # the manifest when its last chunk is
+    pending_files = {}
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def get(q):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def stage(target):
+        def run():
+            try:
+                target()
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def embedder():
+        while (batch := get(embed_queue)) is not _DONE:
+            vectors = service.encode_many([item[2]["text"] for item in batch])
+            payloads = [payload for _, _, payload, _ in batch]
+            rows = [(pid, file, digest) for file, pid, _, digest in batch]
+            put(upload_queue, (vectors, payloads, rows))
+        for _ in range(max_in_flight):
+            put(upload_queue, _DONE)
+
+    def uploader():
+        while (batch := get(upload_queue)) is not _DONE:
+            vectors, payloads, rows = batch
+            store.upsert([row[0] for row in rows], vectors, payloads)
+            manifest.commit_chunks(rows)
+            finished = []
+            with stats_lock:
+                stats["uploaded"] += len(rows)
+                for _, file, _ in rows:
+                    pending_files[file][1] -= 1
+                    if pending_files[file][1] == 0:
+                        finished.append((file, pending_files.pop(file)[0]))
+            for file, stat in finished:
+                manifest.commit_file(file, stat)
+            print(f"  -> Committed {stats['uploaded']} chunks")
+
+    def delete(file, point_ids=None):
+        """Delete a file's points, or only `point_ids` of them"""
+        ids = list(
+            manifest.chunk_hashes(file) if point_ids is None else point_ids
+        )
+        if ids:
+            store.delete(ids)
+        manifest.forget(file, None if point_ids is None else ids)
+        stats["deleted"] += len(ids)
+
+    buffer = []
+
+    def queue_changes(file, stat, chunks):
+        """Send a chunked file's new or changed chunks to be embedded"""
+        known = manifest.chunk_hashes(file)
+        changed = [c for c in chunks if known.get(c[0]) != c[2]]
+        stale = set(known) - {c[0] for c in chunks}
+        if stale:
+            delete(file, stale)
+        with stats_lock:
+            stats["chunks"] += len(changed)
+            stats["skipped_chunks"] += len(chunks) - len(changed)
+            if changed:
+                pending_files[file] = [stat, len(changed)]
+        if not changed:
+            manifest.commit_file(file, stat)
+        for pid, payload, digest in changed:
+            buffer.append((file, pid, payload, digest))
+            if len(buffer) >= batch_size:
+                put(embed_queue, buffer[:])
+                buffer.clear()
+
+    threads = [stage(embedder)] + [
+        stage(uploader) for _ in range(max_in_flight)
+    ]
+    try:
+        paths = sorted(Path(text_folder).glob("*.txt"))
+        for file in manifest.files() - {path.name for path in paths}:
+            print(f"Removing chunks of deleted file: {file}")
+            delete(file)
+
+        # Spawned workers: forking after the model threads start is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context) as pool:
+            in_flight = deque()
+            for path in paths:
+                if stop.is_set():
+                    break
+                stat = path.stat()
+                if manifest.file_unchanged(path.name, stat):
+                    stats["skipped_files"] += 1
+                    continue
+                stats["files"] += 1
+                print(f"Processing file: {path.name}...")
+                future = pool.submit(
+                    chunk_file,
+                    str(path),
+                    chunk_size,
+                    chunk_overlap,
+                    service.model_name,
+                )
+                in_flight.append((path.name, stat, future))
+                # Keep every worker busy without chunking far ahead
+                while len(in_flight) > 2 * workers:
+                    file, stat, future = in_flight.popleft()
+                    queue_changes(file, stat, future.result())
+            while in_flight and not stop.is_set():
+                file, stat, future = in_flight.popleft()
+                queue_changes(file, stat, future.result())
+
+        if buffer:
+            put(embed_queue, buffer[:])
+        put(embed_queue, _DONE)
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.1)
+    except BaseException:
+        # Interrupted: committed batches stay in the manifest
+        stop.set()
+        raise
+    if errors:
+        raise errors[0]
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Chunk, embed and upload text files to the vector store, "
+        "skipping anything already uploaded"
+    )
+    parser.add_argument(
+        "--text_folder",
+        type=str,
+        default=str(TEXT_FOLDER),
+        help="Folder with the *.txt files to ingest",
+    )
+    parser.add_argument(
+        "--collection",
+        type=str,
+        default="korean_language_learning",
+        help="Collection name",
+    )
+    parser.add_argument(
+        "--store",
+        type=str,
+        default=os.environ.get("VECTOR_STORE", "qdrant"),
+        help="Vector store: qdrant or local (embedded, no server)",
+    )
+    parser.add_argument(
+        "--store_path",
+        type=str,
+        default=os.environ.get("VECTOR_STORE_PATH"),
+        help="Directory of the local vector store",
+    )
+    parser.add_argument(
+        "--qdrant_host",
+        type=str,
+        default=os.environ.get("QDRANT_HOST", "qdrant"),
+        help="Qdrant host address",
+    )
+    parser.add_argument(
+        "--qdrant_port",
+        type=str,
+        default=os.environ.get("QDRANT_PORT", "6333"),
+        help="Qdrant port",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=str(MANIFEST_FILE),
+        help="Where to record committed chunks",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=os.environ.get("EMBEDDING_MODEL", DEFAULT_MODEL),
+        help="Embedding model name or path",
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default=os.environ.get("EMBEDDING_BACKEND", "torch"),
+        help="Embedding backend: torch, onnx or onnx-int8",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Chunking processes",
+    )
+    parser.add_argument(
+        "--batch_size", type=int, default=64, help="Batch size for embeddings"
+    )
+    parser.add_argument(
+        "--max_in_flight",
+        type=int,
+        default=4,
+        help="Upsert batches sent to the store at once",
+    )
+    parser.add_argument(
+        "--force_cpu",
+        action="store_true",
+        help="Force CPU usage even if GPU is available",
+    )
+    parser.add_argument(
+        "--recreate",
+        action="store_true",
+        help="Drop the collection and ingest everything again",
+    )
+    args = parser.parse_args()
+
+    # No vector cache: the manifest already skips unchanged chunks
+    service = EmbeddingService(
+        args.model,
+        backend=args.backend,
+        device="cpu" if args.force_cpu else None,
+        cache_size=0,
+    )
+    store = make_vector_store(
+        args.collection,
+        backend=args.store,
+        url=f"http://{args.qdrant_host}:{args.qdrant_port}",
+        path=args.store_path,
+    )
+    manifest = Manifest(Path(args.manifest), args.collection)
+    ensure_collection(store, service.dimension, manifest, args.recreate)
+
+    started = time.perf_counter()
+    try:
+        stats = ingest(
+            store,
+            service,
+            manifest,
+            text_folder=args.text_folder,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            max_in_flight=args.max_in_flight,
+        )
+    finally:
+        # Saves the local store's indexes, so the next run needn't
+        # rebuild them
+        store.close()
+    print(f"\nIngestion finished in {time.perf_counter() - started:.1f}s.")
+    print(
+        f"Files chunked: {stats['files']} "
+        f"(unchanged, skipped: {stats['skipped_files']})"
+    )
+    print(
+        f"Chunks uploaded: {stats['uploaded']} "
+        f"(unchanged, skipped: {stats['skipped_chunks']})"
+    )
+    print(f"Stale chunks deleted: {stats['deleted']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,9 @@ def assign_metadata(chunk_data):
     text_source_name = chunk_data.get(
         "text_source", ""
     ).lower()  # Get base name for source checks
+    # Seeded by chunk so reruns assign the same metadata (the ingest
+    # manifest relies on it to skip unchanged chunks)
+    rng = random.Random(chunk_data.get("chunk_id"))
 
     # --- Persona Detection ---
     if "속담" in text or "proverb" in text_source_name:
@@ -38,7 +41,7 @@ def assign_metadata(chunk_data):
     ):
         persona = "AhjummaGPT"
     else:
-        persona = random.choice(["AhjummaGPT", "AhjussiGPT"])
+        persona = rng.choice(["AhjummaGPT", "AhjussiGPT"])
 
     # --- Tone Detection ---
     if "습니다" in text or "합니다" in text:
@@ -48,7 +51,7 @@ def assign_metadata(chunk_data):
     elif "한다" in text or "이다" in text:
         tone = "Plain"
     else:
-        tone = random.choice(
+        tone = rng.choice(
             ["Casual", "Polite", "Formal"]
         )  # Default if specific endings aren't found
 
@@ -62,11 +65,11 @@ def assign_metadata(chunk_data):
     else:
         # More nuanced check if level isn't in filename
         if any(kw in text for kw in ["어려워요", "complex", "advanced topic"]):
-            topik_level = random.choice(["4", "5", "6"])
+            topik_level = rng.choice(["4", "5", "6"])
         elif any(kw in text for kw in ["쉬워요", "easy", "simple sentence"]):
-            topik_level = random.choice(["1", "2"])
+            topik_level = rng.choice(["1", "2"])
         else:
-            topik_level = random.choice(["1", "2", "3", "4", "5", "6"])
+            topik_level = rng.choice(["1", "2", "3", "4", "5", "6"])
 
     # --- Topic Classification ---
     if any(kw in text for kw in ["인사", "hello", "greeting", "안녕하세요"]):
@@ -104,7 +107,7 @@ def assign_metadata(chunk_data):
         elif "proverb" in text_source_name:
             topic = "Culture"  # Proverbs often relate to culture
         else:
-            topic = random.choice(
+            topic = rng.choice(
                 ["Greetings", "Culture", "Education", "Work", "Food"]
             )  # Default random topic
 
@@ -0,0 +1,170 @@
+"""
+Benchmark query embedding: one model per agent vs the shared service
+
+Runs --threads concurrent callers issuing --queries short Korean queries,
+where --distinct of them are unique (chat traffic repeats itself), in
+a fresh subprocess per mode so memory numbers don't mix:
+
+- legacy: each of --agents agents loads its own SentenceTransformer and
+  encodes one string per call, like VectorDBTool did
+- torch / onnx / onnx-int8: every caller shares one EmbeddingService,
+  micro-batched and cached (the vector cache starts empty; ONNX exports
+  happen in a separate untimed run first)
+
+Reports model load time, queries/sec and resident memory.
+
+Usage (from the multi-agent-chatbot directory):
+    python scripts/bench_embeddings.py --modes legacy torch onnx-int8
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODES = ("legacy", "torch", "onnx", "onnx-int8")
+
+
+def rss_mb():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def make_queries(count, distinct):
+    syllables = [chr(code) for code in range(0xAC00, 0xD7A4, 37)]
+    unique = [
+        " ".join(
+            "".join(random.choices(syllables, k=random.randint(1, 4)))
+            for _ in range(random.randint(3, 10))
+        )
+        for _ in range(max(1, int(count * distinct)))
+    ]
+    return [random.choice(unique) for _ in range(count)]
+
+
+def run(mode, args):
+    """Measure one mode in this process and return its numbers"""
+    queries = make_queries(args.queries, args.distinct)
+    if args.prepare:
+        from src.tools.embeddings import EmbeddingService
+
+        EmbeddingService(
+            args.model, backend=mode, cache_dir=args.cache_dir
+        )._load()
+        return {}
+
+    started = time.perf_counter()
+    if mode == "legacy":
+        from sentence_transformers import SentenceTransformer
+
+        encoders = [
+            SentenceTransformer(args.model, device="cpu")
+            for _ in range(args.agents)
+        ]
+        for encoder in encoders:
+            encoder.encode("warm up")
+    else:
+        from src.tools.embeddings import EmbeddingService
+
+        service = EmbeddingService(
+            args.model,
+            backend=mode,
+            device="cpu",
+            cache_dir=args.cache_dir,
+        )
+        service._load()
+        # Every agent holds the same service
+        encoders = [service] * args.agents
+    load_seconds = time.perf_counter() - started
+
+    def worker(index):
+        encoder = encoders[index % len(encoders)]
+        for query in queries[index :: args.threads]:
+            encoder.encode(query)
+
+    threads = [
+        threading.Thread(target=worker, args=(index,))
+        for index in range(args.threads)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "load_s": load_seconds,
+        "qps": len(queries) / elapsed,
+        "rss_mb": rss_mb(),
+        "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "--model", default="paraphrase-multilingual-mpnet-base-v2"
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--agents", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=400)
+    parser.add_argument("--distinct", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--prepare", action="store_true", help=argparse.SUPPRESS
+    )
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    if args.child:
+        print(json.dumps(run(args.child, args)))
+        return
+
+    print(
+        f"{args.queries} queries ({args.distinct:.0%} distinct) from "
+        f"{args.threads} threads, {args.agents} agents"
+    )
+
+    def child(mode, *extra):
+        output = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--child", mode, *extra],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    # Exported ONNX graphs are reused; cached vectors never are (the
+    # preparing run encodes nothing)
+    cache_dir = tempfile.mkdtemp(prefix="embedding-bench-")
+    for mode in args.modes:
+        if mode.startswith("onnx"):
+            child(mode, "--prepare", "--cache-dir", cache_dir)
+        result = child(mode, "--cache-dir", cache_dir)
+        print(
+            f"{mode:>10}: load {result['load_s']:5.1f}s  "
+            f"{result['qps']:7.1f} queries/s  "
+            f"RSS {result['rss_mb']:6.0f} MB  "
+            f"(peak {result['peak_mb']:.0f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
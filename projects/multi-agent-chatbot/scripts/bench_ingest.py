@@ -0,0 +1,229 @@
+"""
+Benchmark ingestion: the two-script flow vs ingest.py
+
+Writes --files synthetic Korean text files of --kb KB each. It then
+ingests them into an on-disk Qdrant, run in-process (or at --qdrant_url),
+or with --store local into the embedded LocalStore, timing:
+
+- legacy: process_text_data.py chunking every file in turn into JSONL,
+  then embed_and_upload.py embedding and upserting batch by batch
+- ingest.py on an empty collection
+- ingest.py again with nothing changed
+- ingest.py after appending a paragraph to one file
+- ingest.py killed part way through, then resumed; reports how many
+  chunks the resumed run had to embed
+
+Both flows use the same model, in one process, loaded up front.
+
+Usage (from the multi-agent-chatbot directory):
+    python scripts/bench_ingest.py --files 40 --kb 20
+"""
+
+import argparse
+import json
+import os
+import random
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qdrant_client import QdrantClient  # noqa: E402
+
+import ingest  # noqa: E402
+from process_text_data import (  # noqa: E402
+    CHUNK_OVERLAP,
+    CHUNK_SIZE,
+    chunk_text_with_metadata,
+)
+from src.tools.embeddings import DEFAULT_MODEL, EmbeddingService  # noqa: E402
+from src.tools.vector_store import LocalStore, QdrantStore  # noqa: E402
+
+SENTENCES = [
+    "안녕하세요, 만나서 반갑습니다.",
+    "김치찌개를 먹어요.",
+    "학교에서 한국어를 공부합니다.",
+    "주말에 부산으로 여행을 가요.",
+    "회사에서 회의가 있습니다.",
+    "병원에 가야 해요.",
+    "가는 말이 고와야 오는 말이 곱다는 속담이 있다.",
+]
+
+
+def write_corpus(folder, files, kb):
+    folder.mkdir(parents=True, exist_ok=True)
+    for n in range(files):
+        text = []
+        while sum(len(s) for s in text) < kb * 1024 // 3:
+            text.append(random.choice(SENTENCES))
+        (folder / f"text_{n:04d}.txt").write_text(" ".join(text), "utf-8")
+
+
+def legacy(store, service, folder, batch_size):
+    """process_text_data.main then embed_and_upload.main, in one process"""
+    jsonl = folder.parent / "legacy_chunks.jsonl"
+    with open(jsonl, "w", encoding="utf-8") as outfile:
+        for path in sorted(folder.glob("*.txt")):
+            for chunk in chunk_text_with_metadata(
+                path, CHUNK_SIZE, CHUNK_OVERLAP
+            ):
+                outfile.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+
+    store.create(service.dimension, recreate=store.exists())
+
+    def upload(batch):
+        vectors = service.encode_many([p["text"] for _, p in batch])
+        store.upsert([pid for pid, _ in batch], vectors, [p for _, p in batch])
+
+    batch = []
+    with open(jsonl, encoding="utf-8") as infile:
+        for line in infile:
+            chunk = json.loads(line)
+            batch.append(
+                (
+                    ingest.point_id(chunk["chunk_id"]),
+                    ingest.chunk_payload(chunk),
+                )
+            )
+            if len(batch) >= batch_size:
+                upload(batch)
+                batch = []
+    if batch:
+        upload(batch)
+
+
+def committed(manifest_path):
+    try:
+        with sqlite3.connect(manifest_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+    except sqlite3.OperationalError:
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--kb", type=int, default=20)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--batch_size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max_in_flight", type=int, default=4)
+    parser.add_argument(
+        "--store", choices=("qdrant", "local"), default="qdrant"
+    )
+    parser.add_argument("--qdrant_url", help="Default: in-process Qdrant")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    random.seed(7)
+
+    directory = Path(args.child or tempfile.mkdtemp(prefix="ingest-bench-"))
+    folder = directory / "text"
+
+    def connect():
+        if args.store == "local":
+            return None
+        if args.qdrant_url:
+            return QdrantClient(url=args.qdrant_url)
+        return QdrantClient(path=str(directory / "qdrant"))
+
+    def open_store(collection):
+        if args.store == "local":
+            return LocalStore(collection, path=str(directory / "local"))
+        return QdrantStore(collection, client=client)
+
+    client = connect()
+    service = EmbeddingService(
+        args.model, backend=args.backend, device="cpu", cache_size=0
+    )
+
+    def run(collection):
+        manifest = ingest.Manifest(
+            directory / f"{collection}.sqlite3", collection
+        )
+        store = open_store(collection)
+        ingest.ensure_collection(store, service.dimension, manifest, False)
+        started = time.perf_counter()
+        stats = ingest.ingest(
+            store,
+            service,
+            manifest,
+            text_folder=folder,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            max_in_flight=args.max_in_flight,
+        )
+        elapsed = time.perf_counter() - started
+        if args.store == "local":
+            store.close()
+        return elapsed, stats
+
+    if args.child:
+        # Killed by the parent part way through
+        run("interrupted")
+        return
+
+    write_corpus(folder, args.files, args.kb)
+    service.encode_many(["warm up"])
+    chunks = sum(
+        len(chunk_text_with_metadata(p, CHUNK_SIZE, CHUNK_OVERLAP))
+        for p in folder.glob("*.txt")
+    )
+    print(f"{args.files} files, {chunks} chunks, {args.workers} workers")
+
+    started = time.perf_counter()
+    legacy(open_store("legacy"), service, folder, args.batch_size)
+    elapsed = time.perf_counter() - started
+    print(f"{'legacy, two scripts':>28}: {elapsed:6.1f}s  {chunks} embedded")
+
+    for label, prepare in (
+        ("ingest.py, empty", None),
+        ("ingest.py, unchanged", None),
+        (
+            "ingest.py, one file edited",
+            lambda: (folder / "text_0000.txt")
+            .open("a")
+            .write(" 새로운 문장을 추가했어요." * 20),
+        ),
+    ):
+        if prepare:
+            prepare()
+        elapsed, stats = run("pipeline")
+        print(
+            f"{label:>28}: {elapsed:6.1f}s  {stats['uploaded']} embedded, "
+            f"{stats['skipped_chunks']} chunks and "
+            f"{stats['skipped_files']} files skipped"
+        )
+
+    if client:
+        client.close()
+    manifest_path = directory / "interrupted.sqlite3"
+    child = subprocess.Popen(
+        [sys.executable, __file__, *sys.argv[1:], "--child", str(directory)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    while committed(manifest_path) < chunks // 2 and child.poll() is None:
+        time.sleep(0.2)
+    child.send_signal(signal.SIGKILL)
+    child.wait()
+    before = committed(manifest_path)
+
+    client = connect()
+    elapsed, stats = run("interrupted")
+    total = open_store("interrupted").count()
+    print(
+        f"{'ingest.py, resumed':>28}: {elapsed:6.1f}s  {stats['uploaded']} "
+        f"embedded after a kill at {before} committed; {total} in collection"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Benchmark vector search: LocalStore backends vs Qdrant
+
+Fills each store with --points synthetic 768-d embeddings (clustered,
+like real sentence embeddings), with persona/tone/TOPIK_level/topic
+metadata laid out by make_payload, and times --queries searches:
+unfiltered, and with filters from broad to selective (down to
+"TOPIK 1, Food, AhjummaGPT", about 1 point in 60).
+
+- local exact: brute-force float32 dot products over the memory map
+- local float16: the same with half-size vectors
+- local HNSW: hnswlib index (recall measured against exact), once with
+  the planner choosing per filter and once per forced plan:
+  pre-filter (score the matching points), post-filter (filter plain
+  HNSW results) and in-graph filter (HNSW walk skipping non-matching
+  points)
+- qdrant: in-process Qdrant (QdrantClient(path=...)), or a real server
+  with --qdrant_url (payload indexes only take effect on a server)
+
+Usage (from the multi-agent-chatbot directory):
+    python scripts/bench_vector_store.py --points 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qdrant_client import QdrantClient  # noqa: E402
+
+from src.tools.vector_store import (  # noqa: E402
+    LocalStore,
+    QdrantStore,
+    make_payload,
+)
+
+DIMENSION = 768
+FILTERS = {
+    "none": None,
+    "persona (1/2)": {"persona": "AhjummaGPT"},
+    "tone+topic (1/15)": {"tone": "Polite", "topic": "Food"},
+    "TOPIK 1, Food, AhjummaGPT (1/60)": {
+        "TOPIK_level": "1",
+        "topic": "Food",
+        "persona": "AhjummaGPT",
+    },
+}
+PLANS = {
+    "pre-filter": "pre",
+    "post-filter": "post",
+    "in-graph filter": "graph",
+}
+
+
+def make_points(count, rng):
+    centers = rng.standard_normal((256, DIMENSION)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), count)]
+    vectors += 0.5 * rng.standard_normal(vectors.shape).astype(np.float32)
+    topics = ("Greetings", "Culture", "Education", "Work", "Food")
+    payloads = [
+        make_payload(
+            f"chunk {n}",
+            {
+                "persona": ("AhjummaGPT", "AhjussiGPT")[n % 2],
+                "tone": ("Casual", "Polite", "Formal")[n % 3],
+                "TOPIK_level": str(rng.integers(1, 7)),
+                "topic": topics[rng.integers(0, 5)],
+            },
+            source="bench.txt",
+        )
+        for n in range(count)
+    ]
+    ids = [str(uuid.UUID(int=n)) for n in range(count)]
+    return ids, vectors, payloads
+
+
+def fill(store, ids, vectors, payloads, batch=5000):
+    store.create(DIMENSION, recreate=store.exists())
+    started = time.perf_counter()
+    for start in range(0, len(ids), batch):
+        end = start + batch
+        store.upsert(ids[start:end], vectors[start:end], payloads[start:end])
+    return time.perf_counter() - started
+
+
+def timed(store, queries, filter_by=None, limit=10):
+    store.search(queries[-1], limit, filter_by)  # Warm caches
+    results, times = [], []
+    for query in queries:
+        started = time.perf_counter()
+        results.append(
+            [r["id"] for r in store.search(query, limit, filter_by)]
+        )
+        times.append(time.perf_counter() - started)
+    return np.median(times) * 1000, results
+
+
+def recall(results, truth):
+    return np.mean(
+        [len(set(r) & set(t)) / max(len(t), 1) for r, t in zip(results, truth)]
+    )
+
+
+def report(label, store, queries, truth):
+    cells = []
+    for name, filter_by in FILTERS.items():
+        ms, results = timed(store, queries, filter_by)
+        cells.append(f"{ms:8.2f} ms ({recall(results, truth[name]):.2f})")
+    print(f"{label:>22}: " + "  ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument("--points", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--qdrant_url")
+    parser.add_argument("--skip_qdrant", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    ids, vectors, payloads = make_points(args.points, rng)
+    queries = vectors[rng.integers(0, args.points, args.queries)]
+    queries = queries + 0.3 * rng.standard_normal(queries.shape)
+    directory = tempfile.mkdtemp(prefix="vector-store-bench-")
+    print(f"{args.points:,} points, {DIMENSION} dimensions")
+    print(
+        "Median query time (recall@10 vs exact) for filters: "
+        + ", ".join(FILTERS)
+    )
+
+    exact = LocalStore("exact", path=directory, hnsw_threshold=10**12)
+    loads = {"local exact": fill(exact, ids, vectors, payloads)}
+    truth = {
+        name: timed(exact, queries, filter_by)[1]
+        for name, filter_by in FILTERS.items()
+    }
+    report("local exact", exact, queries, truth)
+
+    half = LocalStore(
+        "half", path=directory, dtype="float16", hnsw_threshold=10**12
+    )
+    loads["local float16"] = fill(half, ids, vectors, payloads)
+    report("local float16", half, queries, truth)
+
+    hnsw = LocalStore("hnsw", path=directory)
+    loads["local HNSW"] = fill(hnsw, ids, vectors, payloads)
+    started = time.perf_counter()
+    hnsw.search(queries[0], 10)
+    loads["local HNSW"] += time.perf_counter() - started  # Index build
+    report("local HNSW (planned)", hnsw, queries, truth)
+    for label, plan in PLANS.items():
+        hnsw.filter_plan = plan
+        report(label, hnsw, queries, truth)
+    hnsw.filter_plan = None
+
+    if not args.skip_qdrant:
+        client = (
+            QdrantClient(url=args.qdrant_url)
+            if args.qdrant_url
+            else QdrantClient(path=os.path.join(directory, "qdrant"))
+        )
+        qdrant = QdrantStore("bench", client=client)
+        loads["qdrant"] = fill(qdrant, ids, vectors, payloads)
+        report("qdrant", qdrant, queries, truth)
+
+    print()
+    stores = {"local exact": exact, "local float16": half, "local HNSW": hnsw}
+    for label, seconds in loads.items():
+        size = ""
+        if label in stores:
+            folder = stores[label].directory
+            total = sum(f.stat().st_size for f in folder.iterdir())
+            size = f", {total / 1024 / 1024:.0f} MB on disk"
+        print(f"{label:>22}: loaded in {seconds:.1f}s{size}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""
+Embedding Service - one shared, batched and cached text encoder
+
+Every tool and agent in the process asks `get_embedding_service()` for
+its encoder instead of loading its own SentenceTransformer. The service:
+
+- loads the model once per process, on first use
+- micro-batches: concurrent `encode` calls wait a few milliseconds so
+  they can be encoded together in one forward pass
+- caches vectors by a hash of model and text, in an in-memory LRU and
+  an on-disk SQLite file that survives restarts
+- optionally runs an ONNX Runtime backend, fp32 or int8 quantized, which
+  is faster and lighter than torch on CPU
+
+Configured with environment variables:
+    EMBEDDING_MODEL            model name or path
+    EMBEDDING_BACKEND          torch (default), onnx or onnx-int8
+    EMBEDDING_DEVICE           cuda, mps or cpu (default: best available)
+    EMBEDDING_CACHE_DIR        disk cache directory ("" disables it)
+    EMBEDDING_CACHE_SIZE       in-memory LRU entries
+    EMBEDDING_DISK_CACHE_SIZE  disk cache entries (0 = unbounded)
+"""
+
+import hashlib
+import os
+import platform
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_MODEL = "paraphrase-multilingual-mpnet-base-v2"
+BACKENDS = ("torch", "onnx", "onnx-int8")
+DEFAULT_CACHE_DIR = (
+    Path(__file__).resolve().parents[2] / "data" / "embedding_cache"
+)
+
+_services: Dict[tuple, "EmbeddingService"] = {}
+_services_lock = threading.Lock()
+
+
+def get_embedding_service(
+    model_name: Optional[str] = None, backend: Optional[str] = None
+) -> "EmbeddingService":
+    """
+    Return the process-wide embedding service for a model and backend
+
+    Args:
+        model_name: Model name or path (defaults to EMBEDDING_MODEL env var)
+        backend: torch, onnx or onnx-int8 (defaults to EMBEDDING_BACKEND)
+
+    Returns:
+        The shared EmbeddingService, created on first request
+    """
+    model_name = model_name or os.environ.get("EMBEDDING_MODEL", DEFAULT_MODEL)
+    backend = backend or os.environ.get("EMBEDDING_BACKEND", "torch")
+    with _services_lock:
+        service = _services.get((model_name, backend))
+        if service is None:
+            cache_dir = os.environ.get(
+                "EMBEDDING_CACHE_DIR", str(DEFAULT_CACHE_DIR)
+            )
+            service = EmbeddingService(
+                model_name,
+                backend=backend,
+                device=os.environ.get("EMBEDDING_DEVICE"),
+                cache_dir=cache_dir or None,
+                cache_size=int(
+                    os.environ.get("EMBEDDING_CACHE_SIZE", "10000")
+                ),
+                disk_cache_size=int(
+                    os.environ.get("EMBEDDING_DISK_CACHE_SIZE", "100000")
+                ),
+            )
+            _services[(model_name, backend)] = service
+        return service
+
+
+def _default_device() -> str:
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():  # Apple Silicon
+        return "mps"
+    return "cpu"
+
+
+def _onnx_quantization() -> str:
+    # Dynamic int8 quantization tuned for the host instruction set
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    return os.environ.get("EMBEDDING_ONNX_QUANTIZATION", "avx2")
+
+
+class _DiskCache:
+    """
+    Vectors keyed by text hash in a SQLite file
+
+    Holds at most `max_entries` vectors (0: no limit). Each row records
+    when it was last written or read; once writes push the table past the
+    limit, the least recently used rows are deleted down to 90% of it, so
+    pruning runs once per tenth of the cache rather than on every write.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 0):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors "
+            "(key BLOB PRIMARY KEY, vector BLOB NOT NULL, "
+            "used REAL NOT NULL DEFAULT 0) WITHOUT ROWID"
+        )
+        columns = [
+            row[1] for row in self._conn.execute("PRAGMA table_info(vectors)")
+        ]
+        if "used" not in columns:  # Cache files from before the limit
+            self._conn.execute(
+                "ALTER TABLE vectors ADD COLUMN used REAL NOT NULL DEFAULT 0"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS vectors_used ON vectors (used)"
+        )
+        (self._count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM vectors"
+        ).fetchone()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM vectors WHERE key IN (%s)"
+                    % ",".join("?" * len(batch)),
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+            if found and self.max_entries:
+                self._conn.executemany(
+                    "UPDATE vectors SET used = ? WHERE key = ?",
+                    [(time.time(), key) for key in found],
+                )
+        return found
+
+    def put_many(self, items: Dict[bytes, np.ndarray]):
+        with self._lock:
+            now = time.time()
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO vectors (key, vector, used)"
+                " VALUES (?, ?, ?)",
+                [
+                    (key, vector.tobytes(), now)
+                    for key, vector in items.items()
+                ],
+            )
+            self._conn.execute("COMMIT")
+            # Counts replaced rows too; _prune recounts before deleting
+            self._count += len(items)
+            if self.max_entries and self._count > self.max_entries:
+                self._prune()
+
+    def _prune(self):
+        (self._count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM vectors"
+        ).fetchone()
+        if self._count <= self.max_entries:
+            return
+        excess = self._count - int(self.max_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM vectors WHERE key IN "
+            "(SELECT key FROM vectors ORDER BY used LIMIT ?)",
+            (excess,),
+        )
+        self._count -= excess
+
+
+class EmbeddingService:
+    """
+    A shared text encoder with micro-batching and an LRU + disk cache
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        backend: str = "torch",
+        device: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        cache_size: int = 10000,
+        disk_cache_size: int = 100000,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Initialize the service; the model itself loads on first use
+
+        Args:
+            model_name: SentenceTransformer model name or path
+            backend: torch, onnx (fp32) or onnx-int8 (quantized, CPU only)
+            device: cuda, mps or cpu (defaults to the best available)
+            cache_dir: Directory for the disk cache (None disables it)
+            cache_size: Number of vectors kept in the in-memory LRU
+            disk_cache_size: Most vectors kept on disk (0 for no limit)
+            max_batch_size: Most requests encoded in one forward pass
+            max_wait_ms: How long a request waits for others to batch with
+        """
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown embedding backend {backend!r}, expected one of "
+                f"{', '.join(BACKENDS)}"
+            )
+        self.model_name = model_name
+        self.backend = backend
+        self.device = device
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_size = cache_size
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._namespace = f"{model_name}\0{backend}\0".encode("utf-8")
+        self._lru: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lru_lock = threading.Lock()
+        self._disk = (
+            _DiskCache(self.cache_dir / "embeddings.sqlite3", disk_cache_size)
+            if self.cache_dir
+            else None
+        )
+        self._requests: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "batches": 0}
+
+    # --- Public API ---
+    @property
+    def dimension(self) -> int:
+        """Size of the vectors this model produces"""
+        return self._load().get_sentence_embedding_dimension()
+
+    def encode(self, text: str) -> np.ndarray:
+        """
+        Embed one text, batched with any concurrent callers
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            A read-only float32 vector
+        """
+        key = self._key(text)
+        vector = self._cached([key]).get(key)
+        if vector is not None:
+            return vector
+
+        self._ensure_worker()
+        future: Future = Future()
+        self._requests.put((key, text, future))
+        return future.result()
+
+    def encode_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed many texts at once, encoding only those not cached
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            A (len(texts), dimension) float32 matrix
+        """
+        keys = [self._key(text) for text in texts]
+        found = self._cached(keys)
+        missing = {
+            key: text for key, text in zip(keys, texts) if key not in found
+        }
+        items = list(missing.items())
+        for start in range(0, len(items), self.max_batch_size):
+            batch = items[start : start + self.max_batch_size]
+            vectors = self._encode([text for _, text in batch])
+            found.update(zip([key for key, _ in batch], vectors))
+        if not keys:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
+
+    # --- Cache ---
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(self._namespace + text.encode("utf-8")).digest()
+
+    def _cached(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        found = {}
+        with self._lru_lock:
+            for key in keys:
+                vector = self._lru.get(key)
+                if vector is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = vector
+
+        missing = [key for key in keys if key not in found]
+        if missing and self._disk:
+            from_disk = self._disk.get_many(missing)
+            for vector in from_disk.values():
+                vector.setflags(write=False)
+            self._remember(from_disk)
+            found.update(from_disk)
+
+        hits = sum(1 for key in keys if key in found)
+        with self._lru_lock:
+            self.stats["hits"] += hits
+            self.stats["misses"] += len(keys) - hits
+        return found
+
+    def _remember(self, items: Dict[bytes, np.ndarray]):
+        with self._lru_lock:
+            for key, vector in items.items():
+                self._lru[key] = vector
+                self._lru.move_to_end(key)
+            while len(self._lru) > self.cache_size:
+                self._lru.popitem(last=False)
+
+    # --- Encoding ---
+    def _load(self):
+        with self._model_lock:
+            if self._model is None:
+                self._model = self._load_model()
+            return self._model
+
+    def _load_model(self):
+        from sentence_transformers import SentenceTransformer
+
+        if self.backend == "torch":
+            device = self.device or _default_device()
+            print(f"Loading {self.model_name} on {device} for embeddings")
+            return SentenceTransformer(self.model_name, device=device)
+
+        # ONNX Runtime runs on CPU; needs `pip install optimum[onnxruntime]`.
+        # The exported graphs are kept next to the disk cache.
+        export_dir = (
+            (self.cache_dir or DEFAULT_CACHE_DIR)
+            / "onnx"
+            / self.model_name.replace("/", "--")
+        )
+        if not (export_dir / "onnx" / "model.onnx").exists():
+            print(f"Exporting {self.model_name} to ONNX")
+            SentenceTransformer(
+                self.model_name, backend="onnx", device="cpu"
+            ).save(str(export_dir))
+        if self.backend == "onnx":
+            print(f"Loading {self.model_name} with ONNX Runtime")
+            return SentenceTransformer(
+                str(export_dir), backend="onnx", device="cpu"
+            )
+
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        quantization = _onnx_quantization()
+        pattern = f"onnx/model_*int8_{quantization}.onnx"
+        if not any(export_dir.glob(pattern)):
+            print(f"Quantizing {self.model_name} to int8 ({quantization})")
+            export_dynamic_quantized_onnx_model(
+                SentenceTransformer(
+                    str(export_dir), backend="onnx", device="cpu"
+                ),
+                quantization,
+                str(export_dir),
+            )
+        file_name = next(export_dir.glob(pattern)).relative_to(export_dir)
+        print(f"Loading {self.model_name} with ONNX Runtime (int8)")
+        return SentenceTransformer(
+            str(export_dir),
+            backend="onnx",
+            device="cpu",
+            model_kwargs={"file_name": file_name.as_posix()},
+        )
+
+    def _encode(self, texts: List[str]) -> List[np.ndarray]:
+        model = self._load()
+        with self._model_lock:
+            matrix = model.encode(
+                texts,
+                batch_size=len(texts),
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            ).astype(np.float32, copy=False)
+        with self._lru_lock:
+            self.stats["batches"] += 1
+
+        keys = [self._key(text) for text in texts]
+        for vector in matrix:
+            vector.setflags(write=False)
+        vectors = dict(zip(keys, matrix))
+        self._remember(vectors)
+        if self._disk:
+            self._disk.put_many(vectors)
+        return list(matrix)
+
+    def _ensure_worker(self):
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        """Collect requests for up to max_wait, then encode them together"""
+        while True:
+            batch = [self._requests.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._requests.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            # The same text asked twice in a batch is encoded once
+            unique = {}
+            for key, text, _ in batch:
+                unique.setdefault(key, text)
+            try:
+                vectors = dict(
+                    zip(unique, self._encode(list(unique.values())))
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+            for key, _, future in batch:
+                future.set_result(vectors[key])
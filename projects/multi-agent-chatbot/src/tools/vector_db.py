@@ -1,15 +1,15 @@
 """
-Vector Database Tool that connects to Qdrant for RAG functionality
+Vector Database Tool for RAG functionality, backed by Qdrant or the
+embedded local store (VECTOR_STORE=local)
 """
 
 import os
 import json
 import uuid
 from typing import Dict, List, Any, Optional
-from qdrant_client import QdrantClient
-from qdrant_client.http import models
-from sentence_transformers import SentenceTransformer
-import torch
+from src.tools.embeddings import get_embedding_service
+from src.tools.vector_store import make_payload, make_vector_store
+from src.tools.vector_store import point_id as chunk_point_id
 
 
 class VectorDBTool:
@@ -27,42 +27,25 @@ class VectorDBTool:
         self.embedding_dimension = embedding_dimension
         self.max_results = max_results
 
-        # Determine device for embedding
-        if torch.cuda.is_available():
-            self.device = "cuda"
-        elif torch.backends.mps.is_available():  # Apple Silicon
-            self.device = "mps"
-        else:
-            self.device = "cpu"
-        print(f"Using device: {self.device} for embeddings")
-
-        # Initialize embedding model - multilingual for Korean support
-        self.model = SentenceTransformer(
-            "paraphrase-multilingual-mpnet-base-v2", device=self.device
-        )
-
-        # Connect to Qdrant
-        self.client = QdrantClient(
-            url=f"http://{self.db_url}", port=self.db_port
-        )
+        # Shared, cached embedding model - multilingual for Korean support
+        # (paraphrase-multilingual-mpnet-base-v2 unless EMBEDDING_MODEL is set)
+        self.model = get_embedding_service()
 
-        # Ensure collection exists
-        self._ensure_collection_exists()
+        # Vector store; nothing connects until the first query or write
+        db_url = self.db_url
+        if "://" not in db_url:
+            db_url = f"http://{db_url}:{self.db_port}"
+        self.store = make_vector_store(collection_name, url=db_url)
+        self._collection_ready = False
 
     def _ensure_collection_exists(self):
-        """Create the collection if it doesn't exist"""
-        collections = self.client.get_collections().collections
-        collection_names = [collection.name for collection in collections]
-
-        if self.collection_name not in collection_names:
+        """Create the collection and its payload indexes if missing (once,
+        on first use)"""
+        if self._collection_ready:
+            return
+        if self.store.ensure_collection(self.model.dimension):
             print(f"Creating collection: {self.collection_name}")
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=models.VectorParams(
-                    size=self.model.get_sentence_embedding_dimension(),
-                    distance=models.Distance.COSINE,
-                ),
-            )
+        self._collection_ready = True
 
     def query(
         self,
@@ -75,45 +58,35 @@ class VectorDBTool:
 
         Args:
             query_text: The text to find similar documents for
-            filter_by: Optional filters to apply to the search (metadata fields)
+            filter_by: Optional filters to apply to the search (metadata
+                fields such as persona, tone, TOPIK_level and topic; a list
+                matches any of its values)
             limit: Maximum number of results to return
 
         Returns:
             List of documents with their metadata and similarity scores
         """
+        self._ensure_collection_exists()
+
         # Generate embedding for the query
-        query_vector = self.model.encode(query_text).tolist()
-
-        # Create search filter if provided
-        search_filter = None
-        if filter_by:
-            filter_conditions = []
-            for key, value in filter_by.items():
-                filter_conditions.append(
-                    models.FieldCondition(
-                        key=f"metadata.{key}",
-                        match=models.MatchValue(value=value),
-                    )
-                )
-            search_filter = models.Filter(must=filter_conditions)
+        query_vector = self.model.encode(query_text)
 
-        # Execute the search
-        search_results = self.client.search(
-            collection_name=self.collection_name,
-            query_vector=query_vector,
+        # Execute the search; metadata keys are top-level payload fields
+        search_results = self.store.search(
+            query_vector,
             limit=limit or self.max_results,
-            query_filter=search_filter,
+            filter_by=filter_by,
         )
 
         # Format and return the results
         results = []
         for result in search_results:
             item = {
-                "id": result.id,
-                "score": result.score,
-                "text": result.payload.get("text", ""),
+                "id": result["id"],
+                "score": result["score"],
+                "text": result["payload"].get("text", ""),
                 "metadata": {
-                    k: v for k, v in result.payload.items() if k != "text"
+                    k: v for k, v in result["payload"].items() if k != "text"
                 },
             }
             results.append(item)
@@ -131,24 +104,16 @@ class VectorDBTool:
         Returns:
             The ID of the added document
         """
+        self._ensure_collection_exists()
+
         # Generate embedding
-        vector = self.model.encode(text).tolist()
+        vector = self.model.encode(text)
 
         # Create a unique ID
         point_id = str(uuid.uuid4())
 
-        # Prepare payload
-        payload = {"text": text}
-        if metadata:
-            payload.update(metadata)
-
         # Add the document to the collection
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=[
-                models.PointStruct(id=point_id, vector=vector, payload=payload)
-            ],
-        )
+        self.store.upsert([point_id], [vector], [make_payload(text, metadata)])
 
         return point_id
 
@@ -162,11 +127,23 @@ class VectorDBTool:
         Returns:
             Number of documents added
         """
+        self._ensure_collection_exists()
         count = 0
 
         batch_size = 100  # Process in batches for efficiency
         batch_points = []
 
+        def upload(batch):
+            # Embed the whole batch in one call; cached texts are skipped
+            vectors = self.model.encode_many(
+                [p["payload"]["text"] for p in batch]
+            )
+            self.store.upsert(
+                [p["id"] for p in batch],
+                vectors,
+                [p["payload"] for p in batch],
+            )
+
         with open(jsonl_path, "r", encoding="utf-8") as f:
             for line in f:
                 try:
@@ -177,35 +154,27 @@ class VectorDBTool:
                     if not text:
                         continue
 
-                    # Generate embedding
-                    vector = self.model.encode(text).tolist()
-
-                    # Extract metadata if available
-                    metadata = data.get("metadata", {})
-
-                    # Create payload
-                    payload = {"text": text}
-                    if metadata:
-                        payload["metadata"] = metadata
+                    # Same payload layout as add_document and ingest.py
+                    payload = make_payload(
+                        text, data.get("metadata"), data.get("source")
+                    )
 
-                    # Use existing ID or generate one
-                    point_id = data.get("chunk_id", str(uuid.uuid4()))
+                    # Derive the ID from the chunk ID, so reloading a file
+                    # replaces its points instead of duplicating them
+                    point_id = (
+                        chunk_point_id(data["chunk_id"])
+                        if data.get("chunk_id")
+                        else str(uuid.uuid4())
+                    )
 
                     # Add to batch
-                    batch_points.append(
-                        models.PointStruct(
-                            id=point_id, vector=vector, payload=payload
-                        )
-                    )
+                    batch_points.append({"id": point_id, "payload": payload})
 
                     count += 1
 
                     # Process batch when size threshold reached
                     if len(batch_points) >= batch_size:
-                        self.client.upsert(
-                            collection_name=self.collection_name,
-                            points=batch_points,
-                        )
+                        upload(batch_points)
                         batch_points = []
                         print(f"Added {count} documents so far...")
 
@@ -216,8 +185,6 @@ class VectorDBTool:
 
         # Process any remaining items in the last batch
         if batch_points:
-            self.client.upsert(
-                collection_name=self.collection_name, points=batch_points
-            )
+            upload(batch_points)
 
         return count
@@ -1,26 +1,27 @@
 """
-Vector Database Tool - A tool for interacting with Qdrant vector database
+Vector Database Tool - A tool for interacting with the vector database
 
 This tool provides functionality for retrieving similar documents
-from a Qdrant vector database collection.
+from a Qdrant collection, or from the embedded local store when
+VECTOR_STORE=local.
 """
 
 import os
 from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
+from src.tools.embeddings import get_embedding_service
+from src.tools.vector_store import make_vector_store
 
 
 class VectorDBTool:
     """
-    A tool for querying the Qdrant vector database
+    A tool for querying the vector database
     """
 
     def __init__(
         self,
         db_url: Optional[str] = None,
         collection_name: str = "korean_language_learning",
-        embedding_model: str = "paraphrase-multilingual-mpnet-base-v2",
+        embedding_model: Optional[str] = None,
         max_results: int = 10,
     ):
         """
@@ -30,6 +31,8 @@ class VectorDBTool:
             db_url: Qdrant server URL (defaults to QDRANT_HOST and QDRANT_PORT env vars)
             collection_name: Name of the collection to query
             embedding_model: The embedding model to use for queries
+                (defaults to EMBEDDING_MODEL env var or
+                paraphrase-multilingual-mpnet-base-v2)
             max_results: Maximum number of results to return
         """
         # Use environment variables if db_url not provided
@@ -42,22 +45,18 @@ class VectorDBTool:
         self.collection_name = collection_name
         self.max_results = max_results
 
-        # Initialize Qdrant client
-        self.client = QdrantClient(url=db_url)
+        # Vector store (Qdrant unless VECTOR_STORE=local); connects lazily
+        self.store = make_vector_store(collection_name, url=db_url)
 
-        # Load the embedding model
+        # Share the process-wide embedding model (loaded on first query)
         # Use the same model as in embed_and_upload.py
-        device = (
-            "cuda"
-            if os.environ.get("USE_CUDA", "false").lower() == "true"
-            else "cpu"
-        )
-        self.embedding_model = SentenceTransformer(
-            embedding_model, device=device
-        )
+        self.embedding_model = get_embedding_service(embedding_model)
 
     def search(
-        self, query: str, limit: Optional[int] = None
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        filter_by: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search the vector database for similar documents
@@ -65,6 +64,8 @@ class VectorDBTool:
         Args:
             query: The search query
             limit: Maximum number of results (defaults to self.max_results)
+            filter_by: Optional metadata filters, e.g.
+                {"TOPIK_level": "1", "topic": "Food"}
 
         Returns:
             List of matching documents with their metadata and similarity scores
@@ -77,12 +78,8 @@ class VectorDBTool:
             query_embedding = self.embedding_model.encode(query)
 
             # Search the vector database
-            results = self.client.search(
-                collection_name=self.collection_name,
-                query_vector=query_embedding.tolist(),
-                limit=limit,
-                with_payload=True,
-                with_vectors=False,
+            results = self.store.search(
+                query_embedding, limit=limit, filter_by=filter_by
             )
 
             # Format the results
@@ -90,13 +87,13 @@ class VectorDBTool:
             for result in results:
                 formatted_results.append(
                     {
-                        "text": result.payload.get("text", ""),
+                        "text": result["payload"].get("text", ""),
                         "metadata": {
                             k: v
-                            for k, v in result.payload.items()
+                            for k, v in result["payload"].items()
                             if k != "text"
                         },
-                        "score": result.score,
+                        "score": result["score"],
                     }
                 )
 
@@ -114,10 +111,7 @@ class VectorDBTool:
             List of collection names
         """
         try:
-            collections_info = self.client.get_collections()
-            return [
-                collection.name for collection in collections_info.collections
-            ]
+            return self.store.list_collections()
         except Exception as e:
             print(f"Error getting collections: {str(e)}")
             return []
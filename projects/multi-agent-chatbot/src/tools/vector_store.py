@@ -0,0 +1,969 @@
+"""
+Vector Store - where the chatbot keeps its embedded chunks
+
+`VectorStore` is the small interface the tools and the ingest pipeline
+use. Two backends implement it:
+
+- QdrantStore: a Qdrant server (the docker-compose setup). The client is
+  created on first use, so constructing a store never touches the network.
+- LocalStore: embedded, no service needed. Vectors live in a memory-mapped
+  float32 (or float16) matrix, payloads in SQLite next to it. Searches are
+  exact dot products for small corpora or selective filters, and go through
+  an HNSW index (when hnswlib is installed) once the collection is large.
+  Several processes may share a collection: writes are serialized with a
+  file lock, and readers reload when another process has written.
+
+`make_vector_store()` picks the backend from VECTOR_STORE (qdrant or local).
+
+Every writer lays points out the same way (`make_payload`): the chunk's
+metadata as top-level keys next to `text` and `source`. The fields agents
+filter on (FILTER_FIELDS) get a keyword payload index when a collection is
+created, so filtered searches stay fast as it grows.
+"""
+
+import json
+import math
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+try:
+    import fcntl
+except ImportError:  # Windows: keep to one writing process per collection
+    fcntl = None
+
+DEFAULT_LOCAL_PATH = (
+    Path(__file__).resolve().parents[2] / "data" / "vector_store"
+)
+_BLOCK_ROWS = 65536  # Rows scored per matrix product
+# Gathering scattered rows costs ~5x scanning them in order, so exact
+# search scans everything once more than this fraction of rows match
+_GATHER_FRACTION = 0.2
+# An HNSW node visit costs about this many exactly scored rows
+_VISIT_COST = 2
+
+# Metadata agents filter on (set by process_text_data.assign_metadata)
+FILTER_FIELDS = ("persona", "tone", "TOPIK_level", "topic")
+
+
+def point_id(chunk_id: str) -> str:
+    """Deterministic point ID for a chunk, the same as embed_and_upload.py"""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, chunk_id))
+
+
+def make_payload(
+    text: str, metadata: Optional[Dict[str, Any]] = None, source=None
+) -> Dict[str, Any]:
+    """
+    Payload for a point: metadata flattened to top-level keys, so filters
+    and results use the same keys whichever tool wrote the point
+
+    Args:
+        text: The chunk text
+        metadata: Persona, tone, TOPIK_level, topic, ...
+        source: File the text came from, if known
+
+    Returns:
+        The payload dict
+    """
+    payload = dict(metadata or {})
+    if source is not None:
+        payload["source"] = source
+    payload["text"] = text
+    return payload
+
+
+def chunk_payload(chunk: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload for a chunk from process_text_data.chunk_text_with_metadata"""
+    return make_payload(
+        chunk.get("text"), chunk.get("metadata"), chunk.get("source")
+    )
+
+
+def make_vector_store(
+    collection_name: str,
+    backend: Optional[str] = None,
+    url: Optional[str] = None,
+    path: Optional[str] = None,
+) -> "VectorStore":
+    """
+    Create the configured vector store for a collection
+
+    Args:
+        collection_name: Name of the collection
+        backend: qdrant or local (defaults to VECTOR_STORE env var or qdrant)
+        url: Qdrant URL (defaults to QDRANT_HOST and QDRANT_PORT env vars)
+        path: LocalStore directory (defaults to VECTOR_STORE_PATH env var)
+
+    Returns:
+        A VectorStore; no connection is made until it is used
+    """
+    backend = backend or os.environ.get("VECTOR_STORE", "qdrant")
+    if backend == "qdrant":
+        return QdrantStore(collection_name, url=url)
+    if backend == "local":
+        return LocalStore(
+            collection_name,
+            path=path or os.environ.get("VECTOR_STORE_PATH"),
+            dtype=os.environ.get("VECTOR_STORE_DTYPE", "float32"),
+        )
+    raise ValueError(
+        f"Unknown vector store {backend!r}, expected qdrant or local"
+    )
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _values(value) -> list:
+    """Filter value(s): a list matches any of its items"""
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+class VectorStore(ABC):
+    """
+    A collection of (id, vector, payload) points searchable by cosine
+    similarity, with exact-match payload filters
+    """
+
+    collection_name: str
+
+    @abstractmethod
+    def exists(self) -> bool:
+        """Whether the collection has been created"""
+
+    @abstractmethod
+    def create(self, dimension: int, recreate: bool = False):
+        """Create the collection, dropping it first when `recreate`"""
+
+    def ensure_collection(self, dimension: int) -> bool:
+        """
+        Create the collection if missing, and the FILTER_FIELDS payload
+        indexes if an older collection lacks them
+
+        Returns:
+            True when the collection was created
+        """
+        if self.exists():
+            self.create_payload_indexes()
+            return False
+        self.create(dimension)
+        return True
+
+    @abstractmethod
+    def create_payload_indexes(self, fields: Sequence[str] = FILTER_FIELDS):
+        """Keyword-index payload keys for filtering; existing ones are kept"""
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        payloads: Sequence[Dict[str, Any]],
+    ):
+        """Insert or replace points"""
+
+    @abstractmethod
+    def delete(self, ids: Sequence[str]):
+        """Delete points by ID; unknown IDs are ignored"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of points in the collection"""
+
+    @abstractmethod
+    def search(
+        self,
+        vector: Sequence[float],
+        limit: int = 10,
+        filter_by: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the points most similar to `vector`
+
+        Filtered searches are planned by selectivity: a filter matching
+        few points scores just those (pre-filter), a broad one filters
+        the nearest neighbours (post-filter)
+
+        Args:
+            vector: The query embedding
+            limit: Maximum number of results
+            filter_by: Payload key -> required value (a list matches any
+                of its values); dotted keys reach into nested payloads
+
+        Returns:
+            Dicts with id, score and payload, best first
+        """
+
+    @abstractmethod
+    def list_collections(self) -> List[str]:
+        """Names of all collections in the same database"""
+
+    def close(self):
+        """Release connections and files"""
+
+
+class QdrantStore(VectorStore):
+    """
+    VectorStore backed by a Qdrant server
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        url: Optional[str] = None,
+        client=None,
+    ):
+        """
+        Args:
+            collection_name: Name of the Qdrant collection
+            url: Server URL (defaults to QDRANT_HOST and QDRANT_PORT env vars)
+            client: An existing QdrantClient to use instead
+        """
+        if url is None:
+            host = os.environ.get("QDRANT_HOST", "qdrant")
+            port = os.environ.get("QDRANT_PORT", "6333")
+            url = f"http://{host}:{port}"
+        self.collection_name = collection_name
+        self.url = url
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = QdrantClient(url=self.url)
+        return self._client
+
+    def exists(self) -> bool:
+        return self.collection_name in self.list_collections()
+
+    def create(self, dimension: int, recreate: bool = False):
+        if recreate and self.exists():
+            self.client.delete_collection(self.collection_name)
+        self.client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config=models.VectorParams(
+                size=dimension, distance=models.Distance.COSINE
+            ),
+            # Add optimized HNSW indexing for faster search
+            hnsw_config=models.HnswConfigDiff(m=16, ef_construct=200),
+        )
+        # Indexed before any points arrive, so Qdrant adds filter-aware
+        # HNSW links as it indexes them
+        self.create_payload_indexes()
+
+    def create_payload_indexes(self, fields=FILTER_FIELDS):
+        # Qdrant's query planner uses these to estimate how many points
+        # a filter matches, then searches the index-selected points
+        # exactly or walks the HNSW graph with the filter applied
+        schema = self.client.get_collection(
+            self.collection_name
+        ).payload_schema
+        for field in fields:
+            if field not in schema:
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field,
+                    field_schema=models.PayloadSchemaType.KEYWORD,
+                    wait=True,
+                )
+
+    def upsert(self, ids, vectors, payloads):
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=[
+                models.PointStruct(
+                    id=point_id,
+                    vector=np.asarray(vector, dtype=np.float32).tolist(),
+                    payload=payload,
+                )
+                for point_id, vector, payload in zip(ids, vectors, payloads)
+            ],
+            wait=True,
+        )
+
+    def delete(self, ids):
+        if ids:
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(points=list(ids)),
+                wait=True,
+            )
+
+    def count(self) -> int:
+        return self.client.count(
+            collection_name=self.collection_name, exact=True
+        ).count
+
+    def search(self, vector, limit=10, filter_by=None):
+        search_filter = None
+        if filter_by:
+            filter_conditions = []
+            for key, value in filter_by.items():
+                values = _values(value)
+                match = (
+                    models.MatchValue(value=values[0])
+                    if len(values) == 1
+                    else models.MatchAny(any=values)
+                )
+                filter_conditions.append(
+                    models.FieldCondition(key=key, match=match)
+                )
+            search_filter = models.Filter(must=filter_conditions)
+
+        results = self.client.search(
+            collection_name=self.collection_name,
+            query_vector=np.asarray(vector, dtype=np.float32).tolist(),
+            limit=limit,
+            query_filter=search_filter,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return [
+            {"id": result.id, "score": result.score, "payload": result.payload}
+            for result in results
+        ]
+
+    def list_collections(self) -> List[str]:
+        return [c.name for c in self.client.get_collections().collections]
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class _Column:
+    """One payload field as integer codes per row, for vectorized filters"""
+
+    def __init__(self, size: int):
+        self.codes = np.full(size, -1, dtype=np.int32)
+        self.values: Dict[Any, int] = {}
+
+    def code(self, value) -> int:
+        if value is None or isinstance(value, (dict, list)):
+            return -1
+        return self.values.setdefault(value, len(self.values))
+
+    def set(self, rows, values):
+        needed = max(rows) + 1 if len(rows) else 0
+        if needed > len(self.codes):
+            grown = np.full(max(needed, 2 * len(self.codes)), -1, np.int32)
+            grown[: len(self.codes)] = self.codes
+            self.codes = grown
+        self.codes[list(rows)] = [self.code(value) for value in values]
+
+
+def _lookup(payload: Dict[str, Any], key: str):
+    value = payload
+    for part in key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+class LocalStore(VectorStore):
+    """
+    Embedded VectorStore: a memory-mapped vector matrix plus SQLite
+
+    Each collection is a directory holding `vectors.<dtype>` (one
+    normalized row per point, so cosine similarity is a dot product),
+    `points.sqlite3` (row -> point ID and JSON payload) and, once built,
+    `hnsw.bin` and `payload_index.npz` (the indexed payload fields as
+    integer codes per row). Deleted rows are left as unused slots.
+
+    Writers (in this or other processes) take `write.lock` and allocate
+    rows in SQLite, so they never hand out the same row twice. Every write
+    bumps `version` in the meta table; a store that sees a version it did
+    not write reloads the collection (and rebuilds the HNSW index unless
+    the writer saved it).
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        path: Optional[str] = None,
+        dtype: str = "float32",
+        hnsw_threshold: int = 20000,
+        ef_search: int = 128,
+        filter_plan: Optional[str] = None,
+    ):
+        """
+        Args:
+            collection_name: Name of the collection (a subdirectory)
+            path: Directory holding the collections
+            dtype: float32, or float16 to halve memory and disk
+            hnsw_threshold: Collections smaller than this are searched
+                exactly
+            ef_search: HNSW search breadth; higher is slower but more exact
+            filter_plan: Force how filtered searches run: pre (score the
+                matching points), post (filter HNSW results) or graph
+                (HNSW walk skipping non-matching points); chosen per
+                query by selectivity when None
+        """
+        if np.dtype(dtype) not in (np.float32, np.float16):
+            raise ValueError(f"Unsupported vector dtype {dtype!r}")
+        self.collection_name = collection_name
+        self.root = Path(path) if path else DEFAULT_LOCAL_PATH
+        self.directory = self.root / collection_name
+        self.dtype = np.dtype(dtype)
+        self.hnsw_threshold = hnsw_threshold
+        self.ef_search = ef_search
+        if filter_plan not in (None, "pre", "post", "graph"):
+            raise ValueError(f"Unknown filter plan {filter_plan!r}")
+        self.filter_plan = filter_plan
+
+        self._lock = threading.RLock()
+        self._lock_file = None  # write.lock while this store holds it
+        self._db: Optional[sqlite3.Connection] = None
+        self._vectors: Optional[np.memmap] = None
+        self._dimension = 0
+        self._size = 0  # Rows in use, deleted or not
+        self._alive = np.zeros(0, dtype=bool)
+        self._columns: Dict[str, _Column] = {}
+        self._indexed: List[str] = []  # Columns kept in payload_index.npz
+        self._columns_saved = -1  # Write version saved there
+        self._version = 0  # Bumped by every write; stale indexes rebuild
+        self._index = None
+        self._index_version = -1  # Write version the index reflects
+        self._index_saved = -1  # ... and the one on disk
+
+    # --- Collection lifecycle ---
+    def exists(self) -> bool:
+        return (self.directory / "points.sqlite3").exists()
+
+    def create(self, dimension: int, recreate: bool = False):
+        with self._lock:
+            if recreate:
+                self.close()
+                shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            db = self._connect()
+            db.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("dimension", dimension), ("dtype", self.dtype.name)],
+            )
+            db.commit()
+            self._open()
+            self.create_payload_indexes()
+
+    def create_payload_indexes(self, fields=FILTER_FIELDS):
+        with self._lock:
+            self._open()
+            missing = [f for f in fields if f not in self._indexed]
+            if not missing:
+                return
+            self._build_columns([f for f in missing if f not in self._columns])
+            self._indexed += missing
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value)"
+                " VALUES ('payload_indexes', ?)",
+                (json.dumps(self._indexed),),
+            )
+            self._db.commit()
+            self._columns_saved = -1
+            self._save_columns()
+
+    def list_collections(self) -> List[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            entry.name
+            for entry in self.root.iterdir()
+            if (entry / "points.sqlite3").exists()
+        )
+
+    def close(self):
+        with self._lock:
+            if self._db is None:
+                return
+            self._save_index()
+            self._save_columns()
+            if self._vectors is not None:
+                self._vectors.flush()
+            self._db.close()
+            self._db = None
+            self._vectors = None
+            self._index = None
+            self._columns = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(
+            str(self.directory / "points.sqlite3"), check_same_thread=False
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value
+            );
+            CREATE TABLE IF NOT EXISTS points (
+                row INTEGER PRIMARY KEY,
+                point_id TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL
+            );
+            """)
+        return db
+
+    def _refresh(self):
+        """Load the collection on first use, and again once another store
+        has written to it"""
+        if self._db is None:
+            self._open()
+        elif self._stored_version() != self._version:
+            # Everything in memory may be stale; drop it without saving
+            self._db.close()
+            self._db = None
+            self._vectors = None
+            self._index = None
+            self._columns = {}
+            self._open()
+
+    def _stored_version(self) -> int:
+        saved = self._db.execute(
+            "SELECT value FROM meta WHERE key = 'version'"
+        ).fetchone()
+        return int(saved[0]) if saved else 0
+
+    @contextmanager
+    def _write_lock(self):
+        """Hold write.lock (reentrant within this store). SQLite's own
+        lock can't cover the vector file, which is written before the
+        rows that point into it are committed."""
+        if self._lock_file is not None:
+            yield
+            return
+        with open(self.directory / "write.lock", "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._lock_file = lock_file
+            try:
+                yield
+            finally:
+                self._lock_file = None  # Closing the file unlocks it
+
+    def _open(self):
+        """Load the collection on first use"""
+        if self._db is not None:
+            return
+        if not self.exists():
+            raise ValueError(
+                f"Collection {self.collection_name} not found in {self.root}"
+            )
+        db = self._connect()
+        meta = dict(db.execute("SELECT key, value FROM meta"))
+        self._dimension = int(meta["dimension"])
+        self.dtype = np.dtype(meta.get("dtype", self.dtype.name))
+        self._version = int(meta.get("version", 0))
+
+        rows = np.fromiter(
+            (row for (row,) in db.execute("SELECT row FROM points")),
+            dtype=np.int64,
+        )
+        self._size = int(rows.max()) + 1 if len(rows) else 0
+        self._alive = np.zeros(self._size, dtype=bool)
+        self._alive[rows] = True
+        self._db = db
+        self._map(self._size)
+        self._indexed = json.loads(meta.get("payload_indexes", "[]"))
+        self._load_columns(int(meta.get("payload_index_version", -1)))
+
+    def _map(self, rows: int):
+        """Memory-map the vector file, growing it to hold `rows` rows"""
+        path = self.directory / f"vectors.{self.dtype.name}"
+        row_bytes = self._dimension * self.dtype.itemsize
+        capacity = path.stat().st_size // row_bytes if path.exists() else 0
+        if rows > capacity or not capacity:
+            capacity = max(rows, 2 * capacity, 1024)
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._vectors = None
+            with open(path, "ab") as f:
+                f.truncate(capacity * row_bytes)
+        elif self._vectors is not None:
+            return
+        self._vectors = np.memmap(
+            path,
+            dtype=self.dtype,
+            mode="r+",
+            shape=(capacity, self._dimension),
+        )
+
+    # --- Writes ---
+    def upsert(self, ids, vectors, payloads):
+        ids = [str(point_id) for point_id in ids]
+        if not ids:
+            return
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+        with self._lock, self._write_lock():
+            self._refresh()
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                existing = self._rows(ids)
+                (next_row,) = self._db.execute(
+                    "SELECT COALESCE(MAX(row) + 1, 0) FROM points"
+                ).fetchone()
+                self._size = max(self._size, next_row)
+                rows = []
+                for point_id in ids:
+                    row = existing.get(point_id)
+                    if row is None:
+                        row = existing[point_id] = self._size
+                        self._size += 1
+                    rows.append(row)
+
+                # Vectors first: a row only counts once SQLite has it
+                self._map(self._size)
+                self._vectors[rows] = matrix.astype(self.dtype)
+                self._vectors.flush()
+                self._version += 1
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO points (row, point_id, payload)"
+                    " VALUES (?, ?, ?)",
+                    [
+                        (
+                            row,
+                            point_id,
+                            json.dumps(payload, ensure_ascii=False),
+                        )
+                        for row, point_id, payload in zip(rows, ids, payloads)
+                    ],
+                )
+                self._set_version()
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                self._version = -1  # Reload on next use
+                raise
+
+            if self._size > len(self._alive):
+                alive = np.zeros(max(self._size, 2 * len(self._alive)), bool)
+                alive[: len(self._alive)] = self._alive
+                self._alive = alive
+            self._alive[rows] = True
+            for key, column in self._columns.items():
+                column.set(rows, [_lookup(p, key) for p in payloads])
+            if self._index is not None:
+                self._index_add(rows, matrix)
+
+    def delete(self, ids):
+        ids = [str(point_id) for point_id in ids]
+        with self._lock, self._write_lock():
+            self._refresh()
+            rows = list(self._rows(ids).values())
+            if not rows:
+                return
+            self._version += 1
+            self._db.execute("BEGIN IMMEDIATE")
+            self._db.executemany(
+                "DELETE FROM points WHERE row = ?", [(row,) for row in rows]
+            )
+            self._set_version()
+            self._db.commit()
+            self._alive[rows] = False
+            if self._index is not None:
+                for row in rows:
+                    self._index.mark_deleted(row)
+                self._index_version = self._version
+
+    def _rows(self, ids: List[str]) -> Dict[str, int]:
+        found = {}
+        for start in range(0, len(ids), 500):
+            batch = ids[start : start + 500]
+            found.update(
+                self._db.execute(
+                    "SELECT point_id, row FROM points WHERE point_id IN (%s)"
+                    % ",".join("?" * len(batch)),
+                    batch,
+                )
+            )
+        return found
+
+    def _set_version(self):
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+            (self._version,),
+        )
+
+    # --- Reads ---
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return self._live()
+
+    def _live(self) -> int:
+        """Points in the loaded collection (count() without the reload
+        check, so one search sees one version)"""
+        return int(self._alive[: self._size].sum())
+
+    def search(self, vector, limit=10, filter_by=None):
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        with self._lock:
+            self._refresh()
+            mask = self._alive[: self._size].copy()
+            for key, value in (filter_by or {}).items():
+                mask &= self._matches(key, value)
+            candidates = int(mask.sum())
+            if not candidates or limit <= 0:
+                return []
+            limit = min(limit, candidates)
+
+            # Small collections are scored exactly; filtered searches on
+            # larger ones pick a plan by selectivity
+            rows = None
+            if self._live() >= self.hnsw_threshold:
+                plan = self._plan(candidates, limit) if filter_by else "graph"
+                if plan == "post":
+                    rows, scores = self._search_post_filter(
+                        query, limit, mask, candidates / self._live()
+                    )
+                if plan != "pre" and rows is None:
+                    rows, scores = self._search_index(
+                        query, limit, mask if filter_by else None
+                    )
+            if rows is None:
+                rows, scores = self._search_exact(query, limit, mask)
+            return self._results(rows, scores)
+
+    def _matches(self, key: str, value) -> np.ndarray:
+        if key not in self._columns:
+            # Not indexed: read it from the payloads once per process
+            self._build_columns([key])
+        column = self._columns[key]
+        codes = [
+            column.values[v] for v in _values(value) if v in column.values
+        ]
+        return np.isin(column.codes[: self._size], codes)
+
+    def _scores(self, query, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Dot products with `query` for `rows` (None: every row)"""
+        total = self._size if rows is None else len(rows)
+        out = np.empty(total, dtype=np.float32)
+        for start in range(0, total, _BLOCK_ROWS):
+            end = min(start + _BLOCK_ROWS, total)
+            block = (
+                self._vectors[start:end]
+                if rows is None
+                else self._vectors[rows[start:end]]
+            )
+            # BLAS on float32; float16 rows are widened block by block
+            out[start:end] = np.asarray(block, dtype=np.float32) @ query
+        return out
+
+    def _plan(self, candidates: int, limit: int) -> str:
+        """
+        How to run a filtered search, by estimated cost: scoring the
+        matching points exactly (pre) touches `candidates` rows, while an
+        HNSW walk wide enough to meet `ef_search` matches visits about
+        ef_search / selectivity nodes. The walk filters its results
+        afterwards (post); if too few match, it reruns skipping
+        non-matching points as it goes (graph).
+        """
+        if self.filter_plan:
+            return self.filter_plan
+        selectivity = candidates / self._live()
+        visits = max(self.ef_search, limit) / selectivity
+        return "pre" if candidates <= _VISIT_COST * visits else "post"
+
+    def _search_exact(self, query, limit, mask):
+        if mask.mean() > _GATHER_FRACTION:
+            scores = self._scores(query, None)
+            scores[~mask] = -np.inf
+            rows = np.arange(self._size)
+        else:
+            rows = np.flatnonzero(mask)
+            scores = self._scores(query, rows)
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return rows[top], scores[top]
+
+    def _search_index(self, query, limit, mask, ef=None):
+        index = self._load_index()
+        if index is None:
+            return None, None
+        index.set_ef(max(ef or self.ef_search, limit))
+        try:
+            labels, distances = index.knn_query(
+                query,
+                k=limit,
+                num_threads=1,
+                filter=None if mask is None else lambda row: bool(mask[row]),
+            )
+        except RuntimeError:
+            # Too few reachable matches for k; fall back to exact
+            return None, None
+        return labels[0].astype(np.int64), 1 - distances[0]
+
+    def _search_post_filter(self, query, limit, mask, selectivity):
+        """Unfiltered HNSW search for enough neighbours that `limit` of
+        them should match, then the filter; None if too few did"""
+        # Widen the walk too, so it sees about as many matching points
+        # as a filtered walk would
+        k = min(math.ceil(2 * limit / selectivity), self._live())
+        ef = math.ceil(self.ef_search / selectivity)
+        rows, scores = self._search_index(query, k, None, ef)
+        if rows is None:
+            return None, None
+        keep = mask[rows]
+        if keep.sum() < limit:
+            return None, None
+        return rows[keep][:limit], scores[keep][:limit]
+
+    def _results(self, rows, scores):
+        found = {}
+        for start in range(0, len(rows), 500):
+            batch = [int(row) for row in rows[start : start + 500]]
+            for row, point_id, payload in self._db.execute(
+                "SELECT row, point_id, payload FROM points WHERE row IN (%s)"
+                % ",".join("?" * len(batch)),
+                batch,
+            ):
+                found[row] = (point_id, json.loads(payload))
+        return [
+            {
+                "id": found[row][0],
+                "score": float(score),
+                "payload": found[row][1],
+            }
+            for row, score in zip(rows.tolist(), scores.tolist())
+            if row in found
+        ]
+
+    # --- HNSW index ---
+    def _load_index(self):
+        if self._index is not None:
+            return self._index
+        try:
+            import hnswlib
+        except ImportError:
+            return None
+
+        path = self.directory / "hnsw.bin"
+        saved = self._db.execute(
+            "SELECT value FROM meta WHERE key = 'hnsw_version'"
+        ).fetchone()
+        index = hnswlib.Index(space="ip", dim=self._dimension)
+        if path.exists() and saved and int(saved[0]) == self._version:
+            index.load_index(str(path), max_elements=len(self._vectors))
+            self._index_saved = self._version
+        else:
+            print(
+                f"Building HNSW index for {self.collection_name} "
+                f"({self._live()} points)"
+            )
+            index.init_index(
+                max_elements=len(self._vectors), ef_construction=200, M=16
+            )
+            rows = np.flatnonzero(self._alive[: self._size])
+            for start in range(0, len(rows), _BLOCK_ROWS):
+                block = rows[start : start + _BLOCK_ROWS]
+                index.add_items(
+                    np.asarray(self._vectors[block], dtype=np.float32), block
+                )
+        self._index = index
+        self._index_version = self._version
+        self._save_index()
+        return index
+
+    def _index_add(self, rows, matrix):
+        if self._index.get_max_elements() < self._size:
+            self._index.resize_index(len(self._vectors))
+        self._index.add_items(matrix, np.asarray(rows))
+        self._index_version = self._version
+
+    def _save_index(self):
+        if self._index is None or self._index_saved == self._version:
+            return
+        if self._index_version != self._version:
+            return
+        with self._write_lock():
+            if self._stored_version() != self._version:
+                return  # Another store has written since; ours is stale
+            self._index.save_index(str(self.directory / "hnsw.bin"))
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value)"
+                " VALUES ('hnsw_version', ?)",
+                (self._version,),
+            )
+            self._db.commit()
+        self._index_saved = self._version
+
+    # --- Payload index ---
+    def _build_columns(self, keys: List[str]):
+        """Read payload fields into columns, one pass over the payloads"""
+        columns = [_Column(self._size) for _ in keys]
+        # json_extract turns JSON true/false into 1/0; Python agrees
+        result = self._db.execute(
+            "SELECT row, %s FROM points"
+            % ", ".join(["json_extract(payload, ?)"] * len(keys)),
+            ["$." + key for key in keys],
+        ).fetchall()
+        if result:
+            rows, *values = zip(*result)
+            for column, column_values in zip(columns, values):
+                column.set(rows, column_values)
+        self._columns.update(zip(keys, columns))
+
+    def _load_columns(self, saved_version: int):
+        if not self._indexed:
+            return
+        path = self.directory / "payload_index.npz"
+        if path.exists() and saved_version == self._version:
+            with np.load(path) as saved:
+                values = json.loads(str(saved["values"]))
+                for key in self._indexed:
+                    column = self._columns[key] = _Column(0)
+                    column.codes = saved[key]
+                    column.values = {v: n for n, v in enumerate(values[key])}
+            self._columns_saved = self._version
+            return
+        print(f"Building payload index for {self.collection_name}")
+        self._build_columns(self._indexed)
+        self._save_columns()
+
+    def _save_columns(self):
+        if not self._indexed or self._columns_saved == self._version:
+            return
+        columns = {key: self._columns[key] for key in self._indexed}
+        path = self.directory / "payload_index.npz"
+        partial = self.directory / "payload_index.partial.npz"
+        with self._write_lock():
+            if self._stored_version() != self._version:
+                return  # Another store has written since; ours is stale
+            np.savez(
+                partial,
+                values=json.dumps(
+                    {key: list(c.values) for key, c in columns.items()},
+                    ensure_ascii=False,
+                ),
+                **{key: c.codes[: self._size] for key, c in columns.items()},
+            )
+            os.replace(partial, path)
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value)"
+                " VALUES ('payload_index_version', ?)",
+                (self._version,),
+            )
+            self._db.commit()
+        self._columns_saved = self._version
+
+    def flush(self):
+        """Write the HNSW and payload indexes to disk (vectors and
+        payloads always are)"""
+        with self._lock:
+            if self._db is not None:
+                self._save_index()
+                self._save_columns()